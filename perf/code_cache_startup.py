@@ -0,0 +1,91 @@
+# Compare process startup with and without the persistent code cache.
+# Each run launches a new interpreter, imports a module of prefab classes
+# and accesses __init__, __repr__ and __eq__ so the methods are generated.
+#
+# cold: cache enabled but the cache file is removed before every run
+# warm: cache enabled with the cache file from a previous run
+
+import os
+import sys
+import time
+import platform
+import subprocess
+import tempfile
+
+import prefab_classes
+
+prefab_template = '''
+@prefab
+class C{n}:
+    a: int
+    b: int
+    c: int
+    d: int
+    e: int
+
+C{n}.__init__, C{n}.__repr__, C{n}.__eq__
+'''
+
+runner_template = """
+import sys
+sys.dont_write_bytecode = False
+sys.path.insert(0, {folder!r})
+import prefab_classes
+{enable}
+import cache_perftemp
+"""
+
+
+def write_module(folder, count):
+    with open(os.path.join(folder, "cache_perftemp.py"), "w") as f:
+        f.write("from prefab_classes import prefab\n")
+        for n in range(count):
+            f.write(prefab_template.format(n=n))
+
+
+def clear_cache(folder):
+    pycache = os.path.join(folder, "__pycache__")
+    if os.path.exists(pycache):
+        for filename in os.listdir(pycache):
+            if filename.endswith(".prefab"):
+                os.remove(os.path.join(pycache, filename))
+
+
+def run_test(name, folder, reps, enable, clear):
+    runner = runner_template.format(folder=folder, enable=enable)
+    # Warm up the regular bytecode cache and, if used, the code cache
+    subprocess.run([sys.executable, "-c", runner], check=True)
+
+    total = 0.0
+    for _ in range(reps):
+        if clear:
+            clear_cache(folder)
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", runner], check=True)
+        total += time.perf_counter() - start
+    print(f"| {name} | {total / reps * 1000:.1f} |")
+
+
+def main(reps, count=2000):
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+
+    print(f"Mean startup time over {reps} runs for {count} classes with 5 attributes")
+    print("| Method | Mean Time (ms) |")
+    print("| --- | --- |")
+
+    with tempfile.TemporaryDirectory() as folder:
+        write_module(folder, count)
+        enable = "prefab_classes.enable_code_cache()"
+        run_test("no code cache", folder, reps, enable="", clear=False)
+        run_test("code cache (cold)", folder, reps, enable=enable, clear=True)
+        run_test("code cache (warm)", folder, reps, enable=enable, clear=False)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2:
+        reps = int(sys.argv[1])
+    else:
+        reps = 20
+    main(reps)
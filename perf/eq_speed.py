@@ -0,0 +1,69 @@
+# This test compares __eq__ speed for equal instances and for instances
+# that differ in a cheap field, with and without compare_priority
+
+import sys
+import platform
+from timeit import timeit
+
+import dataclasses
+import attrs
+import prefab_classes
+from prefab_classes import prefab, attribute
+
+
+PAYLOAD = list(range(100))
+
+
+@prefab
+class PrefabRecord:
+    payload: list
+    tags: tuple
+    id: int
+
+
+@prefab
+class PrefabPriority:
+    payload: list
+    tags: tuple
+    id: int = attribute(compare_priority=1)
+
+
+@dataclasses.dataclass
+class DataclassRecord:
+    payload: list
+    tags: tuple
+    id: int
+
+
+@attrs.define
+class AttrsRecord:
+    payload: list
+    tags: tuple
+    id: int
+
+
+def main():
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+
+    classes = [PrefabRecord, PrefabPriority, DataclassRecord, AttrsRecord]
+
+    LOOPS = 1_000_000
+
+    print("| Class                | Equal /s | Different id /s |")
+    print("|----------------------|----------|-----------------|")
+
+    for cls in classes:
+        # Separate but equal lists so the identity check does not apply
+        a = cls(PAYLOAD.copy(), ("a", "b"), 1)
+        b = cls(PAYLOAD.copy(), ("a", "b"), 1)
+        c = cls(PAYLOAD.copy(), ("a", "b"), 2)
+        a == b  # Generate methods before timing
+        equal = timeit(lambda: a == b, number=LOOPS)
+        different = timeit(lambda: a == c, number=LOOPS)
+        print(f"| {cls.__name__:<20} | {equal:>8.2f} | {different:>15.2f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# This test compares the construction speed of frozen and mutable classes
+
+import sys
+import platform
+from timeit import timeit
+
+import dataclasses
+import attrs
+import prefab_classes
+from prefab_classes import prefab
+
+
+@prefab
+class PrefabMutable:
+    a: int
+    b: int
+    c: int
+    d: int
+    e: int
+
+
+@prefab(frozen=True)
+class PrefabFrozen:
+    a: int
+    b: int
+    c: int
+    d: int
+    e: int
+
+
+@prefab(frozen=True, slots=True)
+class PrefabFrozenSlots:
+    a: int
+    b: int
+    c: int
+    d: int
+    e: int
+
+
+@dataclasses.dataclass(frozen=True)
+class DataclassFrozen:
+    a: int
+    b: int
+    c: int
+    d: int
+    e: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DataclassFrozenSlots:
+    a: int
+    b: int
+    c: int
+    d: int
+    e: int
+
+
+@attrs.frozen
+class AttrsFrozen:
+    a: int
+    b: int
+    c: int
+    d: int
+    e: int
+
+
+def main():
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+
+    classes = [
+        PrefabMutable,
+        PrefabFrozen,
+        PrefabFrozenSlots,
+        DataclassFrozen,
+        DataclassFrozenSlots,
+        AttrsFrozen,
+    ]
+
+    LOOPS = 1_000_000
+
+    print("| Class                | Time /s |")
+    print("|----------------------|---------|")
+
+    for cls in classes:
+        cls(1, 2, 3, 4, 5)  # Generate methods before timing
+        result = timeit(lambda: cls(1, 2, 3, 4, 5), number=LOOPS)
+        print(f"| {cls.__name__:<20} | {result:>7.2f} |")
+
+
+if __name__ == "__main__":
+    main()
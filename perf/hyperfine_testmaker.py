@@ -218,9 +218,28 @@ class TestData:
                 f.write(self.class_template.format(n=n))
 
 
+@prefab
+class CompiledTestData(TestData):
+    """
+    Prefab test data compiled ahead of time with prefab_classes.compile
+    """
+    def write_classdef_file(self, count=100):
+        from prefab_classes.compile import compile_module
+
+        super().write_classdef_file(count=count)
+        sys.path.insert(0, str(classdef_dir))
+        try:
+            compiled = compile_module(f"{self.import_name}_data")
+        finally:
+            sys.path.remove(str(classdef_dir))
+            sys.modules.pop(f"{self.import_name}_data", None)
+        self.def_file.write_text(compiled)
+
+
 datasets = [
     TestData('native_classes', '', standard_template),
     TestData('prefab_classes', prefab_header, prefab_template),
+    CompiledTestData('prefab_compiled', prefab_header, prefab_eval_template),
     TestData('prefab_slots', prefab_header, prefab_slots_template),
     TestData('prefab_eval', prefab_header, prefab_eval_template),
     TestData('namedtuples', namedtuple_header, namedtuple_template),
@@ -0,0 +1,259 @@
+"""
+Check import and class decoration time against a saved baseline.
+
+The class definition modules from hyperfine_testmaker are regenerated in a
+temporary folder and timed in a plain loop so hyperfine is not required.
+
+* startup: time for a new interpreter to run a command or import a module
+* decoration: time to import a module of 100 prefab classes in process,
+  this is mostly the time spent in the decorator
+
+Results are written as JSON with interpreter and commit details.
+When a baseline is given the script exits with status 1 if the median of
+any measurement is slower than the baseline by more than the threshold.
+
+Usage:
+    python import_regression.py --save-baseline baseline.json
+    python import_regression.py --baseline baseline.json --threshold 0.1
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import prefab_classes
+from prefab_classes.compile import compile_module
+
+import hyperfine_testmaker as testmaker
+
+
+# name: (import header, class template, compile ahead of time)
+CLASS_DEFINITIONS = {
+    "native_classes": ("", testmaker.standard_template, False),
+    "prefab_classes": (
+        testmaker.prefab_header,
+        testmaker.prefab_template,
+        False,
+    ),
+    "prefab_slots": (testmaker.prefab_header, testmaker.prefab_slots_template, False),
+    "prefab_eval": (testmaker.prefab_header, testmaker.prefab_eval_template, False),
+    "prefab_compiled": (
+        testmaker.prefab_header,
+        testmaker.prefab_eval_template,
+        True,
+    ),
+}
+
+STARTUP_COMMANDS = {
+    "python_pass": "pass",
+    "import_prefab": "from prefab_classes import prefab",
+    "import_prefab_funcs": "from prefab_classes.funcs import as_dict",
+}
+
+
+def summarise(times):
+    """Get the median and interquartile range of a list of times."""
+    q1, median, q3 = statistics.quantiles(times, n=4)
+    return {"median": median, "iqr": q3 - q1, "runs": len(times)}
+
+
+def write_class_definitions(folder):
+    sys.path.insert(0, folder)
+    try:
+        for name, (header, template, compiled) in CLASS_DEFINITIONS.items():
+            module_name = f"{name}_data"
+            path = os.path.join(folder, f"{module_name}.py")
+            testmaker.write_perf_file(path, 100, template, header)
+            if compiled:
+                source = compile_module(module_name)
+                sys.modules.pop(module_name, None)
+                with open(path, "w") as f:
+                    f.write(source)
+    finally:
+        sys.path.remove(folder)
+
+
+def time_startup(args, reps, folder):
+    # The first run is discarded so the bytecode cache is written
+    subprocess.run(args, check=True, cwd=folder)
+    times = []
+    for _ in range(reps):
+        start = time.perf_counter()
+        subprocess.run(args, check=True, cwd=folder)
+        times.append(time.perf_counter() - start)
+    return summarise(times)
+
+
+def time_decoration(module_name, reps, folder):
+    sys.path.insert(0, folder)
+    try:
+        __import__(module_name)
+        del sys.modules[module_name]
+        times = []
+        for _ in range(reps):
+            start = time.perf_counter()
+            __import__(module_name)
+            times.append(time.perf_counter() - start)
+            del sys.modules[module_name]
+    finally:
+        sys.path.remove(folder)
+    return summarise(times)
+
+
+def get_commit():
+    folder = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=folder,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=folder,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": bool(status.strip())}
+
+
+def get_metadata():
+    return {
+        "python_version": sys.version,
+        "implementation": sys.implementation.name,
+        "executable": sys.executable,
+        "platform": platform.platform(),
+        "prefab_classes_version": prefab_classes.__version__,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        **get_commit(),
+    }
+
+
+def run_benchmarks(reps):
+    results = {"startup": {}, "decoration": {}}
+    with tempfile.TemporaryDirectory() as folder:
+        write_class_definitions(folder)
+
+        for name, command in STARTUP_COMMANDS.items():
+            results["startup"][name] = time_startup(
+                [sys.executable, "-c", command], reps, folder
+            )
+        for name in CLASS_DEFINITIONS:
+            results["startup"][f"import_{name}"] = time_startup(
+                [sys.executable, "-c", f"import {name}_data"], reps, folder
+            )
+            results["decoration"][name] = time_decoration(
+                f"{name}_data", reps, folder
+            )
+
+    return {"metadata": get_metadata(), "results": results}
+
+
+def compare(current, baseline, threshold):
+    """
+    Compare current results with a baseline.
+
+    :return: list of (group, name, baseline median, current median, ratio)
+             for measurements that regressed by more than threshold
+    """
+    regressions = []
+    for group, measurements in current["results"].items():
+        baseline_group = baseline["results"].get(group, {})
+        for name, result in measurements.items():
+            old = baseline_group.get(name)
+            if old is None:
+                continue
+            ratio = result["median"] / old["median"]
+            marker = "REGRESSION" if ratio > 1 + threshold else ""
+            print(
+                f"| {group:<10} | {name:<28} | {old['median'] * 1000:>9.2f} "
+                f"| {result['median'] * 1000:>9.2f} | {ratio:>6.2f} | {marker} |"
+            )
+            if marker:
+                regressions.append(
+                    (group, name, old["median"], result["median"], ratio)
+                )
+    return regressions
+
+
+def print_results(data):
+    print("| Group      | Measurement                  | Median /ms | IQR /ms |")
+    print("|------------|------------------------------|------------|---------|")
+    for group, measurements in data["results"].items():
+        for name, result in measurements.items():
+            print(
+                f"| {group:<10} | {name:<28} | {result['median'] * 1000:>10.2f} "
+                f"| {result['iqr'] * 1000:>7.2f} |"
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reps", type=int, default=30, help="runs per measurement")
+    parser.add_argument("--output", help="write the results JSON to this file")
+    parser.add_argument("--save-baseline", help="write the results as a baseline")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed fractional slowdown of the median (default 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.reps < 2:
+        parser.error("--reps must be at least 2")
+
+    data = run_benchmarks(args.reps)
+    meta = data["metadata"]
+    print(f"Python Version: {meta['python_version']}")
+    print(f"Prefab Classes version: {meta['prefab_classes_version']}")
+    print(f"Platform: {meta['platform']}")
+    print(f"Commit: {meta['commit']}{' (modified)' if meta['dirty'] else ''}")
+    print()
+    print_results(data)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        print()
+        base_meta = baseline["metadata"]
+        print(f"Baseline commit: {base_meta['commit']}")
+        if base_meta["python_version"] != meta["python_version"]:
+            print(
+                f"Warning: baseline used Python {base_meta['python_version']}, "
+                f"results may not be comparable."
+            )
+        print()
+        print("| Group      | Measurement                  | Baseline  | Current   | Ratio  | |")
+        print("|------------|------------------------------|-----------|-----------|--------|-|")
+        regressions = compare(data, baseline, args.threshold)
+        if regressions:
+            print()
+            print(
+                f"{len(regressions)} measurement(s) regressed by more than "
+                f"{args.threshold:.0%}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+# This test compares the cost of debug logging calls for prefabs when the
+# debug level is disabled, and of structured fields when records are emitted
+
+import sys
+import logging
+import platform
+from timeit import timeit
+
+import prefab_classes
+from prefab_classes import prefab
+from prefab_classes.funcs import lazy_repr, make_log_filter
+
+
+@prefab
+class PrefabEvent:
+    id: int
+    source: str
+    tags: list
+
+
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+
+
+def main():
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+
+    logger = logging.getLogger("perf.logging_overhead")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    handler = NullHandler()
+    handler.addFilter(make_log_filter())
+    logger.addHandler(handler)
+
+    event = PrefabEvent(1, "source", ["a", "b", "c"])
+
+    LOOPS = 500_000
+
+    tests = {
+        "f-string (disabled)": lambda: logger.debug(f"Event {event!r}"),
+        "lazy_repr (disabled)": lambda: logger.debug("Event %s", lazy_repr(event)),
+        "f-string (emitted)": lambda: logger.info(f"Event {event!r}"),
+        "log filter (emitted)": lambda: logger.info("Event %s", event),
+    }
+
+    print("| Method               | Time /s |")
+    print("|----------------------|---------|")
+
+    for name, func in tests.items():
+        func()  # Generate methods before timing
+        result = timeit(func, number=LOOPS)
+        print(f"| {name:<20} | {result:>7.2f} |")
+
+
+if __name__ == "__main__":
+    main()
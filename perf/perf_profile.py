@@ -183,6 +183,49 @@ def run_test(name, n):
     print(f"| {name} | {end - start:.2f} |")
 
 
+def run_breakdown(name, n):
+    """
+    Import the test module n times with prefab_classes.stats enabled and
+    print the total time spent in each phase of class creation.
+    """
+    phases = {}
+    modules = {}
+    exec_count = 0
+    exec_time = 0.0
+    source_size = 0
+
+    for _ in range(n):
+        prefab_classes.enable_stats()
+        try:
+            import perftemp
+            del sys.modules["perftemp"]
+            results = prefab_classes.stats()
+        finally:
+            prefab_classes.disable_stats()
+
+        for entry in results.values():
+            for phase, phase_time in entry["phases"].items():
+                phases[phase] = phases.get(phase, 0.0) + phase_time
+            module_time = entry["decorate_time"] + entry["exec_time"]
+            modules[entry["module"]] = modules.get(entry["module"], 0.0) + module_time
+            exec_count += entry["exec_count"]
+            exec_time += entry["exec_time"]
+            source_size += entry["source_size"]
+
+    print(f"### {name} ###")
+    print("| Phase | Total Time (seconds) |")
+    print("| --- | --- |")
+    for phase, phase_time in phases.items():
+        print(f"| {phase} | {phase_time:.3f} |")
+    print(f"| exec ({exec_count} calls, {source_size} bytes) | {exec_time:.3f} |")
+    print()
+    print("| Module | Total Time (seconds) |")
+    print("| --- | --- |")
+    for module, module_time in sorted(modules.items(), key=lambda item: -item[1]):
+        print(f"| {module} | {module_time:.3f} |")
+    print()
+
+
 def write_perftemp(count, template, setup):
     with open('../perf/perftemp.py', 'w') as f:
         f.write(setup)
@@ -255,9 +298,41 @@ def main(reps, test_everything=False):
     run_test(f'prefab_eval {prefab_classes.__version__}', reps)
 
 
+def breakdown(reps):
+    """
+    Show where the time goes when defining prefab classes.
+
+    :param reps: Number of repeat imports
+    """
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+    print(f"Time for {reps} imports of 100 classes defined with 5 basic attributes")
+    print()
+
+    prefab_import = "from prefab_classes import prefab, attribute\n"
+
+    for name, template in [
+        ("prefab", prefab_template),
+        ("prefab_attributes", prefab_attribute_template),
+        ("prefab_eval", prefab_eval_template),
+    ]:
+        write_perftemp(100, template, prefab_import)
+        run_breakdown(name, reps)
+
+
 if __name__ == '__main__':
-    if len(sys.argv) == 2:
-        reps = int(sys.argv[1])
+    args = sys.argv[1:]
+    show_breakdown = "--breakdown" in args
+    if show_breakdown:
+        args.remove("--breakdown")
+
+    if len(args) == 1:
+        reps = int(args[0])
     else:
         reps = 100
-    main(reps, test_everything=True)
+
+    if show_breakdown:
+        breakdown(reps)
+    else:
+        main(reps, test_everything=True)
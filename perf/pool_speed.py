@@ -0,0 +1,87 @@
+# This test compares allocation rate and garbage collector pauses for
+# short lived instances created normally and taken from an instance pool
+
+import sys
+import gc
+import platform
+import time
+
+import prefab_classes
+from prefab_classes import prefab
+from prefab_classes.funcs import pool_stats
+
+
+@prefab
+class PrefabEvent:
+    id: int
+    source: str
+    payload: dict
+
+
+@prefab(pool=1024)
+class PrefabPooledEvent:
+    id: int
+    source: str
+    payload: dict
+
+
+class GCTimer:
+    def __init__(self):
+        self.pauses = []
+        self._start = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.pauses.append(time.perf_counter() - self._start)
+
+
+def run(cls, loops, batch):
+    timer = GCTimer()
+    gc.collect()
+    gc.callbacks.append(timer)
+    try:
+        start = time.perf_counter()
+        for i in range(loops):
+            # Hold a batch of events alive like a message handler would
+            events = [cls(j, "source", {"id": j}) for j in range(batch)]
+            if cls is PrefabPooledEvent:
+                for event in events:
+                    cls.__prefab_release__(event)
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.callbacks.remove(timer)
+    return elapsed, timer.pauses
+
+
+def main():
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+
+    LOOPS = 2_000
+    BATCH = 500
+
+    print(
+        "| Class                | Instances/s | GC pauses | Total GC pause /ms |"
+    )
+    print(
+        "|----------------------|-------------|-----------|--------------------|"
+    )
+
+    for cls in (PrefabEvent, PrefabPooledEvent):
+        cls(0, "", {})  # Generate methods before timing
+        elapsed, pauses = run(cls, LOOPS, BATCH)
+        rate = LOOPS * BATCH / elapsed
+        print(
+            f"| {cls.__name__:<20} | {rate:>11,.0f} "
+            f"| {len(pauses):>9} | {sum(pauses) * 1000:>18.2f} |"
+        )
+
+    print()
+    print(f"Pool statistics: {pool_stats(PrefabPooledEvent)}")
+
+
+if __name__ == "__main__":
+    main()
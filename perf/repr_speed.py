@@ -0,0 +1,64 @@
+# This test compares __repr__ speed and output length for the repr options
+
+import sys
+import platform
+from timeit import timeit
+
+import dataclasses
+import prefab_classes
+from prefab_classes import prefab
+
+
+@prefab
+class PrefabRepr:
+    id: int
+    name: str
+    values: list
+
+
+@prefab(repr="fast")
+class PrefabFastRepr:
+    id: int
+    name: str
+    values: list
+
+
+@prefab(repr="bounded")
+class PrefabBoundedRepr:
+    id: int
+    name: str
+    values: list
+
+
+@dataclasses.dataclass
+class DataclassRepr:
+    id: int
+    name: str
+    values: list
+
+
+def main():
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+
+    classes = [PrefabRepr, PrefabFastRepr, PrefabBoundedRepr, DataclassRepr]
+
+    LOOPS = 200_000
+
+    print("| Class                | Small /s | Large /s | Large length |")
+    print("|----------------------|----------|----------|--------------|")
+
+    for cls in classes:
+        small = cls(1, "name", [1, 2, 3])
+        large = cls(1, "name" * 100, list(range(10_000)))
+        small_time = timeit(lambda: repr(small), number=LOOPS)
+        large_time = timeit(lambda: repr(large), number=LOOPS // 100)
+        print(
+            f"| {cls.__name__:<20} | {small_time:>8.2f} "
+            f"| {large_time:>8.2f} | {len(repr(large)):>12} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+# This test compares the steady state speed of the methods generated by
+# prefab_classes with dataclasses, attrs, namedtuple, cluegen and dataklasses
+#
+# Each benchmark is repeated and the median and interquartile range of the
+# time per call are reported so a single noisy repeat does not skew results.
+# Features a library does not provide are reported as n/a.
+#
+# Usage: python runtime_speed.py [--repeat 15] [--number 100000] [--output results.json]
+
+import argparse
+import collections
+import json
+import platform
+import statistics
+import sys
+import timeit
+
+import dataclasses
+import attrs
+
+import prefab_classes
+from prefab_classes import prefab, attribute
+from prefab_classes.funcs import as_dict
+
+from cluegen import Datum
+from dataklasses import dataklass
+
+
+def make_prefab():
+    @prefab(iter=True)
+    class Basic:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+    @prefab
+    class Defaults:
+        a: int
+        b: int
+        c: int
+        d: int = 4
+        e: int = 5
+
+    @prefab
+    class Factory:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: list = attribute(default_factory=list)
+
+    @prefab
+    class PostInit:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+        def __prefab_post_init__(self, e):
+            self.e = e * 2
+
+    @prefab(frozen=True)
+    class Frozen:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+    return {
+        "basic": Basic,
+        "defaults": Defaults,
+        "factory": Factory,
+        "post_init": PostInit,
+        "frozen": Frozen,
+        "as_dict": as_dict,
+    }
+
+
+def make_dataclasses():
+    @dataclasses.dataclass
+    class Basic:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+    @dataclasses.dataclass
+    class Defaults:
+        a: int
+        b: int
+        c: int
+        d: int = 4
+        e: int = 5
+
+    @dataclasses.dataclass
+    class Factory:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: list = dataclasses.field(default_factory=list)
+
+    @dataclasses.dataclass
+    class PostInit:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+        def __post_init__(self):
+            self.e = self.e * 2
+
+    @dataclasses.dataclass(frozen=True)
+    class Frozen:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+    return {
+        "basic": Basic,
+        "defaults": Defaults,
+        "factory": Factory,
+        "post_init": PostInit,
+        "frozen": Frozen,
+        "as_dict": dataclasses.asdict,
+        "iter": False,
+    }
+
+
+def make_attrs():
+    @attrs.define
+    class Basic:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+    @attrs.define
+    class Defaults:
+        a: int
+        b: int
+        c: int
+        d: int = 4
+        e: int = 5
+
+    @attrs.define
+    class Factory:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: list = attrs.Factory(list)
+
+    @attrs.define
+    class PostInit:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+        def __attrs_post_init__(self):
+            self.e = self.e * 2
+
+    @attrs.frozen
+    class Frozen:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+    return {
+        "basic": Basic,
+        "defaults": Defaults,
+        "factory": Factory,
+        "post_init": PostInit,
+        "frozen": Frozen,
+        "as_dict": attrs.asdict,
+        "iter": False,
+    }
+
+
+def make_namedtuple():
+    Basic = collections.namedtuple("Basic", "a b c d e")
+    Defaults = collections.namedtuple("Defaults", "a b c d e", defaults=(4, 5))
+
+    return {
+        "basic": Basic,
+        "defaults": Defaults,
+        # namedtuples are always immutable
+        "frozen": Basic,
+        "as_dict": Basic._asdict,
+    }
+
+
+def make_cluegen():
+    class Basic(Datum):
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+    class Defaults(Datum):
+        a: int
+        b: int
+        c: int
+        d: int = 4
+        e: int = 5
+
+    return {"basic": Basic, "defaults": Defaults}
+
+
+def make_dataklasses():
+    @dataklass
+    class Basic:
+        a: int
+        b: int
+        c: int
+        d: int
+        e: int
+
+    return {"basic": Basic, "iter": False}
+
+
+LIBRARIES = {
+    f"prefab {prefab_classes.__version__}": make_prefab,
+    "dataclasses": make_dataclasses,
+    f"attrs {attrs.__version__}": make_attrs,
+    "namedtuple": make_namedtuple,
+    "cluegen": make_cluegen,
+    "dataklasses": make_dataklasses,
+}
+
+
+def get_benchmarks(classes):
+    """
+    Get the statements to time for one library.
+
+    :param classes: dict returned by one of the make_ functions
+    :return: {benchmark name: zero argument callable or None if unsupported}
+    """
+    basic = classes["basic"]
+    inst = basic(1, 2, 3, 4, 5)
+    other = basic(1, 2, 3, 4, 5)
+
+    def get(name, func):
+        return func(classes[name]) if name in classes else None
+
+    benchmarks = {
+        "init positional": lambda: basic(1, 2, 3, 4, 5),
+        "init keyword": lambda: basic(a=1, b=2, c=3, d=4, e=5),
+        "init defaults": get("defaults", lambda cls: lambda: cls(1, 2, 3)),
+        "init factory": get("factory", lambda cls: lambda: cls(1, 2, 3, 4)),
+        "init post_init": get("post_init", lambda cls: lambda: cls(1, 2, 3, 4, 5)),
+        "init frozen": get("frozen", lambda cls: lambda: cls(1, 2, 3, 4, 5)),
+        "repr": lambda: repr(inst),
+        "eq": lambda: inst == other,
+        "iter": None if classes.get("iter") is False else lambda: tuple(inst),
+        "as_dict": get("as_dict", lambda func: lambda: func(inst)),
+    }
+    return benchmarks
+
+
+def run_benchmarks(benchmarks, repeat, number):
+    """
+    Time every benchmark and get the median and interquartile range of the
+    time per call in ns.
+
+    Repeats are interleaved across all benchmarks so that slow drifts in
+    machine speed affect every library equally.
+
+    :param benchmarks: {library: {benchmark name: callable or None}}
+    :return: {library: {benchmark name: {"median": ..., "iqr": ...} or None}}
+    """
+    timers = {}
+    for library, library_benchmarks in benchmarks.items():
+        for name, func in library_benchmarks.items():
+            if func is not None:
+                func()  # Generate methods before timing
+                timers[library, name] = timeit.Timer(func)
+
+    # Discard one round so the first benchmarks are not slowed by warm up
+    for timer in timers.values():
+        timer.timeit(number=number)
+
+    times = {key: [] for key in timers}
+    for _ in range(repeat):
+        for key, timer in timers.items():
+            times[key].append(timer.timeit(number=number) / number * 1e9)
+
+    results = {}
+    for library, library_benchmarks in benchmarks.items():
+        results[library] = {}
+        for name in library_benchmarks:
+            key_times = times.get((library, name))
+            if key_times is None:
+                results[library][name] = None
+            else:
+                q1, median, q3 = statistics.quantiles(key_times, n=4)
+                results[library][name] = {"median": median, "iqr": q3 - q1}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=15, help="repeats per benchmark")
+    parser.add_argument("--number", type=int, default=100_000, help="calls per repeat")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 2:
+        parser.error("--repeat must be at least 2")
+
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+    print(
+        f"Median (IQR) time per call in ns, "
+        f"{args.repeat} repeats of {args.number} calls"
+    )
+    print()
+
+    benchmarks = {
+        library: get_benchmarks(make_classes())
+        for library, make_classes in LIBRARIES.items()
+    }
+    results = run_benchmarks(benchmarks, args.repeat, args.number)
+
+    names = list(next(iter(results.values())))
+    libraries = list(results)
+
+    print("| Benchmark | " + " | ".join(libraries) + " |")
+    print("| --- | " + " | ".join("---" for _ in libraries) + " |")
+    for name in names:
+        cells = []
+        for library in libraries:
+            result = results[library][name]
+            if result is None:
+                cells.append("n/a")
+            else:
+                cells.append(f"{result['median']:.0f} ({result['iqr']:.0f})")
+        print(f"| {name} | " + " | ".join(cells) + " |")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "python_version": sys.version,
+                    "platform": platform.platform(),
+                    "repeat": args.repeat,
+                    "number": args.number,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# This test looks at how quickly we can construct classes from decoded JSON
+
+import sys
+import platform
+from timeit import timeit
+
+import json
+import attrs
+import cattrs
+import prefab_classes
+from prefab_classes import prefab
+from prefab_classes.funcs import as_dict, from_dict
+
+
+# Attrs Versions
+@attrs.define
+class AttrMember:
+    id: int
+    active: bool
+
+
+@attrs.define
+class AttrObject:
+    id: int
+    name: str
+    members: list[AttrMember]
+
+
+@attrs.define
+class AttrCollection:
+    group: list[AttrObject]
+
+
+# Prefab Classes
+@prefab
+class PrefabMember:
+    id: int
+    active: bool
+
+
+@prefab
+class PrefabObject:
+    id: int
+    name: str
+    members: list[PrefabMember]
+
+
+@prefab
+class PrefabCollection:
+    group: list[PrefabObject]
+
+
+def prefab_manual(data):
+    # cls(**d) with the recursion written by hand
+    return PrefabCollection(
+        group=[
+            PrefabObject(
+                **{
+                    **obj,
+                    "members": [PrefabMember(**m) for m in obj["members"]],
+                }
+            )
+            for obj in data["group"]
+        ]
+    )
+
+
+def main():
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+
+    prefab_collection = PrefabCollection(
+        [
+            PrefabObject(i, str(i) * 3, [PrefabMember(j, True) for j in range(0, 10)])
+            for i in range(100000, 102000)
+        ]
+    )
+    data = json.loads(json.dumps(as_dict(prefab_collection, recurse=True)))
+
+    # Run everything once to build any caches and check the results
+    assert from_dict(PrefabCollection, data) == prefab_collection
+    assert prefab_manual(data) == prefab_collection
+    attrs_collection = cattrs.structure(data, AttrCollection)
+    assert attrs.asdict(attrs_collection) == data
+
+    print("| Method             | Time /s |")
+    print("|--------------------|---------|")
+
+    LOOPS = 50
+
+    from_dict_time = timeit(lambda: from_dict(PrefabCollection, data), number=LOOPS)
+    print(f"| prefab_from_dict   |    {from_dict_time:.2f} |")
+
+    manual_time = timeit(lambda: prefab_manual(data), number=LOOPS)
+    print(f"| prefab_cls(**d)    |    {manual_time:.2f} |")
+
+    cattrs_time = timeit(
+        lambda: cattrs.structure(data, AttrCollection),
+        number=LOOPS,
+    )
+    print(f"| cattrs             |    {cattrs_time:.2f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# This test compares the peak memory use of to_json and to_json_stream
+# Each method is run in a fresh subprocess so the peak RSS values are separate
+
+import sys
+import os
+import platform
+import resource
+import subprocess
+import tempfile
+
+import prefab_classes
+from prefab_classes import prefab
+from prefab_classes.funcs import to_json, to_json_stream
+
+
+@prefab
+class PrefabMember:
+    id: int
+    active: bool
+
+
+@prefab
+class PrefabObject:
+    id: int
+    name: str
+    members: list[PrefabMember]
+
+
+def make_data():
+    return [
+        PrefabObject(i, str(i) * 3, [PrefabMember(j, True) for j in range(0, 10)])
+        for i in range(100000, 300000)
+    ]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def run(method, path):
+    data = make_data()
+    baseline = peak_rss_mb()
+
+    if method == "to_json":
+        with open(path, "w") as f:
+            f.write(to_json(data))
+    elif method == "to_json_stream":
+        with open(path, "w") as f:
+            to_json_stream(data, f)
+    elif method == "to_json_stream_bytes":
+        with open(path, "wb") as f:
+            to_json_stream(data, f, encoding="utf-8")
+    elif method != "baseline":
+        raise ValueError(f"Unknown method {method!r}")
+
+    print(f"{peak_rss_mb() - baseline:.1f}")
+
+
+def main():
+    print(f"Python Version: {sys.version}")
+    print(f"Prefab Classes version: {prefab_classes.__version__}")
+    print(f"Platform: {platform.platform()}")
+
+    print("| Method               | Peak RSS increase /MB |")
+    print("|----------------------|-----------------------|")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "output.json")
+        for method in ("to_json", "to_json_stream", "to_json_stream_bytes"):
+            result = subprocess.run(
+                [sys.executable, __file__, method, path],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            print(f"| {method:<20} | {result.stdout.strip():>21} |")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run(sys.argv[1], sys.argv[2])
+    else:
+        main()
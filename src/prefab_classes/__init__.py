@@ -42,20 +42,37 @@ __all__ = [
     "attribute",
     "build_prefab",
     "SlotAttributes",
+    "materialize",
+    "materialize_all",
     "KW_ONLY",
     "PrefabError",
     "is_prefab",
     "is_prefab_instance",
+    "enable_code_cache",
+    "disable_code_cache",
+    "enable_stats",
+    "disable_stats",
+    "stats",
 ]
 
 __version__ = "v0.13.1"
 
 _imports = [
     MultiFromImport(
-        "._class_generator", ["prefab", "attribute", "build_prefab", "SlotAttributes"]
+        "._class_generator",
+        [
+            "prefab",
+            "attribute",
+            "build_prefab",
+            "SlotAttributes",
+            "materialize",
+            "materialize_all",
+        ],
     ),
     MultiFromImport("._shared", ["KW_ONLY", "PrefabError"]),
     MultiFromImport(".funcs", ["is_prefab", "is_prefab_instance"]),
+    MultiFromImport("._code_cache", ["enable_code_cache", "disable_code_cache"]),
+    MultiFromImport("._stats", ["enable_stats", "disable_stats", "stats"]),
 ]
 
 _laz = LazyImporter(_imports, globs=globals())
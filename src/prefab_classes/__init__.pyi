@@ -1,6 +1,15 @@
-from ._class_generator import prefab, attribute, build_prefab, SlotAttributes
+from ._class_generator import (
+    prefab,
+    attribute,
+    build_prefab,
+    SlotAttributes,
+    materialize,
+    materialize_all,
+)
 from ._shared import KW_ONLY, PrefabError
 from .funcs import is_prefab, is_prefab_instance
+from ._code_cache import enable_code_cache, disable_code_cache
+from ._stats import enable_stats, disable_stats, stats
 
 __version__: str
 
@@ -10,8 +19,15 @@ __all__: list[str] = [
     "attribute",
     "build_prefab",
     "SlotAttributes",
+    "materialize",
+    "materialize_all",
     "KW_ONLY",
     "PrefabError",
     "is_prefab",
     "is_prefab_instance",
+    "enable_code_cache",
+    "disable_code_cache",
+    "enable_stats",
+    "disable_stats",
+    "stats",
 ]
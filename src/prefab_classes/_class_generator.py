@@ -68,22 +68,55 @@ else:
 from ._shared import (
     FIELDS_ATTRIBUTE,
     CLASSVAR_NAME,
+    HASH_CACHE_ATTRIBUTE,
+    INTERN_TABLE_ATTRIBUTE,
+    POOL_ATTRIBUTE,
     PRE_INIT_FUNC,
     POST_INIT_FUNC,
+    FROM_VALUES_FUNC,
+    RELEASE_FUNC,
     INTERNAL_DICT,
 )
 from ._shared import PrefabError
 from ._shared import NOTHING, KW_ONLY
 
+from . import _method_generators
 from ._method_generators import (
     init_maker,
     repr_maker,
     repr_maker_no_eval,
+    fast_repr_maker,
+    fast_repr_maker_no_eval,
+    bounded_repr_maker,
+    bounded_repr_maker_no_eval,
     eq_maker,
+    lt_maker,
+    le_maker,
+    gt_maker,
+    ge_maker,
+    hash_maker,
+    cached_hash_maker,
+    hash_cache_getstate_maker,
     iter_maker,
+    from_values_maker,
+    reduce_maker,
+    pool_reduce_maker,
+    copy_maker,
+    deepcopy_maker,
+    replace_maker,
     prefab_init_maker,
+    intern_new_maker,
+    intern_init_maker,
+    pool_new_maker,
+    release_maker,
     frozen_setattr_maker,
     frozen_delattr_maker,
+    uses_generated_method,
+    get_generated_maker,
+    is_interned,
+    is_pooled,
+    InternTable,
+    InstancePool,
 )
 
 
@@ -108,6 +141,7 @@ class Attribute:
         "init",
         "repr",
         "compare",
+        "compare_priority",
         "kw_only",
         "exclude_field",
         "doc",
@@ -119,6 +153,7 @@ class Attribute:
         "init",
         "repr",
         "compare",
+        "compare_priority",
         "kw_only",
         "exclude_field",
         "doc",
@@ -127,6 +162,7 @@ class Attribute:
     init: bool
     repr: bool
     compare: bool
+    compare_priority: int
     kw_only: bool
     exclude_field: bool
     doc: str | None
@@ -139,6 +175,7 @@ class Attribute:
         init: bool = True,
         repr: bool = True,
         compare: bool = True,
+        compare_priority: int = 0,
         kw_only: bool = False,
         exclude_field: bool = False,
         doc: str | None = None,
@@ -157,6 +194,7 @@ class Attribute:
         self.init = init
         self.repr = repr
         self.compare = compare
+        self.compare_priority = compare_priority
         self.kw_only = kw_only
         self.exclude_field = exclude_field
         self.doc = doc
@@ -170,6 +208,7 @@ class Attribute:
             f"init={self.init!r}, "
             f"repr={self.repr!r}, "
             f"compare={self.compare!r}, "
+            f"compare_priority={self.compare_priority!r}, "
             f"kw_only={self.kw_only!r}, "
             f"exclude_field={self.exclude_field!r},"
             f"doc={self.doc!r},"
@@ -185,6 +224,7 @@ class Attribute:
                 self.init,
                 self.repr,
                 self.compare,
+                self.compare_priority,
                 self.kw_only,
                 self.exclude_field,
                 self.doc,
@@ -196,6 +236,7 @@ class Attribute:
                 other.init,
                 other.repr,
                 other.compare,
+                other.compare_priority,
                 other.kw_only,
                 other.exclude_field,
                 other.doc,
@@ -213,6 +254,7 @@ def attribute(
     init=True,
     repr=True,
     compare=True,
+    compare_priority=0,
     kw_only=False,
     exclude_field=False,
     doc=None,
@@ -228,6 +270,9 @@ def attribute(
     :param init: Include this attribute in the __init__ parameters
     :param repr: Include this attribute in the class __repr__
     :param compare: Include this attribute in the class __eq__
+    :param compare_priority: Attributes with a higher priority are compared
+                             first in __eq__ (cheap, selective fields such as
+                             IDs should be given a higher priority)
     :param kw_only: Make this argument keyword only in init
     :param exclude_field: Exclude this field from all magic method generation
                           apart from __init__
@@ -243,6 +288,7 @@ def attribute(
         init=init,
         repr=repr,
         compare=compare,
+        compare_priority=compare_priority,
         kw_only=kw_only,
         exclude_field=exclude_field,
         doc=doc,
@@ -268,6 +314,147 @@ class SlotAttributes(Mapping):
         yield from self._attributes
 
 
+def _materialize_class(cls, methods=None):
+    internals = cls.__dict__.get(INTERNAL_DICT)
+    if internals is None:
+        raise TypeError(f"{cls.__name__!r} is not a prefab class")
+
+    count = 0
+    for name, maker in internals["methods"].items():
+        if methods is not None and name not in methods:
+            continue
+        # Accessing the method through the class replaces the generator
+        if cls.__dict__.get(name) is maker:
+            getattr(cls, name)
+            count += 1
+    return count
+
+
+def materialize(cls_or_module, *, methods=None):
+    """
+    Generate the methods for a prefab class, or all prefab classes defined
+    in a module, instead of waiting for them to be generated on first use.
+
+    :param cls_or_module: prefab class or module containing prefab classes
+    :param methods: names of the methods to generate, all if None
+    :return: number of methods that were generated
+    """
+    if isinstance(cls_or_module, type):
+        return _materialize_class(cls_or_module, methods)
+
+    module_name = getattr(cls_or_module, "__name__", None)
+    if module_name is None or sys.modules.get(module_name) is not cls_or_module:
+        raise TypeError(
+            f"Expected a prefab class or a module, not {cls_or_module!r}"
+        )
+
+    count = 0
+    for item in list(vars(cls_or_module).values()):
+        if (
+            isinstance(item, type)
+            and item.__module__ == module_name
+            and item.__dict__.get(INTERNAL_DICT) is not None
+        ):
+            count += _materialize_class(item, methods)
+    return count
+
+
+def materialize_all(*, freeze=True):
+    """
+    Generate the methods for every prefab class that currently exists and
+    optionally freeze all tracked objects with gc.freeze().
+
+    Call this in the parent process before forking worker processes
+    so the generated methods are shared between the workers.
+
+    :param freeze: call gc.freeze() after the methods have been generated
+    :return: number of methods that were generated
+    """
+    count = 0
+    seen = set()
+    stack = [object]
+    while stack:
+        cls = stack.pop()
+        # type.__subclasses__ also works on metaclasses such as type itself
+        for subclass in type.__subclasses__(cls):
+            if subclass in seen:
+                continue
+            seen.add(subclass)
+            stack.append(subclass)
+            if subclass.__dict__.get(INTERNAL_DICT) is not None:
+                count += _materialize_class(subclass)
+
+    if freeze:
+        import gc
+
+        # gc.freeze is not available on all implementations
+        gc_freeze = getattr(gc, "freeze", None)
+        if gc_freeze is not None:
+            gc_freeze()
+
+    return count
+
+
+def _replace_class_cells(cls_dict, old_cls, new_cls):
+    # Functions using super() or __class__ refer to the class through a cell
+    # which needs to point to the new class.
+    for value in cls_dict.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            funcs = [value.__func__]
+        elif isinstance(value, property):
+            funcs = [value.fget, value.fset, value.fdel]
+        else:
+            funcs = [value]
+
+        for func in funcs:
+            closure = getattr(func, "__closure__", None)
+            if not closure:
+                continue
+            for name, cell in zip(func.__code__.co_freevars, closure):
+                if name == "__class__" and cell.cell_contents is old_cls:
+                    cell.cell_contents = new_cls
+
+
+def _make_slotted_class(cls, *, attributes, weakref, cache_hash):
+    """
+    Create a new version of a class with __slots__ for the attributes.
+    """
+    inherited_slots = set()
+    has_weakref = False
+    for base in cls.__mro__[1:]:
+        base_slots = base.__dict__.get("__slots__", ())
+        if isinstance(base_slots, str):
+            base_slots = (base_slots,)
+        inherited_slots.update(base_slots)
+        if "__weakref__" in base.__dict__:
+            has_weakref = True
+
+    # Use the docs as the values of the slots dict so help() works
+    slots = {
+        name: attrib.doc
+        for name, attrib in attributes.items()
+        if name not in inherited_slots
+    }
+    if weakref and not has_weakref:
+        slots["__weakref__"] = None
+    if cache_hash and HASH_CACHE_ATTRIBUTE not in inherited_slots:
+        slots[HASH_CACHE_ATTRIBUTE] = None
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = slots
+
+    cls_dict[INTERNAL_DICT]["slotted"] = True
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+
+    _replace_class_cells(cls_dict, cls, new_cls)
+
+    return new_cls
+
+
 def _make_prefab(
     cls: type,
     *,
@@ -278,13 +465,26 @@ def _make_prefab(
     match_args=True,
     kw_only=False,
     frozen=False,
+    eager=False,
+    hash=False,
+    cache_hash=False,
+    order=False,
+    slots=False,
+    weakref=False,
+    trusted=False,
+    compact_pickle=False,
+    copy=False,
+    intern=False,
+    pool=0,
+    dynamic=False,
 ):
     """
     Generate boilerplate code for dunder methods in a class.
 
     :param cls: Class to convert to a prefab
     :param init: generate __init__
-    :param repr: generate __repr__
+    :param repr: generate __repr__, "fast" skips the recursion guard for
+                 acyclic classes and "bounded" truncates long field values
     :param eq: generate __eq__
     :param iter: generate __iter__
     :param match_args: generate __match_args__
@@ -292,8 +492,31 @@ def _make_prefab(
     :param frozen: Prevent attribute values from being changed once defined
                    (This does not prevent the modification of mutable attributes
                    such as lists)
+    :param eager: generate all of the methods immediately instead of on first use
+    :param hash: generate __hash__ from the fields used in __eq__
+    :param cache_hash: store the hash value on the instance after the first call
+                       to __hash__ (requires frozen)
+    :param order: generate __lt__, __le__, __gt__ and __ge__
+    :param slots: create a new class with __slots__ for the attributes
+    :param weakref: add a __weakref__ slot (requires slots)
+    :param trusted: generate a __prefab_from_values__ classmethod that creates
+                    an instance from a value for every field without __init__
+    :param compact_pickle: pickle instances as a tuple of field values that are
+                           passed to __prefab_from_values__ (implies trusted)
+    :param copy: generate __copy__, __deepcopy__ and __replace__
+    :param intern: return an existing live instance when called with arguments
+                   of the same types and values, the arguments must be hashable
+                   (requires frozen)
+    :param pool: keep up to this many instances given to __prefab_release__
+                 for reuse when creating new instances
+    :param dynamic: the class was created by build_prefab and has no module
+                    source, so its generated code is not stored in the code cache
     :return: class with __ methods defined
     """
+    # Phase timings are only recorded when enabled by enable_stats
+    recorder = _method_generators.stats_recorder
+    timer = None if recorder is None else recorder.class_timer()
+
     # Check if the class has already been processed
     if cls.__dict__.get(INTERNAL_DICT) is not None:
         raise PrefabError(
@@ -301,8 +524,44 @@ def _make_prefab(
             f"has already been processed as a Prefab."
         )
 
+    # Subclasses of interned prefabs must be interned with their own fields
+    intern = intern or is_interned(cls)
+    # Subclasses of pooled prefabs need a __new__ that matches their __init__
+    pooled_base = is_pooled(cls)
+    if intern:
+        if not (frozen or uses_generated_method(cls, "__setattr__")):
+            raise PrefabError("intern=True requires frozen=True.")
+        if not init or "__init__" in cls.__dict__ or "__new__" in cls.__dict__:
+            raise PrefabError(
+                "intern=True requires the generated __init__ "
+                "and can not be used with a user defined __init__ or __new__."
+            )
+
+    if pool and intern:
+        raise PrefabError("pool and intern=True can not be used together.")
+    if pool < 0:
+        raise PrefabError("pool must be a non-negative number of instances.")
+    if pool and "__new__" in cls.__dict__:
+        raise PrefabError("pool can not be used with a user defined __new__.")
+    if repr not in (True, False, "fast", "bounded"):
+        raise PrefabError(
+            f"repr must be True, False, 'fast' or 'bounded', not {repr!r}."
+        )
+    if cache_hash and not frozen:
+        raise PrefabError("cache_hash=True requires frozen=True.")
+    if weakref and not slots:
+        raise PrefabError("weakref=True requires slots=True.")
+    if slots and "__slots__" in cls.__dict__:
+        raise PrefabError(
+            f"slots=True can not be used on {cls.__name__!r} "
+            f"as it already defines __slots__."
+        )
+
+    if timer is not None:
+        timer.mark("checks")
+
     # Make the internals dict
-    prefab_internals = {}
+    prefab_internals = {"dynamic": dynamic}
     setattr(cls, INTERNAL_DICT, prefab_internals)
 
     # Check for slots first
@@ -416,6 +675,9 @@ def _make_prefab(
 
     prefab_internals["local_attributes"] = cls_attributes
 
+    if timer is not None:
+        timer.mark("annotations")
+
     mro = cls.__mro__[:-1]  # skip 'object' base class
 
     # Handle inheritance
@@ -429,6 +691,9 @@ def _make_prefab(
             except AttributeError:
                 pass
 
+    if timer is not None:
+        timer.mark("inheritance")
+
     # Check pre_init and post_init functions if they exist
     try:
         func = getattr(cls, PRE_INIT_FUNC)
@@ -524,22 +789,128 @@ def _make_prefab(
     if match_args and "__match_args__" not in cls.__dict__:
         setattr(cls, "__match_args__", tuple(valid_fields))
 
-    if init and "__init__" not in cls.__dict__:
-        setattr(cls, "__init__", init_maker)
+    if timer is not None:
+        timer.mark("validation")
+
+    # Record the generated methods so they can be found after they have been
+    # replaced by the real functions.
+    methods = {}
+    if intern:
+        # slots=True adds a __weakref__ slot but SlotAttributes classes can't
+        if not slots and not cls.__weakrefoffset__:
+            raise PrefabError(
+                "intern=True requires instances that support weak references, "
+                "add '__weakref__' to the slots."
+            )
+        # Instances are created and initialized by the interning __new__
+        methods["__new__"] = intern_new_maker
+        methods["__init__"] = intern_init_maker
+        methods["__prefab_init__"] = prefab_init_maker
+        # Copies return the instance itself
+        for name, maker in [
+            ("__copy__", copy_maker),
+            ("__deepcopy__", deepcopy_maker),
+        ]:
+            if name not in cls.__dict__:
+                methods[name] = maker
+        # The default pickle support would call __new__ without arguments
+        compact_pickle = True
+        setattr(cls, INTERN_TABLE_ATTRIBUTE, InternTable())
+    elif init and "__init__" not in cls.__dict__:
+        methods["__init__"] = init_maker
     else:
-        setattr(cls, "__prefab_init__", prefab_init_maker)
+        methods["__prefab_init__"] = prefab_init_maker
+    if pool or pooled_base:
+        methods["__new__"] = pool_new_maker
+    if pool:
+        methods[RELEASE_FUNC] = release_maker
+        setattr(cls, POOL_ATTRIBUTE, InstancePool(pool))
     if repr and "__repr__" not in cls.__dict__:
-        if use_eval_repr:
-            setattr(cls, "__repr__", repr_maker)
+        if repr == "fast":
+            makers = fast_repr_maker, fast_repr_maker_no_eval
+        elif repr == "bounded":
+            makers = bounded_repr_maker, bounded_repr_maker_no_eval
         else:
-            setattr(cls, "__repr__", repr_maker_no_eval)
+            makers = repr_maker, repr_maker_no_eval
+        methods["__repr__"] = makers[0] if use_eval_repr else makers[1]
     if eq and "__eq__" not in cls.__dict__:
-        setattr(cls, "__eq__", eq_maker)
+        methods["__eq__"] = eq_maker
+    if order:
+        for name, maker in [
+            ("__lt__", lt_maker),
+            ("__le__", le_maker),
+            ("__gt__", gt_maker),
+            ("__ge__", ge_maker),
+        ]:
+            if name not in cls.__dict__:
+                methods[name] = maker
+    # Defining __eq__ in the class body sets __hash__ to None in the class dict
+    # This should not count as an explicit __hash__ definition
+    class_hash = cls.__dict__.get("__hash__", NOTHING)
+    explicit_hash = class_hash is not NOTHING and not (
+        class_hash is None and "__eq__" in cls.__dict__
+    )
+    # Subclasses of compact pickling prefabs must pickle their own fields
+    compact_pickle = (
+        compact_pickle or get_generated_maker(cls, "__reduce__") is reduce_maker
+    )
+    if (hash or cache_hash) and not explicit_hash:
+        if cache_hash:
+            # SlotAttributes classes have no space to store the hash
+            if prefab_internals["slotted"]:
+                raise PrefabError(
+                    "cache_hash=True requires a __dict__ or a slot to store the hash."
+                )
+            methods["__hash__"] = cached_hash_maker
+            # Compact pickles only contain field values so skip the cache anyway
+            if not compact_pickle and "__getstate__" not in cls.__dict__:
+                methods["__getstate__"] = hash_cache_getstate_maker
+        else:
+            methods["__hash__"] = hash_maker
+    if copy:
+        for name, maker in [
+            ("__copy__", copy_maker),
+            ("__deepcopy__", deepcopy_maker),
+            ("__replace__", replace_maker),
+        ]:
+            if name not in cls.__dict__:
+                methods[name] = maker
     if iter and "__iter__" not in cls.__dict__:
-        setattr(cls, "__iter__", iter_maker)
+        methods["__iter__"] = iter_maker
+    if trusted or compact_pickle:
+        methods[FROM_VALUES_FUNC] = from_values_maker
+    if not ("__reduce__" in cls.__dict__ or "__reduce_ex__" in cls.__dict__):
+        if compact_pickle:
+            methods["__reduce__"] = reduce_maker
+        elif pool or pooled_base:
+            # The default pickle support would call __new__ without arguments
+            methods["__reduce__"] = pool_reduce_maker
     if frozen:
-        setattr(cls, "__setattr__", frozen_setattr_maker)
-        setattr(cls, "__delattr__", frozen_delattr_maker)
+        methods["__setattr__"] = frozen_setattr_maker
+        methods["__delattr__"] = frozen_delattr_maker
+
+    prefab_internals["methods"] = methods
+    for name, maker in methods.items():
+        setattr(cls, name, maker)
+
+    if timer is not None:
+        timer.mark("methods")
+
+    if slots:
+        cls = _make_slotted_class(
+            cls,
+            attributes=cls_attributes,
+            weakref=weakref or intern,
+            cache_hash=cache_hash,
+        )
+        if timer is not None:
+            timer.mark("slots")
+
+    if timer is not None:
+        timer.finish(cls)
+
+    if eager:
+        _materialize_class(cls)
 
     return cls
 
@@ -555,6 +926,18 @@ def prefab(
     match_args=True,
     kw_only=False,
     frozen=False,
+    eager=False,
+    hash=False,
+    cache_hash=False,
+    order=False,
+    slots=False,
+    weakref=False,
+    trusted=False,
+    compact_pickle=False,
+    copy=False,
+    intern=False,
+    pool=0,
+    dynamic=False,
 ):
     """
     Generate boilerplate code for dunder methods in a class.
@@ -563,13 +946,31 @@ def prefab(
 
     :param cls: Class to convert to a prefab
     :param init: generates __init__ if true or __prefab_init__ if false
-    :param repr: generate __repr__
+    :param repr: generate __repr__, "fast" skips the recursion guard for
+                 acyclic classes and "bounded" truncates long field values
     :param eq: generate __eq__
     :param iter: generate __iter__
     :param match_args: generate __match_args__
     :param kw_only: make all attributes keyword only
     :param frozen: Prevent attribute values from being changed once defined
                    (This does not prevent the modification of mutable attributes such as lists)
+    :param eager: generate all of the methods immediately instead of on first use
+    :param hash: generate __hash__ from the fields used in __eq__
+    :param cache_hash: store the hash value on the instance after the first call
+                       to __hash__ (requires frozen)
+    :param order: generate __lt__, __le__, __gt__ and __ge__
+    :param slots: create a new class with __slots__ for the attributes
+    :param weakref: add a __weakref__ slot (requires slots)
+    :param trusted: generate a __prefab_from_values__ classmethod that creates
+                    an instance from a value for every field without __init__
+    :param compact_pickle: pickle instances as a tuple of field values that are
+                           passed to __prefab_from_values__ (implies trusted)
+    :param copy: generate __copy__, __deepcopy__ and __replace__
+    :param intern: return an existing live instance when called with arguments
+                   of the same types and values, the arguments must be hashable
+                   (requires frozen)
+    :param pool: keep up to this many instances given to __prefab_release__
+                 for reuse when creating new instances
 
     :return: class with __ methods defined
     """
@@ -584,6 +985,17 @@ def prefab(
             match_args=match_args,
             kw_only=kw_only,
             frozen=frozen,
+            eager=eager,
+            hash=hash,
+            cache_hash=cache_hash,
+            order=order,
+            slots=slots,
+            weakref=weakref,
+            trusted=trusted,
+            compact_pickle=compact_pickle,
+            copy=copy,
+            intern=intern,
+            pool=pool,
         )
     else:
         return _make_prefab(
@@ -595,6 +1007,17 @@ def prefab(
             match_args=match_args,
             kw_only=kw_only,
             frozen=frozen,
+            eager=eager,
+            hash=hash,
+            cache_hash=cache_hash,
+            order=order,
+            slots=slots,
+            weakref=weakref,
+            trusted=trusted,
+            compact_pickle=compact_pickle,
+            copy=copy,
+            intern=intern,
+            pool=pool,
         )
 
 
@@ -611,6 +1034,17 @@ def build_prefab(
     match_args=True,
     kw_only=False,
     frozen=False,
+    eager=False,
+    hash=False,
+    cache_hash=False,
+    order=False,
+    slots=False,
+    weakref=False,
+    trusted=False,
+    compact_pickle=False,
+    copy=False,
+    intern=False,
+    pool=0,
 ):
     """
     Dynamically construct a (dynamic) prefab.
@@ -622,13 +1056,31 @@ def build_prefab(
     :param class_dict: Other values to add to the class dictionary on creation
                        This is the 'dict' parameter from 'type'
     :param init: generates __init__ if true or __prefab_init__ if false
-    :param repr: generate __repr__
+    :param repr: generate __repr__, "fast" skips the recursion guard for
+                 acyclic classes and "bounded" truncates long field values
     :param eq: generate __eq__
     :param iter: generate __iter__
     :param match_args: generate __match_args__
     :param kw_only: make all attributes keyword only
     :param frozen: Prevent attribute values from being changed once defined
                    (This does not prevent the modification of mutable attributes such as lists)
+    :param eager: generate all of the methods immediately instead of on first use
+    :param hash: generate __hash__ from the fields used in __eq__
+    :param cache_hash: store the hash value on the instance after the first call
+                       to __hash__ (requires frozen)
+    :param order: generate __lt__, __le__, __gt__ and __ge__
+    :param slots: create a new class with __slots__ for the attributes
+    :param weakref: add a __weakref__ slot (requires slots)
+    :param trusted: generate a __prefab_from_values__ classmethod that creates
+                    an instance from a value for every field without __init__
+    :param compact_pickle: pickle instances as a tuple of field values that are
+                           passed to __prefab_from_values__ (implies trusted)
+    :param copy: generate __copy__, __deepcopy__ and __replace__
+    :param intern: return an existing live instance when called with arguments
+                   of the same types and values, the arguments must be hashable
+                   (requires frozen)
+    :param pool: keep up to this many instances given to __prefab_release__
+                 for reuse when creating new instances
     :return: class with __ methods defined
     """
     class_dict = {} if class_dict is None else class_dict
@@ -645,6 +1097,18 @@ def build_prefab(
         match_args=match_args,
         kw_only=kw_only,
         frozen=frozen,
+        eager=eager,
+        hash=hash,
+        cache_hash=cache_hash,
+        order=order,
+        slots=slots,
+        weakref=weakref,
+        trusted=trusted,
+        compact_pickle=compact_pickle,
+        copy=copy,
+        intern=intern,
+        pool=pool,
+        dynamic=True,
     )
 
     return cls
@@ -0,0 +1,173 @@
+# ==============================================================================
+# Copyright (c) 2022-2024 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+"""
+Optional persistent cache for the code objects of generated methods.
+
+Compiled code is stored with marshal in a file next to the module's own
+bytecode in __pycache__. Entries are keyed by the class qualname and method
+name and store the generated source alongside the code, so any change to the
+attributes or flags of a class changes the source and invalidates the entry.
+"""
+import sys
+import os
+import marshal
+
+from . import _method_generators
+
+__all__ = ["CodeCache", "enable_code_cache", "disable_code_cache"]
+
+CACHE_SUFFIX = "prefab"
+
+
+class CodeCache:
+    """
+    Store of compiled method code for prefab classes, grouped by module.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        # module name -> (cache file path, {(qualname, method): (source, code)})
+        self._modules = {}
+        self._dirty = set()
+
+    @staticmethod
+    def cache_path(module_name):
+        """
+        Get the path of the cache file for a module, None if the module
+        can not be cached.
+        """
+        cache_tag = sys.implementation.cache_tag
+        module = sys.modules.get(module_name)
+        module_file = getattr(module, "__file__", None)
+        if cache_tag is None or module_file is None:
+            return None
+
+        folder, filename = os.path.split(module_file)
+        stem = filename.rpartition(".")[0]
+        return os.path.join(
+            folder, "__pycache__", f"{stem}.{cache_tag}.{CACHE_SUFFIX}"
+        )
+
+    def _get_module_entries(self, module_name):
+        try:
+            return self._modules[module_name]
+        except KeyError:
+            pass
+
+        path = self.cache_path(module_name)
+        entries = {}
+        if path is not None:
+            try:
+                with open(path, "rb") as f:
+                    data = marshal.load(f)
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+            else:
+                if isinstance(data, dict):
+                    entries = data
+
+        self._modules[module_name] = path, entries
+        return path, entries
+
+    def get_code(self, cls, method_name, source):
+        """
+        Get the compiled code object for the source of a generated method,
+        compiling and storing it if there is no valid cached version.
+
+        :param cls: class the method is being generated for
+        :param method_name: name of the generated method
+        :param source: source code generated for the method
+        :return: code object to be passed to exec
+        """
+        path, entries = self._get_module_entries(cls.__module__)
+        key = (cls.__qualname__, method_name)
+
+        entry = entries.get(key)
+        if entry is not None and entry[0] == source:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        code = compile(source, "<string>", "exec")
+        if path is not None:
+            entries[key] = (source, code)
+            self._dirty.add(cls.__module__)
+        return code
+
+    def flush(self):
+        """
+        Write any new or changed entries to their cache files.
+        """
+        if sys.dont_write_bytecode:
+            self._dirty.clear()
+            return
+
+        for module_name in self._dirty:
+            path, entries = self._modules[module_name]
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(temp_path, "wb") as f:
+                    marshal.dump(entries, f)
+                os.replace(temp_path, path)
+            except OSError:
+                # Caching is best effort, failure to write is not an error
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+        self._dirty.clear()
+
+
+def enable_code_cache():
+    """
+    Enable the persistent cache of compiled code for generated methods.
+
+    Cache files are stored in __pycache__ next to the module defining
+    each class and are written when the interpreter exits or the cache
+    is disabled. Classes created with build_prefab are not cached.
+
+    :return: the active CodeCache instance
+    """
+    cache = _method_generators.code_cache
+    if cache is None:
+        import atexit
+
+        cache = CodeCache()
+        _method_generators.code_cache = cache
+        atexit.register(cache.flush)
+    return cache
+
+
+def disable_code_cache():
+    """
+    Write out any pending cache entries and disable the code cache.
+    """
+    cache = _method_generators.code_cache
+    if cache is not None:
+        import atexit
+
+        cache.flush()
+        atexit.unregister(cache.flush)
+        _method_generators.code_cache = None
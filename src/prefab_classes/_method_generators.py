@@ -39,142 +39,220 @@
 # greater good.
 # ----------------------------------------------------------------------
 
+from _thread import allocate_lock as _allocate_lock
+
 from ducktools.lazyimporter import LazyImporter, FromImport
 
 from ._shared import (
     PRE_INIT_FUNC,
     POST_INIT_FUNC,
     PREFAB_INIT_FUNC,
+    FROM_VALUES_FUNC,
+    RELEASE_FUNC,
     FIELDS_ATTRIBUTE,
     INTERNAL_DICT,
+    HASH_CACHE_ATTRIBUTE,
+    INTERN_TABLE_ATTRIBUTE,
+    POOL_ATTRIBUTE,
     NOTHING,
 )
 
-_laz = LazyImporter([FromImport("reprlib", "recursive_repr")])
+_laz = LazyImporter(
+    [
+        FromImport("reprlib", "recursive_repr"),
+        FromImport("copy", "deepcopy"),
+        FromImport("._repr", "bounded_repr"),
+        FromImport("copyreg", "__newobj_ex__", asname="newobj_ex"),
+    ],
+    globs=globals(),
+)
+
+# types.MemberDescriptorType without importing types
+_slot_type = type(type.__dict__["__weakrefoffset__"])
 
+# Persistent store for compiled method code, set by enable_code_cache
+code_cache = None
+# Instrumentation of class creation and method generation, set by enable_stats
+stats_recorder = None
 
-def autogen(func):
+
+def autogen(func, name=None):
     """
     Basically the cluegen function from David Beazley's cluegen
     Modified slightly due to other changes.
 
     Using this as a decorator indicates that the function will return a string
     which should be used to replace the function itself for that specific class.
+
+    The method is generated at most once per class. Threads that request the
+    method while it is being generated wait for it and use the same function.
+    Once the method has replaced this descriptor no locking is involved.
+
+    :param func: function that returns the source code and globals for a class
+    :param name: name of the generated method if it differs from func.__name__
     """
+    method_name = func.__name__ if name is None else name
 
     def __get__(self, instance, cls):
-        local_vars = {}
-        code, globs = func(cls)
-        exec(code, globs, local_vars)
-        # Having executed the code, the method should now exist
-        # and can be retrieved by name from the dict
-        method = local_vars[func.__name__]
-        method.__qualname__ = f"{cls.__qualname__}.{method.__name__}"
-        # Replace the attribute with the real function - this will only be called once.
-        setattr(cls, func.__name__, method)
+        internals = getattr(cls, INTERNAL_DICT)
+        lock = internals.get("lock")
+        if lock is None:
+            # setdefault ensures every thread gets the same lock
+            lock = internals.setdefault("lock", _allocate_lock())
+
+        recorder = None
+        with lock:
+            # Another thread may have generated the method while this one waited
+            method = cls.__dict__.get(method_name)
+            if method is None or method is self:
+                recorder = stats_recorder
+                if recorder is not None:
+                    start = recorder.clock()
+                local_vars = {}
+                code, globs = func(cls)
+                source = code
+                # Classes from build_prefab would all share the cache file
+                # of the module that called type() so they are not cached
+                if code_cache is not None and not internals["dynamic"]:
+                    code = code_cache.get_code(cls, method_name, code)
+                exec(code, globs, local_vars)
+                # Having executed the code, the method should now exist
+                # and can be retrieved by name from the dict
+                method = local_vars[method_name]
+                # Set the qualname on the function itself for classmethods
+                func_obj = getattr(method, "__func__", method)
+                func_obj.__qualname__ = f"{cls.__qualname__}.{method_name}"
+                # Replace the attribute with the real function
+                setattr(cls, method_name, method)
+                if recorder is not None:
+                    end = recorder.clock()
+
+        # The stats hook may use other generated methods of this class
+        # so it is called after the lock is released
+        if recorder is not None:
+            recorder.record_exec(cls, method_name, source, start, end)
 
         return method.__get__(instance, cls)
 
-    return type(f"AutoGen_{func.__name__}", (), dict(__get__=__get__))()
+    # The generator is kept so the source can be obtained without installing it
+    return type(
+        f"AutoGen_{method_name}",
+        (),
+        dict(__get__=__get__, generator=staticmethod(func)),
+    )()
 
 
-def get_init_maker(*, init_name="__init__"):
-    def __init__(cls):
-        globs = {}
-        # Get the internals dictionary and prepare attributes
-        internals = getattr(cls, INTERNAL_DICT)
-        attributes = internals["attributes"]
+def get_init_arguments(cls):
+    """
+    Get the argument list for the generated __init__ of a prefab class.
 
-        # Handle pre/post init first - post_init can change types for __init__
-        # Get pre and post init arguments
-        pre_init_args = []
-        post_init_args = []
-        post_init_annotations = {}
-
-        for func_name, func_arglist in [
-            (PRE_INIT_FUNC, pre_init_args),
-            (POST_INIT_FUNC, post_init_args),
-        ]:
-            try:
-                func = getattr(cls, func_name)
-                func_code = func.__code__
-            except AttributeError:
-                pass
-            else:
-                argcount = func_code.co_argcount + func_code.co_kwonlyargcount
+    :param cls: prefab class
+    :return: (argument source, globals, pre_init_args, post_init_args)
+    """
+    globs = {}
+    # Get the internals dictionary and prepare attributes
+    internals = getattr(cls, INTERNAL_DICT)
+    attributes = internals["attributes"]
 
-                # Identify if method is static, if so include first arg, otherwise skip
-                is_static = type(cls.__dict__.get(func_name)) is staticmethod
+    # Handle pre/post init first - post_init can change types for __init__
+    # Get pre and post init arguments
+    pre_init_args = []
+    post_init_args = []
+    post_init_annotations = {}
 
-                arglist = (
-                    func_code.co_varnames[:argcount]
-                    if is_static
-                    else func_code.co_varnames[1:argcount]
-                )
+    for func_name, func_arglist in [
+        (PRE_INIT_FUNC, pre_init_args),
+        (POST_INIT_FUNC, post_init_args),
+    ]:
+        try:
+            func = getattr(cls, func_name)
+            func_code = func.__code__
+        except AttributeError:
+            pass
+        else:
+            argcount = func_code.co_argcount + func_code.co_kwonlyargcount
 
-                func_arglist.extend(arglist)
+            # Identify if method is static, if so include first arg, otherwise skip
+            is_static = type(cls.__dict__.get(func_name)) is staticmethod
 
-                if func_name == POST_INIT_FUNC:
-                    post_init_annotations.update(func.__annotations__)
+            arglist = (
+                func_code.co_varnames[:argcount]
+                if is_static
+                else func_code.co_varnames[1:argcount]
+            )
 
-        pos_arglist = []
-        kw_only_arglist = []
-        for name, attrib in attributes.items():
-            # post_init annotations can be used to broaden types.
-            if name in post_init_annotations:
-                globs[f"_{name}_type"] = post_init_annotations[name]
-            elif attrib._type is not NOTHING:
-                globs[f"_{name}_type"] = attrib._type
+            func_arglist.extend(arglist)
 
-            if attrib.init:
-                if attrib.default is not NOTHING:
-                    if isinstance(attrib.default, (str, int, float, bool)):
-                        # Just use the literal in these cases
-                        if attrib._type is NOTHING:
-                            arg = f"{name}={attrib.default!r}"
-                        else:
-                            arg = f"{name}: _{name}_type = {attrib.default!r}"
-                    else:
-                        # No guarantee repr will work for other objects
-                        # so store the value in a variable and put it
-                        # in the globals dict for eval
-                        if attrib._type is NOTHING:
-                            arg = f"{name}=_{name}_default"
-                        else:
-                            arg = f"{name}: _{name}_type = _{name}_default"
-                        globs[f"_{name}_default"] = attrib.default
-                elif attrib.default_factory is not NOTHING:
-                    # Use NONE here and call the factory later
-                    # This matches the behaviour of compiled
+            if func_name == POST_INIT_FUNC:
+                post_init_annotations.update(func.__annotations__)
+
+    pos_arglist = []
+    kw_only_arglist = []
+    for name, attrib in attributes.items():
+        # post_init annotations can be used to broaden types.
+        if name in post_init_annotations:
+            globs[f"_{name}_type"] = post_init_annotations[name]
+        elif attrib._type is not NOTHING:
+            globs[f"_{name}_type"] = attrib._type
+
+        if attrib.init:
+            if attrib.default is not NOTHING:
+                if isinstance(attrib.default, (str, int, float, bool)):
+                    # Just use the literal in these cases
                     if attrib._type is NOTHING:
-                        arg = f"{name}=None"
+                        arg = f"{name}={attrib.default!r}"
                     else:
-                        arg = f"{name}: _{name}_type = None"
-                    globs[f"_{name}_factory"] = attrib.default_factory
+                        arg = f"{name}: _{name}_type = {attrib.default!r}"
                 else:
+                    # No guarantee repr will work for other objects
+                    # so store the value in a variable and put it
+                    # in the globals dict for eval
                     if attrib._type is NOTHING:
-                        arg = name
+                        arg = f"{name}=_{name}_default"
                     else:
-                        arg = f"{name}: _{name}_type"
-                if attrib.kw_only:
-                    kw_only_arglist.append(arg)
+                        arg = f"{name}: _{name}_type = _{name}_default"
+                    globs[f"_{name}_default"] = attrib.default
+            elif attrib.default_factory is not NOTHING:
+                # Use NONE here and call the factory later
+                # This matches the behaviour of compiled
+                if attrib._type is NOTHING:
+                    arg = f"{name}=None"
                 else:
-                    pos_arglist.append(arg)
-            # Not in init, but need to set defaults
+                    arg = f"{name}: _{name}_type = None"
+                globs[f"_{name}_factory"] = attrib.default_factory
             else:
-                if attrib.default is not NOTHING:
-                    globs[f"_{name}_default"] = attrib.default
-                elif attrib.default_factory is not NOTHING:
-                    globs[f"_{name}_factory"] = attrib.default_factory
-
-        pos_args = ", ".join(pos_arglist)
-        kw_args = ", ".join(kw_only_arglist)
-        if pos_args and kw_args:
-            args = f"{pos_args}, *, {kw_args}"
-        elif kw_args:
-            args = f"*, {kw_args}"
+                if attrib._type is NOTHING:
+                    arg = name
+                else:
+                    arg = f"{name}: _{name}_type"
+            if attrib.kw_only:
+                kw_only_arglist.append(arg)
+            else:
+                pos_arglist.append(arg)
+        # Not in init, but need to set defaults
         else:
-            args = pos_args
+            if attrib.default is not NOTHING:
+                globs[f"_{name}_default"] = attrib.default
+            elif attrib.default_factory is not NOTHING:
+                globs[f"_{name}_factory"] = attrib.default_factory
+
+    pos_args = ", ".join(pos_arglist)
+    kw_args = ", ".join(kw_only_arglist)
+    if pos_args and kw_args:
+        args = f"{pos_args}, *, {kw_args}"
+    elif kw_args:
+        args = f"*, {kw_args}"
+    else:
+        args = pos_args
+
+    return args, globs, pre_init_args, post_init_args
+
+
+def get_init_maker(*, init_name="__init__"):
+    def __init__(cls):
+        internals = getattr(cls, INTERNAL_DICT)
+        attributes = internals["attributes"]
+        args, globs, pre_init_args, post_init_args = get_init_arguments(cls)
 
         assignments = []
         processes = []  # post_init values still need default factories to be called.
@@ -206,9 +284,15 @@ def get_init_maker(*, init_name="__init__"):
 
         if assignments or processes:
             body = ""
-            body += "\n".join(
-                f"    self.{name} = {value}" for name, value in assignments
-            )
+            if uses_generated_method(cls, "__setattr__"):
+                # Store the values directly instead of through the frozen __setattr__
+                lines, store_globs = get_field_stores(cls, "self", dict(assignments))
+                globs.update(store_globs)
+                body += "\n".join(f"    {line}" for line in lines)
+            else:
+                body += "\n".join(
+                    f"    self.{name} = {value}" for name, value in assignments
+                )
             body += "\n"
             body += "\n".join(f"    {name} = {value}" for name, value in processes)
         else:
@@ -228,34 +312,373 @@ def get_init_maker(*, init_name="__init__"):
         )
         return code, globs
 
+    return autogen(__init__, name=init_name)
+
+
+def get_generated_maker(cls, method_name):
+    """
+    Get the maker for the method used by instances of cls if the method was
+    generated for a prefab, otherwise None.
+
+    This looks in the class dicts so the method is not generated by the check.
+    """
+    owner = next(
+        (base for base in cls.__mro__ if method_name in base.__dict__), None
+    )
+    internals = None if owner is None else owner.__dict__.get(INTERNAL_DICT)
+    return None if internals is None else internals["methods"].get(method_name)
+
+
+def uses_generated_method(cls, method_name):
+    """
+    Check if the method used by instances of cls was generated for a prefab.
+    """
+    return get_generated_maker(cls, method_name) is not None
+
+
+def get_new_maker(cls):
+    """
+    Get the maker for the __new__ generated for the closest prefab class
+    in the MRO of cls, otherwise None.
+
+    Generated methods are stored on plain subclasses of a prefab when they
+    are first accessed through them, so the class dicts can not be used
+    to find the maker for these subclasses.
+    """
+    for base in cls.__mro__:
+        internals = base.__dict__.get(INTERNAL_DICT)
+        if internals is not None:
+            # Classes being processed do not have their methods yet
+            return internals.get("methods", {}).get("__new__")
+    return None
+
+
+def is_interned(cls):
+    """
+    Check if instances of cls are created by an interning __new__.
+    """
+    return get_new_maker(cls) is intern_new_maker
+
+
+def is_pooled(cls):
+    """
+    Check if instances of cls are created by a pooling __new__.
+    """
+    return get_new_maker(cls) is pool_new_maker
+
+
+def get_new_instance(cls):
+    """
+    Get the source to create an instance of cls without calling __init__.
+
+    Interning and pooling __new__ methods take the arguments for __init__
+    so they are skipped.
+    """
+    if is_interned(cls) or is_pooled(cls):
+        return "object.__new__(cls)"
+    return "cls.__new__(cls)"
+
+
+def get_field_stores(cls, target, values):
+    """
+    Get lines of code that store values on a new instance, bypassing any
+    frozen or user defined __setattr__.
+
+    :param cls: prefab class
+    :param target: name of the variable holding the instance
+    :param values: dict of {field_name: value_source}
+    :return: list of lines of code (without indentation), globals
+    """
+    internals = getattr(cls, INTERNAL_DICT)
+    globs = {}
+
+    # Look in the class dicts to avoid generating __setattr__ here
+    setattr_func = next(
+        base.__dict__["__setattr__"]
+        for base in cls.__mro__
+        if "__setattr__" in base.__dict__
+    )
+    direct = setattr_func is object.__setattr__
+
+    lines = []
+    if not direct and not internals["slotted"]:
+        lines.append(f"__prefab_dict = {target}.__dict__")
+    for name, value in values.items():
+        if direct:
+            lines.append(f"{target}.{name} = {value}")
+        elif internals["slotted"] or type(getattr(cls, name, None)) is _slot_type:
+            globs["__prefab_setattr_func"] = object.__setattr__
+            lines.append(f"__prefab_setattr_func({target}, {name!r}, {value})")
+        else:
+            lines.append(f"__prefab_dict[{name!r}] = {value}")
+
+    return lines, globs
+
+
+def get_from_values_maker():
+    def __prefab_from_values__(cls):
+        field_names = getattr(cls, FIELDS_ATTRIBUTE)
+        lines, globs = get_field_stores(
+            cls, "self", {name: name for name in field_names}
+        )
+
+        args = "".join(f", {name}" for name in field_names)
+        body = "".join(f"    {line}\n" for line in lines)
+        code = (
+            f"@classmethod\n"
+            f"def {FROM_VALUES_FUNC}(cls{args}):\n"
+            f"    self = {get_new_instance(cls)}\n"
+            f"{body}"
+            f"    return self\n"
+        )
+        return code, globs
+
+    return autogen(__prefab_from_values__)
+
+
+class InternTable:
+    """
+    Table of the live interned instances of a prefab class.
+
+    Instances are held by weak reference and keyed by the class and the
+    arguments used to create them.
+    """
+
+    __slots__ = ("instances", "hits", "misses")
+
+    def __init__(self):
+        from weakref import WeakValueDictionary
+
+        self.instances = WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.instances)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self.instances),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self.instances.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def get_intern_new_maker():
+    def __new__(cls):
+        attributes = getattr(cls, INTERNAL_DICT)["attributes"]
+        args, globs, _, _ = get_init_arguments(cls)
+
+        key_values = []
+        call_args = []
+        for name, attrib in attributes.items():
+            if not attrib.init:
+                continue
+            key_values.append(name)
+            call_args.append(f"{name}={name}" if attrib.kw_only else name)
+
+        # Types are part of the key as equal values of different types
+        # such as 1, 1.0 and True would otherwise share an instance
+        key = "".join(f", type({name}), {name}" for name in key_values)
+        signature = f"cls, {args}" if args else "cls"
+        code = (
+            f"def __new__({signature}):\n"
+            f"    __prefab_table = cls.{INTERN_TABLE_ATTRIBUTE}\n"
+            f"    __prefab_key = (cls{key})\n"
+            f"    try:\n"
+            f"        __prefab_self = __prefab_table.instances[__prefab_key]\n"
+            f"    except TypeError as e:\n"
+            f"        raise TypeError(\n"
+            f"            f'Arguments to interned class {{cls.__name__}} '\n"
+            f"            f'must be hashable: {{e}}'\n"
+            f"        ) from None\n"
+            f"    except KeyError:\n"
+            f"        __prefab_table.misses += 1\n"
+            f"        __prefab_self = object.__new__(cls)\n"
+            f"        __prefab_self.{PREFAB_INIT_FUNC}({', '.join(call_args)})\n"
+            f"        __prefab_table.instances[__prefab_key] = __prefab_self\n"
+            f"    else:\n"
+            f"        __prefab_table.hits += 1\n"
+            f"    return __prefab_self\n"
+        )
+        return code, globs
+
+    return autogen(__new__)
+
+
+def get_intern_init_maker():
+    def __init__(cls):
+        # Interned instances are initialized in __new__
+        code = "def __init__(self, *args, **kwargs):\n    pass\n"
+        globs = {}
+        return code, globs
+
     return autogen(__init__)
 
 
-def get_repr_maker(will_eval=True):
+class InstancePool:
+    """
+    Free list of released instances of a prefab class.
+
+    Instances given to __prefab_release__ are cleared and kept until
+    they are reused by the generated __new__ or bulk constructors.
+    """
+
+    __slots__ = ("instances", "size", "hits", "misses", "dropped")
+
+    def __init__(self, size):
+        self.instances = []
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self.instances)
+
+    def acquire(self, cls):
+        """Get an instance of cls from the pool or a new one if it is empty."""
+        try:
+            inst = self.instances.pop()
+        except IndexError:
+            self.misses += 1
+            return object.__new__(cls)
+        self.hits += 1
+        return inst
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": self.size,
+            "available": len(self.instances),
+            "hits": self.hits,
+            "misses": self.misses,
+            "dropped": self.dropped,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self.instances.clear()
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+
+def get_pool_new_maker():
+    def __new__(cls):
+        internals = getattr(cls, INTERNAL_DICT)
+        if "__init__" in internals["methods"]:
+            # Match the signature of the generated __init__
+            args, globs, _, _ = get_init_arguments(cls)
+        else:
+            args, globs = "*args, **kwargs", {}
+
+        signature = f"cls, {args}" if args else "cls"
+        # Subclasses without their own pool create new instances
+        code = (
+            f"def __new__({signature}):\n"
+            f"    __prefab_pool = cls.__dict__.get({POOL_ATTRIBUTE!r})\n"
+            f"    if __prefab_pool is not None:\n"
+            f"        if __prefab_pool.instances:\n"
+            f"            __prefab_pool.hits += 1\n"
+            f"            return __prefab_pool.instances.pop()\n"
+            f"        __prefab_pool.misses += 1\n"
+            f"    return object.__new__(cls)\n"
+        )
+        return code, globs
+
+    return autogen(__new__)
+
+
+def get_release_maker():
+    def __prefab_release__(cls):
+        # Values are removed so the pool does not keep them alive
+        clear = []
+        if cls.__dictoffset__:
+            clear.append("        inst.__dict__.clear()")
+        slot_names = tuple(
+            name
+            for base in cls.__mro__
+            for name, value in base.__dict__.items()
+            if type(value) is _slot_type
+        )
+        if slot_names:
+            clear.extend(
+                [
+                    f"        for __prefab_name in {slot_names!r}:",
+                    f"            try:",
+                    f"                object.__delattr__(inst, __prefab_name)",
+                    f"            except AttributeError:",
+                    f"                pass",
+                ]
+            )
+        clear = "".join(f"{line}\n" for line in clear)
+
+        code = (
+            f"@classmethod\n"
+            f"def {RELEASE_FUNC}(cls, inst):\n"
+            f"    if type(inst) is not cls:\n"
+            f"        raise TypeError(\n"
+            f"            f'{{cls.__name__}} can only release its own instances, '\n"
+            f"            f'not {{type(inst).__name__}}'\n"
+            f"        )\n"
+            f"    __prefab_pool = cls.__dict__.get({POOL_ATTRIBUTE!r})\n"
+            f"    if __prefab_pool is None:\n"
+            f"        return\n"
+            f"    if len(__prefab_pool.instances) < __prefab_pool.size:\n"
+            f"{clear}"
+            f"        __prefab_pool.instances.append(inst)\n"
+            f"    else:\n"
+            f"        __prefab_pool.dropped += 1\n"
+        )
+        globs = {}
+        return code, globs
+
+    return autogen(__prefab_release__)
+
+
+def get_repr_maker(will_eval=True, recursive=True, bounded=False):
+    """
+    :param will_eval: Use the eval-able Class(field=value) form
+    :param recursive: Guard against recursion with reprlib.recursive_repr
+    :param bounded: Truncate long field values in the style of reprlib
+    """
     def __repr__(cls):
         internals = getattr(cls, INTERNAL_DICT)
         attributes = internals["attributes"]
+        if bounded:
+            value = "_laz.bounded_repr(self.{name})"
+        else:
+            value = "self.{name}!r"
         content = ", ".join(
-            f"{name}={{self.{name}!r}}"
+            f"{name}={{{value.format(name=name)}}}"
             for name, attrib in attributes.items()
             if attrib.repr and not attrib.exclude_field
         )
+        decorator = "@_laz.recursive_repr()\n" if recursive else ""
         if will_eval:
             code = (
-                f"@_laz.recursive_repr()\n"
+                f"{decorator}"
                 f"def __repr__(self):\n"
                 f"    return f'{{type(self).__qualname__}}({content})'\n"
             )
         else:
             if content:
                 code = (
-                    f"@_laz.recursive_repr()\n"
+                    f"{decorator}"
                     f"def __repr__(self):\n"
                     f"    return f'<prefab {{type(self).__qualname__}}; {content}>'\n"
                 )
             else:
                 code = (
-                    f"@_laz.recursive_repr()\n"
+                    f"{decorator}"
                     f"def __repr__(self):\n"
                     f"    return f'<prefab {{type(self).__qualname__}}>'\n"
                 )
@@ -267,34 +690,351 @@ def get_repr_maker(will_eval=True):
     return autogen(__repr__)
 
 
+def get_compare_fields(cls):
+    """
+    Get the names of the fields used for comparison and hashing.
+    """
+    attributes = getattr(cls, INTERNAL_DICT)["attributes"]
+    return [
+        name
+        for name, attrib in attributes.items()
+        if attrib.compare and not attrib.exclude_field
+    ]
+
+
+def get_eq_fields(cls):
+    """
+    Get the names of the fields used for __eq__ in the order they are compared.
+    """
+    attributes = getattr(cls, INTERNAL_DICT)["attributes"]
+    # sorted is stable so fields with equal priority keep their order
+    return sorted(
+        get_compare_fields(cls),
+        key=lambda name: -attributes[name].compare_priority,
+    )
+
+
 def get_eq_maker():
     def __eq__(cls):
+        # Fields are compared one at a time so the first difference
+        # returns without reading the remaining fields.
+        # 'is' is checked first to match tuple comparison.
+        comparisons = "".join(
+            f"    if not (self.{name} is other.{name} "
+            f"or self.{name} == other.{name}):\n"
+            f"        return False\n"
+            for name in get_eq_fields(cls)
+        )
+
+        code = (
+            f"def __eq__(self, other):\n"
+            f"    if self is other:\n"
+            f"        return True\n"
+            f"    if self.__class__ is not other.__class__:\n"
+            f"        return NotImplemented\n"
+            f"{comparisons}"
+            f"    return True\n"
+        )
+        globs = {}
+
+        return code, globs
+
+    return autogen(__eq__)
+
+
+def get_order_maker(name, operator):
+    def __order__(cls):
         class_comparison = "self.__class__ is other.__class__"
+        field_names = get_compare_fields(cls)
 
-        internals = getattr(cls, INTERNAL_DICT)
-        attributes = internals["attributes"]
-        field_names = [
-            name
-            for name, attrib in attributes.items()
-            if attrib.compare and not attrib.exclude_field
-        ]
+        selfvals = "".join(f"self.{field}, " for field in field_names)
+        othervals = "".join(f"other.{field}, " for field in field_names)
+        instance_comparison = f"({selfvals}) {operator} ({othervals})"
 
-        if field_names:
-            selfvals = ",".join(f"self.{name}" for name in field_names)
-            othervals = ",".join(f"other.{name}" for name in field_names)
-            instance_comparison = f"({selfvals},) == ({othervals},)"
+        code = (
+            f"def {name}(self, other):\n"
+            f"    return {instance_comparison} if {class_comparison} else NotImplemented\n"
+        )
+        globs = {}
+
+        return code, globs
+
+    return autogen(__order__, name=name)
+
+
+def get_hash_maker(cache=False):
+    def __hash__(cls):
+        globs = {}
+        field_names = get_compare_fields(cls)
+        values = "".join(f"self.{name}," for name in field_names)
+        hash_value = f"hash(({values}))"
+
+        if not cache:
+            code = f"def __hash__(self):\n    return {hash_value}\n"
+        elif getattr(cls, INTERNAL_DICT)["slotted"]:
+            globs["__prefab_setattr_func"] = object.__setattr__
+            code = (
+                f"def __hash__(self):\n"
+                f"    try:\n"
+                f"        return self.{HASH_CACHE_ATTRIBUTE}\n"
+                f"    except AttributeError:\n"
+                f"        value = {hash_value}\n"
+                f"        __prefab_setattr_func(self, {HASH_CACHE_ATTRIBUTE!r}, value)\n"
+                f"        return value\n"
+            )
+        else:
+            # Write to __dict__ directly to avoid any frozen __setattr__
+            code = (
+                f"def __hash__(self):\n"
+                f"    try:\n"
+                f"        return self.__dict__[{HASH_CACHE_ATTRIBUTE!r}]\n"
+                f"    except KeyError:\n"
+                f"        value = self.__dict__[{HASH_CACHE_ATTRIBUTE!r}] = {hash_value}\n"
+                f"        return value\n"
+            )
+
+        return code, globs
+
+    return autogen(__hash__)
+
+
+def get_hash_cache_getstate_maker():
+    def __getstate__(cls):
+        # Hash values are not stable between processes so the cache
+        # must not be included in the pickled state.
+        internals = getattr(cls, INTERNAL_DICT)
+        if internals["slotted"]:
+            field_names = tuple(internals["attributes"])
+            code = (
+                f"def __getstate__(self):\n"
+                f"    state = {{}}\n"
+                f"    for name in {field_names!r}:\n"
+                f"        try:\n"
+                f"            state[name] = getattr(self, name)\n"
+                f"        except AttributeError:\n"
+                f"            pass\n"
+                f"    return None, state\n"
+            )
         else:
-            instance_comparison = "True"
+            code = (
+                f"def __getstate__(self):\n"
+                f"    state = self.__dict__.copy()\n"
+                f"    state.pop({HASH_CACHE_ATTRIBUTE!r}, None)\n"
+                f"    return state\n"
+            )
+        globs = {}
+        return code, globs
+
+    return autogen(__getstate__)
+
 
+def get_intern_reduce_code(cls):
+    """
+    Get the source of a __reduce__ for an interned class that recreates
+    instances by calling the class, so unpickled instances are looked up
+    in the intern table.
+
+    The arguments are the current values of the init fields.
+    """
+    attributes = getattr(cls, INTERNAL_DICT)["attributes"]
+    args = "".join(
+        f"self.{name}, "
+        for name, attrib in attributes.items()
+        if attrib.init and not attrib.kw_only
+    )
+    kwargs = ", ".join(
+        f"{name!r}: self.{name}"
+        for name, attrib in attributes.items()
+        if attrib.init and attrib.kw_only
+    )
+    if kwargs:
+        # Keyword arguments are passed to the interning __new__ by pickle
+        result = f"_laz.newobj_ex, (type(self), ({args}), {{{kwargs}}})"
+    else:
+        result = f"type(self), ({args})"
+    return f"def __reduce__(self):\n    return {result}\n"
+
+
+def get_reduce_maker():
+    def __reduce__(cls):
+        if is_interned(cls):
+            return get_intern_reduce_code(cls), {"_laz": _laz}
+
+        field_names = getattr(cls, FIELDS_ATTRIBUTE)
+        values = "".join(f"self.{name}, " for name in field_names)
+        # The same bound classmethod is returned for every instance of a class
+        # so pickle only needs to store a reference to it once.
         code = (
-            f"def __eq__(self, other):\n"
-            f"    return {instance_comparison} if {class_comparison} else NotImplemented\n"
+            f"def __reduce__(self, _constructors={{}}):\n"
+            f"    cls = type(self)\n"
+            f"    try:\n"
+            f"        constructor = _constructors[cls]\n"
+            f"    except KeyError:\n"
+            f"        constructor = _constructors[cls] = cls.{FROM_VALUES_FUNC}\n"
+            f"    return constructor, ({values})\n"
         )
         globs = {}
+        return code, globs
+
+    return autogen(__reduce__)
+
 
+def get_pool_reduce_maker():
+    def __reduce__(cls):
+        # The pooling __new__ takes the arguments for __init__ so instances
+        # are created with object.__new__ and given the same state that the
+        # default pickle support would use.
+        from copyreg import _slotnames
+
+        # object.__getstate__ is only available from Python 3.11
+        slot_names = tuple(_slotnames(cls))
+        code = (
+            f"def __reduce__(self):\n"
+            f"    try:\n"
+            f"        getstate = self.__getstate__\n"
+            f"    except AttributeError:\n"
+            f"        state = getattr(self, '__dict__', None) or None\n"
+            f"        slots = {{}}\n"
+            f"        for name in {slot_names!r}:\n"
+            f"            try:\n"
+            f"                slots[name] = getattr(self, name)\n"
+            f"            except AttributeError:\n"
+            f"                pass\n"
+            f"        if slots:\n"
+            f"            state = state, slots\n"
+            f"    else:\n"
+            f"        state = getstate()\n"
+            f"    return object.__new__, (type(self),), state\n"
+        )
+        globs = {}
         return code, globs
 
-    return autogen(__eq__)
+    return autogen(__reduce__)
+
+
+def get_slot_fields(cls):
+    """
+    Get the names of the fields that are stored in slots.
+    """
+    return [
+        name
+        for name in getattr(cls, FIELDS_ATTRIBUTE)
+        if type(getattr(cls, name, None)) is _slot_type
+    ]
+
+
+def get_copy_maker():
+    def __copy__(cls):
+        # Interned instances are immutable and unique
+        if is_interned(cls):
+            return "def __copy__(self):\n    return self\n", {}
+
+        body = []
+        globs = {}
+        if cls.__dictoffset__:
+            body.append("new.__dict__.update(self.__dict__)")
+
+        slot_fields = get_slot_fields(cls)
+        if slot_fields:
+            lines, globs = get_field_stores(
+                cls, "new", {name: f"self.{name}" for name in slot_fields}
+            )
+            body.extend(lines)
+
+        body = "".join(f"    {line}\n" for line in body)
+        code = (
+            f"def __copy__(self):\n"
+            f"    cls = type(self)\n"
+            f"    new = {get_new_instance(cls)}\n"
+            f"{body}"
+            f"    return new\n"
+        )
+        return code, globs
+
+    return autogen(__copy__)
+
+
+def get_deepcopy_maker():
+    def __deepcopy__(cls):
+        if is_interned(cls):
+            return "def __deepcopy__(self, memo):\n    return self\n", {}
+
+        # Only values that are not immutable atoms need to be deep copied
+        copy_value = (
+            "{0} if type({0}) in _atomic_types else _laz.deepcopy({0}, memo)"
+        )
+        body = []
+        globs = {"_laz": _laz}
+        if cls.__dictoffset__:
+            body.extend(
+                [
+                    "new_dict = new.__dict__",
+                    "for name, value in self.__dict__.items():",
+                    f"    new_dict[name] = {copy_value.format('value')}",
+                ]
+            )
+
+        slot_fields = get_slot_fields(cls)
+        if slot_fields:
+            lines, store_globs = get_field_stores(
+                cls,
+                "new",
+                {name: copy_value.format(f"self.{name}") for name in slot_fields},
+            )
+            body.extend(lines)
+            globs.update(store_globs)
+
+        body = "".join(f"    {line}\n" for line in body)
+        code = (
+            f"def __deepcopy__(\n"
+            f"    self,\n"
+            f"    memo,\n"
+            f"    _atomic_types=frozenset(\n"
+            f"        (str, int, float, bool, complex, bytes, type(None))\n"
+            f"    ),\n"
+            f"):\n"
+            f"    cls = type(self)\n"
+            f"    new = {get_new_instance(cls)}\n"
+            f"    memo[id(self)] = new\n"
+            f"{body}"
+            f"    return new\n"
+        )
+        return code, globs
+
+    return autogen(__deepcopy__)
+
+
+def get_replace_maker():
+    def __replace__(cls):
+        internals = getattr(cls, INTERNAL_DICT)
+        args = []
+        kwargs = []
+        for name, attrib in internals["attributes"].items():
+            # Excluded fields are not stored so they must be passed as changes
+            if not attrib.init or attrib.exclude_field:
+                continue
+            value = f"changes.pop({name!r}, self.{name})"
+            if attrib.kw_only:
+                kwargs.append(f"{name}={value}")
+            else:
+                args.append(value)
+        # Any remaining changes are passed on and checked by __init__
+        arguments = ", ".join([*args, *kwargs, "**changes"])
+
+        if "__init__" in internals["methods"]:
+            body = f"    return type(self)({arguments})\n"
+        else:
+            body = (
+                f"    cls = type(self)\n"
+                f"    new = cls.__new__(cls)\n"
+                f"    new.{PREFAB_INIT_FUNC}({arguments})\n"
+                f"    return new\n"
+            )
+        code = f"def __replace__(self, /, **changes):\n{body}"
+        globs = {}
+        return code, globs
+
+    return autogen(__replace__)
 
 
 def get_iter_maker():
@@ -352,9 +1092,30 @@ def get_frozen_delattr_maker():
 
 init_maker = get_init_maker()
 prefab_init_maker = get_init_maker(init_name=PREFAB_INIT_FUNC)
+intern_new_maker = get_intern_new_maker()
+intern_init_maker = get_intern_init_maker()
+pool_new_maker = get_pool_new_maker()
+release_maker = get_release_maker()
 repr_maker = get_repr_maker(will_eval=True)
 repr_maker_no_eval = get_repr_maker(will_eval=False)
+fast_repr_maker = get_repr_maker(will_eval=True, recursive=False)
+fast_repr_maker_no_eval = get_repr_maker(will_eval=False, recursive=False)
+bounded_repr_maker = get_repr_maker(will_eval=True, bounded=True)
+bounded_repr_maker_no_eval = get_repr_maker(will_eval=False, bounded=True)
 eq_maker = get_eq_maker()
+lt_maker = get_order_maker("__lt__", "<")
+le_maker = get_order_maker("__le__", "<=")
+gt_maker = get_order_maker("__gt__", ">")
+ge_maker = get_order_maker("__ge__", ">=")
+hash_maker = get_hash_maker()
+cached_hash_maker = get_hash_maker(cache=True)
+hash_cache_getstate_maker = get_hash_cache_getstate_maker()
 iter_maker = get_iter_maker()
+reduce_maker = get_reduce_maker()
+pool_reduce_maker = get_pool_reduce_maker()
+copy_maker = get_copy_maker()
+deepcopy_maker = get_deepcopy_maker()
+replace_maker = get_replace_maker()
+from_values_maker = get_from_values_maker()
 frozen_setattr_maker = get_frozen_setattr_maker()
 frozen_delattr_maker = get_frozen_delattr_maker()
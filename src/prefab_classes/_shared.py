@@ -24,11 +24,16 @@ __all__ = [
     "PRE_INIT_FUNC",
     "POST_INIT_FUNC",
     "PREFAB_INIT_FUNC",
+    "FROM_VALUES_FUNC",
+    "RELEASE_FUNC",
     "DECORATOR_NAME",
     "ATTRIBUTE_FUNCNAME",
     "FIELDS_ATTRIBUTE",
     "CLASSVAR_NAME",
     "INTERNAL_DICT",
+    "HASH_CACHE_ATTRIBUTE",
+    "INTERN_TABLE_ATTRIBUTE",
+    "POOL_ATTRIBUTE",
     "PrefabError",
     "NOTHING",
     "KW_ONLY",
@@ -40,6 +45,8 @@ __all__ = [
 PRE_INIT_FUNC = "__prefab_pre_init__"
 POST_INIT_FUNC = "__prefab_post_init__"
 PREFAB_INIT_FUNC = "__prefab_init__"
+FROM_VALUES_FUNC = "__prefab_from_values__"
+RELEASE_FUNC = "__prefab_release__"
 DECORATOR_NAME = "prefab"
 ATTRIBUTE_FUNCNAME = "attribute"
 
@@ -47,6 +54,9 @@ ATTRIBUTE_FUNCNAME = "attribute"
 FIELDS_ATTRIBUTE = "PREFAB_FIELDS"
 CLASSVAR_NAME = "ClassVar"
 INTERNAL_DICT = "__prefab_internals__"
+HASH_CACHE_ATTRIBUTE = "__prefab_hash__"
+INTERN_TABLE_ATTRIBUTE = "__prefab_intern_table__"
+POOL_ATTRIBUTE = "__prefab_pool__"
 
 
 # EXCEPTIONS
@@ -0,0 +1,178 @@
+# ==============================================================================
+# Copyright (c) 2022-2024 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+"""
+Optional instrumentation of prefab class creation and method generation.
+
+When enabled the time taken by each phase of the prefab decorator, the
+number of exec calls and size of the generated source for each class and
+the delay between decoration and the first generated method are recorded.
+"""
+from time import perf_counter
+
+from . import _method_generators
+
+__all__ = ["StatsRecorder", "enable_stats", "disable_stats", "stats"]
+
+
+def _class_key(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class PhaseTimer:
+    """
+    Timer for the phases of creating a single prefab class.
+    """
+
+    __slots__ = ("recorder", "phases", "start", "last")
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+        self.phases = {}
+        self.start = self.last = perf_counter()
+
+    def mark(self, phase):
+        """Record the time since the previous mark as the time for phase."""
+        now = perf_counter()
+        self.phases[phase] = now - self.last
+        self.last = now
+
+    def finish(self, cls):
+        """Record the phase times for the finished class."""
+        self.recorder.record_class(cls, self.phases, self.start, self.last)
+
+
+class StatsRecorder:
+    """
+    Store of instrumentation data for prefab classes.
+
+    :param hook: optional callable given each event as it is recorded
+    """
+
+    clock = staticmethod(perf_counter)
+
+    def __init__(self, hook=None):
+        self.hook = hook
+        # "module.qualname" -> dict of recorded values
+        self.classes = {}
+
+    def _get_entry(self, cls):
+        key = _class_key(cls)
+        try:
+            return self.classes[key]
+        except KeyError:
+            entry = self.classes[key] = {
+                "module": cls.__module__,
+                "phases": {},
+                "decorate_time": 0.0,
+                "exec_count": 0,
+                "exec_time": 0.0,
+                "source_size": 0,
+                "methods": [],
+                "first_materialized": None,
+                "_created": None,
+            }
+            return entry
+
+    def class_timer(self):
+        return PhaseTimer(self)
+
+    def record_class(self, cls, phases, start, end):
+        # A class redefined with the same name replaces the previous entry
+        self.classes.pop(_class_key(cls), None)
+        entry = self._get_entry(cls)
+        entry["phases"] = phases
+        entry["decorate_time"] = end - start
+        entry["_created"] = end
+        if self.hook is not None:
+            self.hook("class", cls, {"phases": phases, "decorate_time": end - start})
+
+    def record_exec(self, cls, method_name, source, start, end):
+        entry = self._get_entry(cls)
+        entry["exec_count"] += 1
+        entry["exec_time"] += end - start
+        entry["source_size"] += len(source)
+        entry["methods"].append(method_name)
+        if entry["first_materialized"] is None and entry["_created"] is not None:
+            entry["first_materialized"] = start - entry["_created"]
+        if self.hook is not None:
+            self.hook(
+                "exec",
+                cls,
+                {
+                    "method": method_name,
+                    "exec_time": end - start,
+                    "source_size": len(source),
+                },
+            )
+
+    def results(self):
+        return {
+            key: {k: v for k, v in entry.items() if not k.startswith("_")}
+            for key, entry in self.classes.items()
+        }
+
+
+def enable_stats(hook=None):
+    """
+    Start recording instrumentation data for prefab classes.
+
+    Only classes decorated and methods generated while recording is enabled
+    are included.
+
+    :param hook: optional callable, called as hook(event, cls, data) with
+                 event "class" after a class is decorated and "exec" after
+                 each generated method is executed
+    :return: the active StatsRecorder instance
+    """
+    recorder = _method_generators.stats_recorder
+    if recorder is None:
+        recorder = StatsRecorder(hook)
+        _method_generators.stats_recorder = recorder
+    else:
+        recorder.hook = hook
+    return recorder
+
+
+def disable_stats():
+    """
+    Stop recording instrumentation data and discard the recorded data.
+    """
+    _method_generators.stats_recorder = None
+
+
+def stats():
+    """
+    Get the recorded instrumentation data for each prefab class.
+
+    Times are in seconds. 'phases' contains the time for each phase of
+    the prefab decorator, 'first_materialized' is the time between the
+    end of decoration and the first generated method being executed.
+
+    :return: {"module.qualname": {"module": ..., "phases": {...},
+              "decorate_time": ...,
+              "exec_count": ..., "exec_time": ..., "source_size": ...,
+              "methods": [...], "first_materialized": ...}}
+    """
+    recorder = _method_generators.stats_recorder
+    if recorder is None:
+        return {}
+    return recorder.results()
@@ -0,0 +1,505 @@
+# ==============================================================================
+# Copyright (c) 2022-2024 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+"""
+Ahead of time compilation of modules using @prefab.
+
+The module is imported so the prefabs are built as normal, the generated
+methods are then written directly into a copy of the module source in place
+of the decorator and attribute definitions.
+
+Usage:
+    python -m prefab_classes.compile [--output-dir DIR] module [module ...]
+
+Limitations:
+    * Only prefabs defined at the top level of the module are compiled.
+    * Defaults for attributes inherited from prefabs in other modules can not
+      be compiled.
+    * Compiled classes do not have __prefab_internals__ and so can not be
+      used as bases for runtime prefabs.
+"""
+import ast
+import re
+import sys
+import importlib
+import tokenize
+
+from ._shared import (
+    INTERNAL_DICT,
+    FIELDS_ATTRIBUTE,
+    INTERN_TABLE_ATTRIBUTE,
+    POOL_ATTRIBUTE,
+    POST_INIT_FUNC,
+    DECORATOR_NAME,
+    ATTRIBUTE_FUNCNAME,
+    PrefabError,
+)
+
+__all__ = ["compile_module", "main"]
+
+# Names that are no longer needed from prefab_classes once compiled
+PREFAB_IMPORT_NAMES = {DECORATOR_NAME, ATTRIBUTE_FUNCNAME, "SlotAttributes"}
+# Interned classes still need the table from prefab_classes once compiled
+INTERN_TABLE_NAME = "_prefab_InternTable"
+INTERN_TABLE_IMPORT = (
+    f"from prefab_classes._method_generators import InternTable as {INTERN_TABLE_NAME}"
+)
+POOL_NAME = "_prefab_InstancePool"
+POOL_IMPORT = (
+    f"from prefab_classes._method_generators import InstancePool as {POOL_NAME}"
+)
+# Lazily imported names used by generated methods and their compiled imports
+LAZY_IMPORTS = {
+    "_laz.recursive_repr": (
+        "_prefab_recursive_repr",
+        "from reprlib import recursive_repr as _prefab_recursive_repr",
+    ),
+    "_laz.deepcopy": (
+        "_prefab_deepcopy",
+        "from copy import deepcopy as _prefab_deepcopy",
+    ),
+    "_laz.newobj_ex": (
+        "_prefab_newobj_ex",
+        "from copyreg import __newobj_ex__ as _prefab_newobj_ex",
+    ),
+    "_laz.bounded_repr": (
+        "_prefab_bounded_repr",
+        "from prefab_classes._repr import bounded_repr as _prefab_bounded_repr",
+    ),
+}
+
+
+class _FieldSource:
+    """Source code for the parts of a field definition."""
+
+    __slots__ = ("default", "default_factory", "type")
+
+    def __init__(self):
+        self.default = None
+        self.default_factory = None
+        self.type = None
+
+
+def _is_named(node, name):
+    return (isinstance(node, ast.Name) and node.id == name) or (
+        isinstance(node, ast.Attribute) and node.attr == name
+    )
+
+
+def _is_call_to(node, name):
+    return isinstance(node, ast.Call) and _is_named(node.func, name)
+
+
+def _is_prefab_decorator(node):
+    return _is_named(node, DECORATOR_NAME) or _is_call_to(node, DECORATOR_NAME)
+
+
+def _read_value(field_source, value):
+    """Update the default source from an assigned value."""
+    field_source.default = None
+    field_source.default_factory = None
+    if _is_call_to(value, ATTRIBUTE_FUNCNAME):
+        for kw in value.keywords:
+            if kw.arg == "default":
+                field_source.default = ast.unparse(kw.value)
+            elif kw.arg == "default_factory":
+                field_source.default_factory = ast.unparse(kw.value)
+            elif kw.arg == "type" and field_source.type is None:
+                field_source.type = ast.unparse(kw.value)
+    else:
+        field_source.default = ast.unparse(value)
+
+
+class _Edits:
+    """Line based edits to apply to the original source."""
+
+    def __init__(self):
+        self.insert_before = {}
+        self.insert_after = {}
+        self.replace = {}
+
+    def add_before(self, lineno, lines):
+        self.insert_before.setdefault(lineno, []).extend(lines)
+
+    def add_after(self, lineno, lines):
+        self.insert_after.setdefault(lineno, []).extend(lines)
+
+    def replace_lines(self, start, end, lines):
+        self.replace[start] = lines
+        for lineno in range(start + 1, end + 1):
+            self.replace[lineno] = []
+
+    def apply(self, source_lines):
+        output = []
+        for lineno, line in enumerate(source_lines, start=1):
+            output.extend(self.insert_before.get(lineno, []))
+            output.extend(self.replace.get(lineno, [line]))
+            output.extend(self.insert_after.get(lineno, []))
+        return output
+
+
+class _ClassCompiler:
+    """Compile the prefabs for a single module."""
+
+    def __init__(self, module, tree):
+        self.module = module
+        self.tree = tree
+        self.edits = _Edits()
+        # class name -> {field name: _FieldSource}
+        self.field_sources = {}
+        # class name -> ast.ClassDef
+        self.class_nodes = {}
+        # Import statements needed by the compiled methods
+        self.imports = set()
+
+    def prelude_name(self, cls_name, field_name, kind):
+        return f"_prefab_{cls_name}_{field_name}_{kind}"
+
+    def compiled_classes(self):
+        for node in self.tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            cls = getattr(self.module, node.name, None)
+            if (
+                isinstance(cls, type)
+                and cls.__dict__.get(INTERNAL_DICT) is not None
+                and cls.__module__ == self.module.__name__
+                and any(_is_prefab_decorator(dec) for dec in node.decorator_list)
+            ):
+                yield node, cls
+
+    def defining_class(self, cls, field_name):
+        for base in cls.__mro__:
+            internals = base.__dict__.get(INTERNAL_DICT)
+            if internals and field_name in internals["local_attributes"]:
+                return base
+        raise PrefabError(f"Could not find the definition of {field_name!r}")
+
+    def field_source(self, cls, field_name):
+        base = self.defining_class(cls, field_name)
+        if (
+            base.__module__ != self.module.__name__
+            or base.__name__ not in self.field_sources
+        ):
+            return None, None
+        return base, self.field_sources[base.__name__][field_name]
+
+    def type_source(self, cls, field_name):
+        # Types can be changed by __prefab_post_init__ annotations
+        post_init = getattr(cls, POST_INIT_FUNC, None)
+        if field_name in getattr(post_init, "__annotations__", {}):
+            for base in cls.__mro__:
+                node = self.class_nodes.get(base.__name__)
+                if node is None or POST_INIT_FUNC not in base.__dict__:
+                    continue
+                for item in node.body:
+                    if (
+                        isinstance(item, ast.FunctionDef)
+                        and item.name == POST_INIT_FUNC
+                    ):
+                        arguments = item.args
+                        for arg in arguments.args + arguments.kwonlyargs:
+                            if arg.arg == field_name and arg.annotation:
+                                return ast.unparse(arg.annotation)
+                break
+            return None
+
+        _, source = self.field_source(cls, field_name)
+        return None if source is None else source.type
+
+    def read_fields(self, node, cls):
+        """
+        Find the source of each attribute definition and remove the values
+        from the class body.
+        """
+        local_names = cls.__dict__[INTERNAL_DICT]["local_attributes"].keys()
+        sources = {name: _FieldSource() for name in local_names}
+
+        for item in node.body:
+            indent = " " * item.col_offset
+            if (
+                isinstance(item, ast.AnnAssign)
+                and isinstance(item.target, ast.Name)
+                and item.target.id in local_names
+            ):
+                name = item.target.id
+                field_source = sources[name]
+                field_source.type = ast.unparse(item.annotation)
+                if item.value is not None:
+                    _read_value(field_source, item.value)
+                    self.edits.replace_lines(
+                        item.lineno,
+                        item.end_lineno,
+                        [f"{indent}{name}: {field_source.type}\n"],
+                    )
+            elif (
+                isinstance(item, ast.Assign)
+                and len(item.targets) == 1
+                and isinstance(item.targets[0], ast.Name)
+            ):
+                name = item.targets[0].id
+                if name in local_names:
+                    _read_value(sources[name], item.value)
+                    self.edits.replace_lines(item.lineno, item.end_lineno, [])
+                elif name == "__slots__" and isinstance(item.value, ast.Call):
+                    slots = {}
+                    slot_types = []
+                    for kw in item.value.keywords:
+                        field_source = sources[kw.arg]
+                        _read_value(field_source, kw.value)
+                        doc = None
+                        if _is_call_to(kw.value, ATTRIBUTE_FUNCNAME):
+                            for attrib_kw in kw.value.keywords:
+                                if attrib_kw.arg == "doc":
+                                    doc = ast.unparse(attrib_kw.value)
+                        slots[kw.arg] = doc
+                        if field_source.type is not None:
+                            slot_types.append(
+                                f"{indent}{kw.arg}: {field_source.type}\n"
+                            )
+                    slot_dict = ", ".join(f"{k!r}: {v}" for k, v in slots.items())
+                    self.edits.replace_lines(
+                        item.lineno,
+                        item.end_lineno,
+                        [f"{indent}__slots__ = {{{slot_dict}}}\n", *slot_types],
+                    )
+
+        self.field_sources[node.name] = sources
+
+    def method_source(self, cls, maker, indent, prelude_used):
+        code, globs = maker.generator(cls)
+
+        replacements = {
+            "__prefab_setattr_func": "object.__setattr__",
+        }
+        for lazy_name, (compiled_name, import_line) in LAZY_IMPORTS.items():
+            if lazy_name in code:
+                replacements[lazy_name] = compiled_name
+                self.imports.add(import_line)
+        attributes = cls.__dict__[INTERNAL_DICT]["attributes"]
+        for name in attributes:
+            type_name = f"_{name}_type"
+            if type_name in globs:
+                type_src = self.type_source(cls, name)
+                type_pattern = rf": {re.escape(type_name)}(?!\w)"
+                type_value = "" if type_src is None else f": {type_src!r}"
+                code = re.sub(type_pattern, type_value, code)
+
+            for kind in ("default", "factory"):
+                glob_name = f"_{name}_{kind}"
+                if glob_name not in globs:
+                    continue
+                base, source = self.field_source(cls, name)
+                if source is None:
+                    raise PrefabError(
+                        f"Can not compile {cls.__name__!r}, the {kind} for "
+                        f"{name!r} is not defined in this module."
+                    )
+                prelude = self.prelude_name(base.__name__, name, kind)
+                prelude_used.add((base.__name__, name, kind))
+                replacements[glob_name] = prelude
+
+        pattern = "|".join(re.escape(k) for k in replacements)
+        code = re.sub(
+            rf"(?<!\w)({pattern})(?!\w)", lambda m: replacements[m.group(0)], code
+        )
+
+        return [f"{indent}{line}\n" for line in code.splitlines() if line.strip()]
+
+    def compile_class(self, node, cls, prelude_used):
+        internals = cls.__dict__[INTERNAL_DICT]
+        indent = " " * node.body[0].col_offset
+        defined_names = set()
+        for item in node.body:
+            if isinstance(item, ast.Assign):
+                defined_names.update(
+                    t.id for t in item.targets if isinstance(t, ast.Name)
+                )
+
+        # Remove the decorator
+        for dec in node.decorator_list:
+            if _is_prefab_decorator(dec):
+                self.edits.replace_lines(dec.lineno, dec.end_lineno, [])
+
+        new_lines = ["\n"]
+        # Classes created with slots=True have slots that are not in the source
+        if "__slots__" in cls.__dict__ and "__slots__" not in defined_names:
+            new_lines.append(f"{indent}__slots__ = {cls.__slots__!r}\n")
+        fields = getattr(cls, FIELDS_ATTRIBUTE)
+        new_lines.append(f"{indent}{FIELDS_ATTRIBUTE} = {fields!r}\n")
+        if (
+            "__match_args__" in cls.__dict__
+            and "__match_args__" not in defined_names
+        ):
+            new_lines.append(f"{indent}__match_args__ = {tuple(fields)!r}\n")
+
+        if INTERN_TABLE_ATTRIBUTE in cls.__dict__:
+            new_lines.append(
+                f"{indent}{INTERN_TABLE_ATTRIBUTE} = {INTERN_TABLE_NAME}()\n"
+            )
+            self.imports.add(INTERN_TABLE_IMPORT)
+        if POOL_ATTRIBUTE in cls.__dict__:
+            pool_size = cls.__dict__[POOL_ATTRIBUTE].size
+            new_lines.append(f"{indent}{POOL_ATTRIBUTE} = {POOL_NAME}({pool_size!r})\n")
+            self.imports.add(POOL_IMPORT)
+
+        for maker in internals["methods"].values():
+            new_lines.append("\n")
+            new_lines.extend(self.method_source(cls, maker, indent, prelude_used))
+
+        self.edits.add_after(node.end_lineno, new_lines)
+
+    def compile(self, source_lines):
+        classes = list(self.compiled_classes())
+        if not classes:
+            return "".join(source_lines)
+
+        for node, cls in classes:
+            self.class_nodes[node.name] = node
+            self.read_fields(node, cls)
+
+        prelude_used = set()
+        for node, cls in classes:
+            self.compile_class(node, cls, prelude_used)
+
+        # Defaults and factories are evaluated once before the class statement
+        for node, cls in classes:
+            prelude = []
+            for name, source in self.field_sources[node.name].items():
+                for kind, value in (
+                    ("default", source.default),
+                    ("factory", source.default_factory),
+                ):
+                    if (node.name, name, kind) in prelude_used:
+                        prelude_name = self.prelude_name(node.name, name, kind)
+                        prelude.append(f"{prelude_name} = {value}\n")
+            if prelude:
+                first_line = min(
+                    [node.lineno, *(dec.lineno for dec in node.decorator_list)]
+                )
+                self.edits.add_before(first_line, [*prelude, "\n"])
+
+        if self.imports:
+            self.edits.add_before(
+                self.import_line(), [f"{line}\n" for line in sorted(self.imports)]
+            )
+
+        output = "".join(self.edits.apply(source_lines))
+        return _remove_unused_imports(output)
+
+    def import_line(self):
+        """Line number after any docstring and __future__ imports"""
+        for i, item in enumerate(self.tree.body):
+            if i == 0 and isinstance(item, ast.Expr):
+                if isinstance(item.value, ast.Constant):
+                    continue
+            if isinstance(item, ast.ImportFrom) and item.module == "__future__":
+                continue
+            decorators = getattr(item, "decorator_list", [])
+            return min([item.lineno, *(dec.lineno for dec in decorators)])
+        return len(self.tree.body) and self.tree.body[-1].end_lineno + 1
+
+
+def _remove_unused_imports(source):
+    tree = ast.parse(source)
+    used_names = {
+        node.id for node in ast.walk(tree) if isinstance(node, ast.Name)
+    }
+    edits = _Edits()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module == "prefab_classes":
+            names = [
+                alias
+                for alias in node.names
+                if (alias.asname or alias.name) in used_names
+                or alias.name not in PREFAB_IMPORT_NAMES
+            ]
+            if len(names) == len(node.names):
+                continue
+            if names:
+                import_names = ", ".join(
+                    alias.name
+                    if alias.asname is None
+                    else f"{alias.name} as {alias.asname}"
+                    for alias in names
+                )
+                new_lines = [f"from prefab_classes import {import_names}\n"]
+            else:
+                new_lines = []
+            edits.replace_lines(node.lineno, node.end_lineno, new_lines)
+
+    return "".join(edits.apply(source.splitlines(keepends=True)))
+
+
+def compile_module(module_name):
+    """
+    Get the source of a module with the prefabs replaced by regular classes
+    with the generated methods written out in full.
+
+    :param module_name: importable name of the module to compile
+    :return: source code of the compiled module
+    """
+    module = importlib.import_module(module_name)
+    with tokenize.open(module.__file__) as f:
+        source = f.read()
+
+    source_lines = source.splitlines(keepends=True)
+    tree = ast.parse(source)
+
+    return _ClassCompiler(module, tree).compile(source_lines)
+
+
+def main(argv=None):
+    import argparse
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(
+        prog="python -m prefab_classes.compile",
+        description="Write out modules with prefabs compiled to regular classes.",
+    )
+    parser.add_argument("modules", nargs="+", help="names of modules to compile")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        help="folder for the compiled modules, if not given output is printed",
+    )
+
+    args = parser.parse_args(argv)
+
+    for module_name in args.modules:
+        output = compile_module(module_name)
+        if args.output_dir is None:
+            sys.stdout.write(output)
+            continue
+
+        module_file = Path(sys.modules[module_name].__file__)
+        out_path = Path(args.output_dir, *module_name.split("."))
+        if module_file.name == "__init__.py":
+            out_path = out_path / module_file.name
+        else:
+            out_path = out_path.with_suffix(".py")
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(output)
+
+
+if __name__ == "__main__":
+    main()
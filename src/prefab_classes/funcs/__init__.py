@@ -20,7 +20,7 @@
 # SOFTWARE.
 # ==============================================================================
 
-from .._shared import FIELDS_ATTRIBUTE
+from .._shared import FIELDS_ATTRIBUTE, INTERN_TABLE_ATTRIBUTE, POOL_ATTRIBUTE
 
 from ducktools.lazyimporter import LazyImporter, MultiFromImport
 
@@ -38,7 +38,23 @@ __all__ = [
     "is_prefab",
     "is_prefab_instance",
     "as_dict",
+    "as_dicts",
+    "as_tuples",
+    "from_dict",
+    "from_rows",
+    "from_columns",
+    "make_trusted",
     "to_json",
+    "to_json_stream",
+    "to_columns",
+    "sort_key",
+    "intern_stats",
+    "clear_interned",
+    "pool_stats",
+    "clear_pool",
+    "lazy_repr",
+    "as_log_fields",
+    "make_log_filter",
 ]
 
 
@@ -48,11 +64,22 @@ _laz = LazyImporter(
             "._cache_funcs",
             [
                 "as_dict_cache",
+                "as_dict_recursive_cache",
+                "as_dict_dispatch",
+                "as_tuple_dispatch",
+                "from_dict_cache",
+                "from_rows_cache",
+                "from_columns_cache",
+                "trusted_constructor_cache",
+                "sort_key_cache",
+                "to_columns_cache",
+                "to_structured_array_cache",
                 "as_dict_json_wrapper",
                 "get_json_encoder",
                 "merge_defaults",
             ],
-        )
+        ),
+        MultiFromImport("._log_funcs", ["PrefabLogFilter"]),
     ],
     globs=globals(),
 )
@@ -85,20 +112,154 @@ def is_prefab_instance(o):
     return hasattr(type(o), FIELDS_ATTRIBUTE)
 
 
-def as_dict(inst, *, excludes: None | tuple[str, ...] = None) -> dict[str, object]:
+def as_dict(
+    inst,
+    *,
+    excludes: None | tuple[str, ...] = None,
+    recurse: bool = False,
+) -> dict[str, object]:
     """
-    Represent the prefab as a dictionary of attribute names stuband values.
+    Represent the prefab as a dictionary of attribute names and values.
     Exclude any keys listed in `excludes`
 
-    This **does not** recurse.
+    By default this **does not** recurse. With `recurse=True` any prefabs
+    and lists, tuples or dicts in the fields are also converted and
+    `excludes` applies to every prefab encountered. Fields annotated
+    as str, int, float or bool are assumed to hold that type.
 
     :param inst: instance of prefab class
     :param excludes: tuple of field names to exclude from the resulting dict
+    :param recurse: convert nested prefabs and containers
     :return: dictionary {attribute_name: attribute_value, ...}
     """
+    if recurse:
+        return _laz.as_dict_recursive_cache(inst.__class__, excludes)(inst)
     return _laz.as_dict_cache(inst.__class__, excludes)(inst)
 
 
+def as_dicts(
+    instances,
+    *,
+    excludes: None | tuple[str, ...] = None,
+    lazy: bool = False,
+):
+    """
+    Represent each prefab in an iterable as a dictionary of attribute
+    names and values, as with `as_dict`.
+
+    The converter for each class is only looked up once so this is much
+    faster than calling `as_dict` in a loop. The instances may be of
+    different prefab classes. This does not recurse.
+
+    :param instances: iterable of prefab instances
+    :param excludes: tuple of field names to exclude from the resulting dicts
+    :param lazy: return a generator instead of a list
+    :return: list or generator of dictionaries
+    """
+    converters = _laz.as_dict_dispatch(excludes)
+    if lazy:
+        return (converters[type(inst)](inst) for inst in instances)
+    return [converters[type(inst)](inst) for inst in instances]
+
+
+def as_tuples(instances, *, lazy: bool = False):
+    """
+    Represent each prefab in an iterable as a tuple of attribute values
+    in the order of PREFAB_FIELDS.
+
+    The instances may be of different prefab classes. This does not recurse.
+
+    :param instances: iterable of prefab instances
+    :param lazy: return a generator instead of a list
+    :return: list or generator of tuples
+    """
+    converters = _laz.as_tuple_dispatch()
+    if lazy:
+        return (converters[type(inst)](inst) for inst in instances)
+    return [converters[type(inst)](inst) for inst in instances]
+
+
+def from_dict(cls, data: dict[str, object]):
+    """
+    Create an instance of a prefab class from a dictionary of attribute
+    names and values, the reverse of `as_dict`.
+
+    Missing values use the attribute defaults and keys that are not
+    attributes are ignored. Dicts for fields annotated as a prefab class,
+    an optional prefab class, list[Prefab] or dict[str, Prefab] are
+    converted recursively. String annotations are evaluated when the
+    converter is first built and a TypeError is raised if they can not
+    be resolved.
+
+    The class is called with the values so a user defined __init__ is used,
+    it must accept the fields as arguments as the generated __init__ would.
+
+    :param cls: prefab class to create
+    :param data: dictionary {attribute_name: attribute_value, ...}
+    :return: instance of cls
+    """
+    return _laz.from_dict_cache(cls)(data)
+
+
+def from_rows(cls, rows) -> list:
+    """
+    Create a list of instances of a prefab class from an iterable of rows
+    of values, such as the results from a database cursor.
+
+    Each row must contain a value for every field that is included in
+    __init__, in the order the fields are defined. Fields not included in
+    __init__ are set to their defaults and None values for fields with a
+    default_factory are replaced by the result of the factory.
+
+    Instances are created without calling __init__ and fields are set
+    directly, unless the class defines its own __init__, __prefab_pre_init__
+    or __prefab_post_init__ or is interned in which case the class is called
+    with the values of each row.
+
+    :param cls: prefab class to create
+    :param rows: iterable of sequences of values for the __init__ fields
+    :return: list of instances of cls
+    """
+    return _laz.from_rows_cache(cls)(rows)
+
+
+def from_columns(cls, columns: dict[str, object]) -> list:
+    """
+    Create a list of instances of a prefab class from a dictionary of
+    columns of values, the reverse of `to_columns`.
+
+    Missing columns use the attribute defaults and keys that are not
+    attributes are ignored. As with `from_rows` instances are created
+    without calling __init__ unless the class defines its own __init__,
+    has pre or post init methods or is interned.
+
+    :param cls: prefab class to create
+    :param columns: dictionary of {field_name: sequence_of_values, ...}
+                    all sequences must be the same length
+    :return: list of instances of cls
+    """
+    return _laz.from_columns_cache(cls)(columns)
+
+
+def make_trusted(cls) -> Callable[..., object]:
+    """
+    Get a constructor for a prefab class that takes a value for every field
+    in PREFAB_FIELDS order and stores them on a new instance.
+
+    This is intended for data that is already known to be valid, such as
+    values that were taken from another instance. __init__ is not called
+    so there are no default values, default factories or pre/post init
+    calls. Frozen classes are supported.
+
+    For classes created with `trusted=True` this is the generated
+    `__prefab_from_values__` classmethod.
+
+    :param cls: prefab class
+    :return: function taking field values that returns an instance of cls
+    """
+    return _laz.trusted_constructor_cache(cls)
+
+
 def to_json(
     inst,
     *,
@@ -141,3 +302,214 @@ def to_json(
         else:
             default_func = _laz.merge_defaults(dict_converter, default)
             return dumps_func(inst, default=default_func, **kwargs)
+
+
+def to_json_stream(
+    obj,
+    fp,
+    *,
+    excludes: None | tuple[str, ...] = None,
+    chunk_size: int = 65536,
+    encoding: None | str = None,
+) -> None:
+    """
+    Write an object containing prefabs as JSON to a file-like object
+    without building the whole document in memory.
+
+    Output from the basic encoder's iterencode is collected into chunks
+    of roughly chunk_size characters before each write.
+
+    :param obj: prefab instance or container of prefab instances
+    :param fp: object with a write method, such as a file or socket file
+    :param excludes: tuple of attribute names to exclude from json
+                     **note that these attribute names will be excluded
+                     from all prefabs encountered during serialization**
+    :param chunk_size: number of characters to collect before each write
+    :param encoding: if given, write bytes in this encoding (eg: 'utf-8')
+                     instead of str
+    """
+    encoder = _laz.get_json_encoder(excludes)
+    write = fp.write
+
+    chunks = []
+    size = 0
+    for chunk in encoder.iterencode(obj):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            data = "".join(chunks)
+            write(data if encoding is None else data.encode(encoding))
+            chunks.clear()
+            size = 0
+
+    if chunks:
+        data = "".join(chunks)
+        write(data if encoding is None else data.encode(encoding))
+
+
+def to_columns(
+    instances,
+    fields: None | tuple[str, ...] = None,
+    *,
+    cls=None,
+    numpy: bool = False,
+):
+    """
+    Convert a collection of prefab instances of the same class into columns
+    of values for each field.
+
+    Fields annotated as int, float or bool give `array.array` columns
+    (typecodes 'q', 'd' and 'b'), unless the values do not fit the
+    annotation. Other fields give lists.
+
+    With `numpy=True` a NumPy structured array is returned instead,
+    this requires NumPy to be installed.
+
+    :param instances: iterable of instances of one prefab class
+    :param fields: names of the fields to include, defaults to all fields
+    :param cls: prefab class of the instances, by default the class of
+                the first instance - required if instances may be empty
+    :param numpy: return a NumPy structured array
+    :return: dictionary of {field_name: column, ...} or structured array
+    """
+    if not isinstance(instances, (list, tuple)):
+        instances = list(instances)
+
+    if fields is not None:
+        fields = tuple(fields)
+
+    if cls is None:
+        if not instances:
+            raise ValueError("cls must be given if there are no instances")
+        cls = type(instances[0])
+
+    if numpy:
+        return _laz.to_structured_array_cache(cls, fields)(instances)
+    return _laz.to_columns_cache(cls, fields)(instances)
+
+
+def intern_stats(cls) -> dict[str, int | float]:
+    """
+    Get statistics for the table of live instances of an interned prefab.
+
+    :param cls: prefab class created with intern=True
+    :return: dictionary with the number of live instances as 'size',
+             'hits', 'misses' and 'hit_rate' for calls to the class
+    """
+    return _get_intern_table(cls).stats()
+
+
+def clear_interned(cls) -> None:
+    """
+    Clear the table of live instances of an interned prefab and reset its
+    statistics. Existing instances are unaffected but will no longer be
+    returned for new calls.
+
+    :param cls: prefab class created with intern=True
+    """
+    _get_intern_table(cls).clear()
+
+
+def _get_intern_table(cls):
+    try:
+        return cls.__dict__[INTERN_TABLE_ATTRIBUTE]
+    except (AttributeError, KeyError):
+        raise TypeError(f"cls should be an interned prefab class, not {cls}")
+
+
+def pool_stats(cls) -> dict[str, int | float]:
+    """
+    Get statistics for the pool of released instances of a pooled prefab.
+
+    :param cls: prefab class created with pool set
+    :return: dictionary with the maximum pool 'size', the number of
+             'available' instances, 'hits' and 'misses' for new instances,
+             the number of released instances 'dropped' as the pool was full
+             and the 'hit_rate'
+    """
+    return _get_pool(cls).stats()
+
+
+def clear_pool(cls) -> None:
+    """
+    Remove all released instances from the pool of a pooled prefab and
+    reset its statistics.
+
+    :param cls: prefab class created with pool set
+    """
+    _get_pool(cls).clear()
+
+
+def _get_pool(cls):
+    try:
+        return cls.__dict__[POOL_ATTRIBUTE]
+    except (AttributeError, KeyError):
+        raise TypeError(f"cls should be a pooled prefab class, not {cls}")
+
+
+class _LazyRepr:
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __repr__(self):
+        return repr(self.obj)
+
+    __str__ = __repr__
+
+
+def lazy_repr(inst) -> _LazyRepr:
+    """
+    Wrap an instance so its __repr__ is only called when the wrapper is
+    formatted. Pass the result as an argument to a logging call instead
+    of formatting the instance at the call site.
+
+    Example: logger.debug("Received %s", lazy_repr(event))
+
+    :param inst: instance to represent
+    :return: wrapper whose str and repr are the repr of inst
+    """
+    return _LazyRepr(inst)
+
+
+def as_log_fields(inst) -> dict[str, object]:
+    """
+    Get the fields of a prefab instance, or of an instance wrapped by
+    lazy_repr, as a flat dictionary for structured log handlers.
+
+    :param inst: instance of prefab class or the result of lazy_repr
+    :return: dictionary {attribute_name: attribute_value, ...}
+    """
+    if type(inst) is _LazyRepr:
+        inst = inst.obj
+    return _laz.as_dict_cache(inst.__class__)(inst)
+
+
+def make_log_filter(attribute: str = "prefab_fields"):
+    """
+    Create a logging.Filter that stores as_log_fields for every prefab
+    argument of a log record on the record under `attribute`. This is a
+    list for positional arguments or a dict for a mapping argument.
+
+    Attach the filter to a handler rather than a logger so the fields are
+    only gathered for records that are emitted.
+
+    :param attribute: name of the record attribute for the fields
+    :return: logging.Filter instance
+    """
+    return _laz.PrefabLogFilter(attribute=attribute)
+
+
+def sort_key(cls, *fields: str) -> Callable[[object], object]:
+    """
+    Get a compiled key function for sorting instances of a prefab class.
+
+    The key functions are cached for each class and set of fields.
+
+    :param cls: prefab class
+    :param fields: names of the fields to sort by, in order of priority
+                   if no fields are given the fields used in __eq__ are used
+    :return: key function for use with sorted, list.sort, min or max
+    """
+    return _laz.sort_key_cache(cls, fields)
@@ -20,9 +20,32 @@
 # SOFTWARE.
 # ==============================================================================
 
+from array import array
 from functools import lru_cache
+from itertools import repeat
+from types import MemberDescriptorType
 
-from .._shared import FIELDS_ATTRIBUTE
+from .._shared import (
+    FIELDS_ATTRIBUTE,
+    INTERNAL_DICT,
+    NOTHING,
+    PRE_INIT_FUNC,
+    POST_INIT_FUNC,
+    FROM_VALUES_FUNC,
+    POOL_ATTRIBUTE,
+)
+from .._method_generators import is_interned, is_pooled
+
+# Values of these types are used as they are when converting to builtins
+ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Typecodes and dtypes used for columns of fields annotated with these types
+ARRAY_TYPECODES = {int: "q", float: "d", bool: "b"}
+NUMPY_DTYPES = {int: "i8", float: "f8", bool: "?"}
+
+# Maximum number of classes held by the per class converter dicts,
+# matching the default maxsize of lru_cache
+CONVERTER_CACHE_SIZE = 128
 
 
 @lru_cache
@@ -46,6 +69,558 @@ def as_dict_cache(cls, excludes=None):
     return method
 
 
+@lru_cache
+def as_tuple_cache(cls):
+    try:
+        attrib_names = getattr(cls, FIELDS_ATTRIBUTE)
+    except AttributeError:
+        raise TypeError(f"inst should be a prefab instance, not {cls}")
+
+    vals = "".join(f"obj.{item}, " for item in attrib_names)
+    funcdef = f"def astuple(obj): return ({vals})"
+    globs, locs = {}, {}
+    exec(funcdef, globs, locs)
+    method = locs["astuple"]
+    return method
+
+
+class _ConverterDispatch(dict):
+    """
+    Dictionary of {class: converter} that gets the converter for a class
+    the first time the class is looked up.
+
+    The dictionary is cleared once it holds CONVERTER_CACHE_SIZE classes so
+    that dynamically created classes are not kept alive indefinitely.
+    """
+
+    def __init__(self, get_converter, *args):
+        super().__init__()
+        self.get_converter = get_converter
+        self.args = args
+
+    def __missing__(self, cls):
+        if len(self) >= CONVERTER_CACHE_SIZE:
+            self.clear()
+        converter = self[cls] = self.get_converter(cls, *self.args)
+        return converter
+
+
+@lru_cache
+def as_dict_dispatch(excludes=None):
+    return _ConverterDispatch(as_dict_cache, excludes)
+
+
+@lru_cache
+def as_tuple_dispatch():
+    return _ConverterDispatch(as_tuple_cache)
+
+
+def _make_builtins_converter(cls, convert, excludes):
+    """
+    Make a function to convert an instance of cls to builtin types.
+    """
+    if cls is list:
+        return lambda value: [convert(item) for item in value]
+    elif cls is tuple:
+        return lambda value: tuple([convert(item) for item in value])
+    elif cls is dict:
+        return lambda value: {k: convert(v) for k, v in value.items()}
+
+    attrib_names = getattr(cls, FIELDS_ATTRIBUTE, None)
+    if attrib_names is None:
+        # Other objects are left for the serializer to handle
+        return lambda value: value
+
+    internals = cls.__dict__.get(INTERNAL_DICT)
+    attributes = {} if internals is None else internals["attributes"]
+
+    items = []
+    for name in attrib_names:
+        if excludes and name in excludes:
+            continue
+        attrib = attributes.get(name)
+        # Fields annotated with an atomic type are assumed to contain that type
+        if attrib is not None and attrib._type in ATOMIC_TYPES:
+            items.append(f"'{name}': obj.{name}")
+        else:
+            items.append(f"'{name}': _convert(obj.{name})")
+
+    out_dict = f"{{{', '.join(items)}}}"
+    funcdef = f"def asdict(obj): return {out_dict}"
+    globs, locs = {"_convert": convert}, {}
+    exec(funcdef, globs, locs)
+    method = locs["asdict"]
+    return method
+
+
+@lru_cache
+def builtins_converter(excludes=None):
+    """
+    Get a function that converts prefabs and any lists, tuples or dicts
+    containing prefabs to builtin types.
+
+    A converter is compiled for each class the first time it is encountered,
+    up to CONVERTER_CACHE_SIZE classes after which the converters are
+    discarded and compiled again as needed.
+
+    :param excludes: tuple of field names to exclude from all prefabs
+    :return: conversion function
+    """
+    converters = {}
+
+    def convert(value):
+        cls = type(value)
+        if cls in ATOMIC_TYPES:
+            return value
+        try:
+            converter = converters[cls]
+        except KeyError:
+            if len(converters) >= CONVERTER_CACHE_SIZE:
+                converters.clear()
+            converter = _make_builtins_converter(cls, convert, excludes)
+            converters[cls] = converter
+        return converter(value)
+
+    return convert
+
+
+@lru_cache
+def as_dict_recursive_cache(cls, excludes=None):
+    if not hasattr(cls, FIELDS_ATTRIBUTE):
+        raise TypeError(f"inst should be a prefab instance, not {cls}")
+    return builtins_converter(excludes)
+
+
+def _structure_type(hint):
+    """
+    Get the prefab class and container type to build for a type hint.
+
+    :return: (container, prefab_class), container is None, list or dict
+             and prefab_class is None if no conversion is needed.
+    """
+    def is_prefab_class(t):
+        return isinstance(t, type) and hasattr(t, FIELDS_ATTRIBUTE)
+
+    if is_prefab_class(hint):
+        return None, hint
+
+    origin = getattr(hint, "__origin__", None)
+    args = getattr(hint, "__args__", ())
+
+    if origin in (list, dict) and args and is_prefab_class(args[-1]):
+        return origin, args[-1]
+
+    # Optional[Prefab] or Prefab | None, None values are passed through
+    if origin is None or getattr(origin, "_name", None) == "Union":
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1 and len(args) == 2:
+            return _structure_type(non_none[0])
+
+    return None, None
+
+
+def _resolve_type_hints(cls):
+    """
+    Get the evaluated type hints of a class that has string annotations,
+    as with `from __future__ import annotations`.
+
+    :return: {field name: type hint}
+    """
+    from typing import get_type_hints
+
+    try:
+        return get_type_hints(cls)
+    except Exception as e:
+        raise TypeError(
+            f"Could not resolve the type hints of {cls.__name__}: {e}"
+        ) from e
+
+
+@lru_cache
+def from_dict_cache(cls):
+    internals = cls.__dict__.get(INTERNAL_DICT)
+    if internals is None:
+        raise TypeError(f"cls should be a prefab class, not {cls}")
+
+    # String hints need to be evaluated to find the nested prefab classes
+    hints = {}
+    if any(isinstance(a._type, str) for a in internals["attributes"].values()):
+        hints = _resolve_type_hints(cls)
+
+    globs = {"_cls": cls, "_structure": from_dict_cache}
+
+    required = []
+    optional = []
+    conversions = []
+    args = []
+    kwargs = []
+
+    for name, attrib in internals["attributes"].items():
+        if not attrib.init:
+            continue
+
+        value = f"_v_{name}"
+        if attrib.default is not NOTHING:
+            globs[f"_{name}_default"] = attrib.default
+            optional.append(f"    {value} = data.get({name!r}, _{name}_default)")
+        elif attrib.default_factory is not NOTHING:
+            # None is replaced by the result of the factory in __init__
+            optional.append(f"    {value} = data.get({name!r})")
+        else:
+            required.append(f"        {value} = data[{name!r}]")
+
+        container, prefab_cls = _structure_type(hints.get(name, attrib._type))
+        if prefab_cls is not None:
+            globs[f"_{name}_type"] = prefab_cls
+            convert = f"_structure(_{name}_type)"
+            if container is None:
+                conversions.append(
+                    f"    if type({value}) is dict:\n"
+                    f"        {value} = {convert}({value})"
+                )
+            elif container is list:
+                conversions.append(
+                    f"    if type({value}) is list:\n"
+                    f"        _convert = {convert}\n"
+                    f"        {value} = [_convert(v) if type(v) is dict else v "
+                    f"for v in {value}]"
+                )
+            else:
+                conversions.append(
+                    f"    if type({value}) is dict:\n"
+                    f"        _convert = {convert}\n"
+                    f"        {value} = {{k: _convert(v) if type(v) is dict else v "
+                    f"for k, v in {value}.items()}}"
+                )
+
+        if attrib.kw_only:
+            kwargs.append(f"{name}={value}")
+        else:
+            args.append(value)
+
+    body = []
+    if required:
+        body.append("    try:")
+        body.extend(required)
+        body.append("    except KeyError as e:")
+        body.append(
+            f"        raise TypeError("
+            f"f'{cls.__name__} missing required field {{e.args[0]!r}}'"
+            f") from None"
+        )
+    body.extend(optional)
+    body.extend(conversions)
+    arguments = ", ".join(args + kwargs)
+    # A user defined __init__ is called with the field values
+    # in the same way as the generated __init__
+    body.append(f"    return _cls({arguments})")
+
+    funcdef = "def from_dict(data):\n" + "\n".join(body) + "\n"
+    locs = {}
+    exec(funcdef, globs, locs)
+    method = locs["from_dict"]
+    return method
+
+
+def _bulk_constructor(cls, funcname, argname, header, loop_values):
+    """
+    Make a function that creates a list of instances of cls in one loop.
+
+    Unless the class defines its own __init__, has pre or post init methods
+    or is interned the instances are created with __new__, or taken from the
+    pool of a pooled class, and the field values are stored directly without
+    calling __init__. Values for fields with a default factory that are None
+    are replaced by the result of the factory as in __init__. Otherwise the
+    class is called with the values for each instance.
+
+    :param cls: prefab class
+    :param funcname: name of the generated function
+    :param argname: name of the argument of the generated function
+    :param header: lines that set up the loop, may use the globals
+                   _{name}_default and _{name}_factory
+    :param loop_values: iterable of tuples of values for the init fields
+    :return: (function source, globals)
+    """
+    internals = cls.__dict__.get(INTERNAL_DICT)
+    if internals is None:
+        raise TypeError(f"cls should be a prefab class, not {cls}")
+
+    attributes = internals["attributes"]
+    init_fields = [name for name, attrib in attributes.items() if attrib.init]
+
+    new = cls.__new__
+    if is_pooled(cls):
+        # The pooling __new__ takes the arguments for __init__
+        pool = cls.__dict__.get(POOL_ATTRIBUTE)
+        new = object.__new__ if pool is None else pool.acquire
+
+    globs = {"_cls": cls, "_new": new, "_setattr": object.__setattr__}
+    for name, attrib in attributes.items():
+        if attrib.default is not NOTHING:
+            globs[f"_{name}_default"] = attrib.default
+        elif attrib.default_factory is not NOTHING:
+            globs[f"_{name}_factory"] = attrib.default_factory
+
+    if init_fields:
+        targets = "".join(f"_v_{name}, " for name in init_fields)
+        loop = f"    for {targets}in {loop_values}:"
+    else:
+        loop = f"    for _ in {loop_values}:"
+
+    body = []
+    if (
+        "__init__" not in internals["methods"]
+        or hasattr(cls, PRE_INIT_FUNC)
+        or hasattr(cls, POST_INIT_FUNC)
+        or is_interned(cls)
+    ):
+        # A user defined __init__ or the init hooks need to run
+        # and interned classes need to look up existing instances
+        args = ", ".join(
+            f"{name}=_v_{name}" if attributes[name].kw_only else f"_v_{name}"
+            for name in init_fields
+        )
+        body.append(f"        _append(_cls({args}))")
+    else:
+        # Frozen or custom __setattr__ methods are bypassed
+        direct = cls.__setattr__ is object.__setattr__
+        body.append("        inst = _new(_cls)")
+        if not direct and not internals["slotted"]:
+            body.append("        _d = inst.__dict__")
+        for name, attrib in attributes.items():
+            if attrib.init:
+                value = f"_v_{name}"
+                if attrib.default_factory is not NOTHING:
+                    value = f"{value} if {value} is not None else _{name}_factory()"
+            elif attrib.default_factory is not NOTHING:
+                value = f"_{name}_factory()"
+            elif attrib.default is not NOTHING:
+                value = f"_{name}_default"
+            else:
+                continue
+
+            if direct:
+                body.append(f"        inst.{name} = {value}")
+            elif not (
+                internals["slotted"]
+                or isinstance(getattr(cls, name, None), MemberDescriptorType)
+            ):
+                body.append(f"        _d[{name!r}] = {value}")
+            else:
+                body.append(f"        _setattr(inst, {name!r}, {value})")
+        body.append("        _append(inst)")
+
+    code = (
+        f"def {funcname}({argname}):\n"
+        + "".join(f"{line}\n" for line in header)
+        + "    out = []\n"
+        + "    _append = out.append\n"
+        + f"{loop}\n"
+        + "\n".join(body)
+        + "\n    return out\n"
+    )
+    return code, globs
+
+
+@lru_cache
+def from_rows_cache(cls):
+    code, globs = _bulk_constructor(cls, "from_rows", "rows", [], "rows")
+    locs = {}
+    exec(code, globs, locs)
+    method = locs["from_rows"]
+    return method
+
+
+def _column_length(cls, columns, names):
+    """
+    Get the number of values in the columns given for a prefab class.
+    """
+    lengths = {len(columns[name]) for name in names if name in columns}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns for {cls.__name__!r} have different lengths")
+    elif not lengths:
+        raise ValueError(f"No columns given for {cls.__name__!r}")
+    return lengths.pop()
+
+
+@lru_cache
+def from_columns_cache(cls):
+    internals = cls.__dict__.get(INTERNAL_DICT)
+    if internals is None:
+        raise TypeError(f"cls should be a prefab class, not {cls}")
+
+    attributes = internals["attributes"]
+    init_fields = tuple(name for name, attrib in attributes.items() if attrib.init)
+
+    header = [
+        f"    _n = _column_length(_cls, columns, _init_fields)",
+    ]
+    required = []
+    for name in init_fields:
+        attrib = attributes[name]
+        if attrib.default is not NOTHING:
+            missing = f"_repeat(_{name}_default, _n)"
+        elif attrib.default_factory is not NOTHING:
+            missing = "_repeat(None, _n)"
+        else:
+            required.append(name)
+            continue
+        header.append(
+            f"    _c_{name} = columns[{name!r}] if {name!r} in columns else {missing}"
+        )
+
+    if required:
+        required_columns = ", ".join(f"{name!r}" for name in required)
+        header.append(f"    for _name in ({required_columns},):")
+        header.append("        if _name not in columns:")
+        header.append(
+            f"            raise TypeError("
+            f"f'{cls.__name__} missing required column {{_name!r}}'"
+            f")"
+        )
+        for name in required:
+            header.append(f"    _c_{name} = columns[{name!r}]")
+
+    loop_values = f"zip({''.join(f'_c_{name}, ' for name in init_fields)})"
+    code, globs = _bulk_constructor(cls, "from_columns", "columns", header, loop_values)
+    globs["_column_length"] = _column_length
+    globs["_init_fields"] = init_fields
+    globs["_repeat"] = repeat
+
+    locs = {}
+    exec(code, globs, locs)
+    method = locs["from_columns"]
+    return method
+
+
+@lru_cache
+def trusted_constructor_cache(cls):
+    internals = cls.__dict__.get(INTERNAL_DICT)
+    if internals is None:
+        raise TypeError(f"cls should be a prefab class, not {cls}")
+
+    # Classes made with trusted=True already have the constructor
+    if FROM_VALUES_FUNC in internals["methods"]:
+        return getattr(cls, FROM_VALUES_FUNC)
+
+    from .._method_generators import from_values_maker
+
+    code, globs = from_values_maker.generator(cls)
+    locs = {}
+    exec(code, globs, locs)
+    method = locs[FROM_VALUES_FUNC].__get__(None, cls)
+    return method
+
+
+@lru_cache
+def sort_key_cache(cls, fields=()):
+    try:
+        field_names = getattr(cls, FIELDS_ATTRIBUTE)
+    except AttributeError:
+        raise TypeError(f"cls should be a prefab class, not {cls}")
+
+    if fields:
+        for field in fields:
+            if field not in field_names:
+                raise ValueError(f"{field!r} is not a field of {cls.__name__!r}")
+    elif INTERNAL_DICT in cls.__dict__:
+        from .._method_generators import get_compare_fields
+
+        fields = get_compare_fields(cls)
+    else:
+        fields = field_names
+
+    if len(fields) == 1:
+        key = f"obj.{fields[0]}"
+    else:
+        key = "(" + "".join(f"obj.{field}, " for field in fields) + ")"
+    funcdef = f"def sort_key(obj): return {key}"
+    globs, locs = {}, {}
+    exec(funcdef, globs, locs)
+    method = locs["sort_key"]
+    return method
+
+
+def _column_fields(cls, fields):
+    """
+    Get the field names and their annotated types for column conversion.
+    """
+    try:
+        field_names = getattr(cls, FIELDS_ATTRIBUTE)
+    except AttributeError:
+        raise TypeError(f"instances should be prefab instances, not {cls}")
+
+    if fields is None:
+        fields = field_names
+    else:
+        for field in fields:
+            if field not in field_names:
+                raise ValueError(f"{field!r} is not a field of {cls.__name__!r}")
+
+    internals = cls.__dict__.get(INTERNAL_DICT)
+    attributes = {} if internals is None else internals["attributes"]
+
+    types = []
+    for name in fields:
+        attrib = attributes.get(name)
+        types.append(None if attrib is None else attrib._type)
+
+    return fields, types
+
+
+def _make_array(typecode, values):
+    """
+    Convert a list of values to a typed array, keeping the list if the
+    values don't fit the annotated type.
+    """
+    try:
+        return array(typecode, values)
+    except (OverflowError, TypeError):
+        return values
+
+
+@lru_cache
+def to_columns_cache(cls, fields=None):
+    fields, types = _column_fields(cls, fields)
+
+    lines = []
+    columns = []
+    for name, field_type in zip(fields, types):
+        lines.append(f"    _c_{name} = [obj.{name} for obj in instances]")
+        typecode = ARRAY_TYPECODES.get(field_type)
+        if typecode is None:
+            columns.append(f"'{name}': _c_{name}")
+        else:
+            columns.append(f"'{name}': _make_array({typecode!r}, _c_{name})")
+
+    lines.append(f"    return {{{', '.join(columns)}}}")
+    funcdef = "def to_columns(instances):\n" + "\n".join(lines) + "\n"
+    globs, locs = {"_make_array": _make_array}, {}
+    exec(funcdef, globs, locs)
+    method = locs["to_columns"]
+    return method
+
+
+@lru_cache
+def to_structured_array_cache(cls, fields=None):
+    import numpy
+
+    fields, types = _column_fields(cls, fields)
+
+    dtype = numpy.dtype(
+        [(name, NUMPY_DTYPES.get(t, "O")) for name, t in zip(fields, types)]
+    )
+    row = "".join(f"obj.{name}, " for name in fields)
+    funcdef = (
+        f"def to_array(instances):\n"
+        f"    return _np_array([({row}) for obj in instances], dtype=_dtype)\n"
+    )
+    globs, locs = {"_np_array": numpy.array, "_dtype": dtype}, {}
+    exec(funcdef, globs, locs)
+    method = locs["to_array"]
+    return method
+
+
 @lru_cache
 def as_dict_json_wrapper(excludes: None | tuple[str, ...] = None):
     def _as_dict_json_inner(inst):
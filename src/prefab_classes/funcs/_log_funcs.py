@@ -0,0 +1,67 @@
+# ==============================================================================
+# Copyright (c) 2022-2024 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==============================================================================
+
+# Logging support for prefabs, this is only imported when a filter is made
+# so that importing funcs does not import logging.
+
+import logging
+
+from . import _LazyRepr, as_log_fields, is_prefab_instance
+
+
+def _is_loggable(value):
+    if type(value) is _LazyRepr:
+        value = value.obj
+    return is_prefab_instance(value)
+
+
+class PrefabLogFilter(logging.Filter):
+    """
+    Logging filter that stores the fields of prefab arguments of a
+    log record as dictionaries on the record for structured handlers.
+
+    Filters attached to a handler only run for records that are emitted
+    so the dictionaries are not created for disabled log levels.
+    """
+
+    def __init__(self, name="", attribute="prefab_fields"):
+        super().__init__(name)
+        self.attribute = attribute
+
+    def filter(self, record):
+        if not super().filter(record):
+            return False
+
+        args = record.args
+        if isinstance(args, dict):
+            fields = {
+                key: as_log_fields(value)
+                for key, value in args.items()
+                if _is_loggable(value)
+            }
+        elif args:
+            fields = [as_log_fields(value) for value in args if _is_loggable(value)]
+        else:
+            fields = []
+
+        setattr(record, self.attribute, fields)
+        return True
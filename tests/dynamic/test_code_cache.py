@@ -0,0 +1,141 @@
+import os
+import sys
+import importlib
+
+import pytest
+
+from prefab_classes import enable_code_cache, disable_code_cache
+from prefab_classes._code_cache import CodeCache
+
+module_source = """
+from prefab_classes import prefab, attribute
+
+@prefab
+class Cached:
+    x: int
+    y: str = "cached"
+"""
+
+changed_source = """
+from prefab_classes import prefab, attribute
+
+@prefab
+class Cached:
+    x: int
+    y: str = "cached"
+    z: list = attribute(default_factory=list)
+"""
+
+
+@pytest.fixture
+def cache_module(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    module_name = "prefab_code_cache_example"
+    module_path = tmp_path / f"{module_name}.py"
+    module_path.write_text(module_source)
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield module_name, module_path
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop(module_name, None)
+        disable_code_cache()
+
+
+def fresh_import(module_name):
+    sys.modules.pop(module_name, None)
+    importlib.invalidate_caches()
+    return importlib.import_module(module_name)
+
+
+def test_cache_written_and_used(cache_module):
+    module_name, module_path = cache_module
+
+    cache = enable_code_cache()
+    mod = fresh_import(module_name)
+
+    inst = mod.Cached(1)
+    assert inst == mod.Cached(1)
+    assert repr(inst) == "Cached(x=1, y='cached')"
+
+    assert cache.misses == 3
+    assert cache.hits == 0
+
+    disable_code_cache()
+
+    cache_path = CodeCache.cache_path(module_name)
+    assert cache_path == str(
+        module_path.parent
+        / "__pycache__"
+        / f"{module_name}.{sys.implementation.cache_tag}.prefab"
+    )
+    assert os.path.exists(cache_path)
+
+    # A new cache instance loads the stored code from disk
+    cache = enable_code_cache()
+    mod = fresh_import(module_name)
+
+    inst = mod.Cached(1)
+    assert inst == mod.Cached(1)
+    assert repr(inst) == "Cached(x=1, y='cached')"
+
+    assert cache.misses == 0
+    assert cache.hits == 3
+
+
+def test_cache_invalidated(cache_module):
+    module_name, module_path = cache_module
+
+    enable_code_cache()
+    mod = fresh_import(module_name)
+    mod.Cached(1)
+    disable_code_cache()
+
+    module_path.write_text(changed_source)
+
+    cache = enable_code_cache()
+    mod = fresh_import(module_name)
+
+    inst = mod.Cached(1)
+    assert inst.z == []
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+
+def test_dont_write_bytecode(cache_module, monkeypatch):
+    module_name, module_path = cache_module
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+    enable_code_cache()
+    mod = fresh_import(module_name)
+    mod.Cached(1)
+    disable_code_cache()
+
+    assert not os.path.exists(CodeCache.cache_path(module_name))
+
+
+def test_no_cache_file_for_dynamic_module(monkeypatch):
+    import prefab_classes
+    from prefab_classes import build_prefab, attribute
+
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    cache_path = CodeCache.cache_path("prefab_classes._class_generator")
+    assert cache_path.startswith(os.path.dirname(prefab_classes.__file__))
+    # A stale file left by an older version must not be written to either
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+
+    cache = enable_code_cache()
+    try:
+        Dynamic = build_prefab("Dynamic", [("x", attribute())])
+        assert Dynamic.__module__ == "prefab_classes._class_generator"
+        assert Dynamic(1).x == 1
+        assert repr(Dynamic(1)) == "Dynamic(x=1)"
+        # Code for classes from build_prefab is never looked up or stored
+        assert cache.misses == 0
+        assert cache.hits == 0
+    finally:
+        disable_code_cache()
+
+    assert not os.path.exists(cache_path)
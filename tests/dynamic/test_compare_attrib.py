@@ -15,3 +15,48 @@ def test_compare_false():
     assert ex1 == ex2
     assert ex1 == ex3
     assert ex1 != ex4
+
+
+def test_compare_priority():
+    reads = []
+
+    class Tracked:
+        def __init__(self, name, value):
+            self.name = name
+            self.value = value
+
+        def __eq__(self, other):
+            reads.append(self.name)
+            return self.value == other.value
+
+    @prefab
+    class Record:
+        data: Tracked
+        id: int = attribute(compare_priority=1)
+        name: Tracked = None
+
+    a = Record(Tracked("data", [1, 2]), 1, Tracked("name", "a"))
+    b = Record(Tracked("data", [1, 2]), 2, Tracked("name", "a"))
+    c = Record(Tracked("data", [1, 2]), 1, Tracked("name", "a"))
+
+    # The id differs so data and name are never compared
+    assert a != b
+    assert reads == []
+
+    assert a == c
+    assert reads == ["data", "name"]
+
+
+def test_compare_identity():
+    nan = float("nan")
+
+    @prefab
+    class Value:
+        x: float
+
+    inst = Value(nan)
+    assert inst == inst
+    # Matches tuple comparison which checks identity first
+    assert inst == Value(nan)
+    assert inst != Value(float("nan"))
+    assert Value(1.0).__eq__(1.0) is NotImplemented
@@ -81,3 +81,14 @@ def test_double_decorate():
         @prefab
         class DoubleDecorated:
             pass
+
+
+def test_invalid_repr():
+    with pytest.raises(
+        PrefabError,
+        match="repr must be True, False, 'fast' or 'bounded', not 'short'.",
+    ):
+
+        @prefab(repr="short")
+        class InvalidRepr:
+            x: int
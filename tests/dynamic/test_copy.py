@@ -0,0 +1,126 @@
+import copy
+
+import pytest
+
+from prefab_classes import prefab, attribute, SlotAttributes
+
+
+def test_copy():
+    @prefab(copy=True)
+    class Copyable:
+        x: int
+        y: list = attribute(default_factory=list)
+
+    inst = Copyable(1, [1, 2])
+    inst.extra = "extra"
+
+    new = copy.copy(inst)
+    assert new == inst
+    assert new is not inst
+    assert new.y is inst.y
+    assert new.extra == "extra"
+
+
+def test_deepcopy():
+    @prefab(copy=True)
+    class Copyable:
+        x: int
+        y: list = attribute(default_factory=list)
+        z: str = "z"
+
+    inst = Copyable(1, [[1], 2])
+    inst.y.append(inst)
+
+    new = copy.deepcopy(inst)
+    assert new.x == 1 and new.z == "z"
+    assert new.y is not inst.y
+    assert new.y[0] == [1] and new.y[0] is not inst.y[0]
+    # Cycles are handled through the memo
+    assert new.y[2] is new
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_copy_frozen(slots):
+    @prefab(copy=True, frozen=True, slots=slots)
+    class Frozen:
+        x: int
+        y: list = attribute(default_factory=list)
+
+    inst = Frozen(1, [1])
+
+    shallow = copy.copy(inst)
+    assert shallow == inst
+    assert shallow.y is inst.y
+
+    deep = copy.deepcopy(inst)
+    assert deep == inst
+    assert deep.y is not inst.y
+
+    with pytest.raises(TypeError):
+        deep.x = 2
+
+
+def test_copy_slot_attributes():
+    @prefab(copy=True)
+    class Slotted:
+        __slots__ = SlotAttributes(x=attribute(), y=attribute(default=2))
+
+    inst = Slotted([1])
+    assert copy.copy(inst).x is inst.x
+    assert copy.deepcopy(inst).x == [1]
+    assert copy.deepcopy(inst).x is not inst.x
+
+
+def test_replace():
+    @prefab(copy=True, frozen=True)
+    class Event:
+        id: int
+        name: str
+        tags: list = attribute(default_factory=list)
+        source: str = attribute(default="app", kw_only=True)
+        count: int = attribute(default=0, init=False)
+
+    event = Event(1, "start", source="test")
+
+    new = event.__replace__(name="stop")
+    assert new == Event(1, "stop", source="test")
+    assert new.tags is event.tags
+
+    assert event.__replace__(source="other").source == "other"
+    assert event.__replace__() == event
+
+    with pytest.raises(TypeError):
+        event.__replace__(missing=1)
+
+    with pytest.raises(TypeError):
+        event.__replace__(count=1)
+
+
+def test_replace_exclude_field():
+    @prefab(copy=True)
+    class Excluded:
+        x: int
+        y: int = attribute(default=0, exclude_field=True)
+
+        def __prefab_post_init__(self, y):
+            self.x += y
+
+    inst = Excluded(1, 2)
+    assert inst.x == 3
+    assert inst.__replace__(y=1).x == 4
+    assert inst.__replace__().x == 3
+
+
+def test_replace_user_init():
+    @prefab(copy=True)
+    class UserInit:
+        x: int
+        y: int = 0
+
+        def __init__(self, value):
+            self.__prefab_init__(value, value)
+
+    inst = UserInit(1)
+    new = inst.__replace__(y=2)
+    assert type(new) is UserInit
+    assert (new.x, new.y) == (1, 2)
@@ -0,0 +1,200 @@
+import copy
+import gc
+import pickle
+
+import pytest
+
+from prefab_classes import prefab, attribute, PrefabError
+from prefab_classes.funcs import intern_stats, clear_interned, from_dict, from_rows
+
+
+# Pickled classes must be importable from the module
+@prefab(frozen=True, intern=True)
+class PickledUnit:
+    name: str
+    scale: float = attribute(default=1.0, kw_only=True)
+
+
+class PlainPickledUnit(PickledUnit):
+    pass
+
+
+def test_intern():
+    @prefab(frozen=True, intern=True)
+    class Unit:
+        name: str
+        scale: float = 1.0
+
+    a = Unit("m")
+    b = Unit("m", 1.0)
+    c = Unit(name="m")
+    assert a is b is c
+    d = Unit("cm", 0.01)
+    assert d is not a
+
+    assert intern_stats(Unit) == {"size": 2, "hits": 2, "misses": 2, "hit_rate": 0.5}
+
+    with pytest.raises(TypeError):
+        a.name = "km"
+
+
+def test_intern_weak():
+    @prefab(frozen=True, intern=True)
+    class Unit:
+        name: str
+
+    a = Unit("m")
+    assert intern_stats(Unit)["size"] == 1
+
+    del a
+    gc.collect()
+    assert intern_stats(Unit)["size"] == 0
+
+
+def test_intern_clear():
+    @prefab(frozen=True, intern=True)
+    class Unit:
+        name: str
+
+    a = Unit("m")
+    clear_interned(Unit)
+    assert intern_stats(Unit) == {"size": 0, "hits": 0, "misses": 0, "hit_rate": 0.0}
+    assert Unit("m") is not a
+    assert Unit("m") == a
+
+
+def test_intern_slots():
+    @prefab(frozen=True, intern=True, slots=True)
+    class Point:
+        x: int
+        y: int = attribute(default=0, kw_only=True)
+
+    assert Point(1, y=2) is Point(1, y=2)
+    assert not hasattr(Point(1), "__dict__")
+
+
+def test_intern_post_init():
+    @prefab(frozen=True, intern=True)
+    class Currency:
+        code: str
+
+        def __prefab_post_init__(self, code):
+            self.code = code.upper()
+
+    assert Currency("gbp").code == "GBP"
+    assert Currency("gbp") is Currency("gbp")
+
+
+def test_intern_subclass():
+    @prefab(frozen=True, intern=True)
+    class Base:
+        x: int
+
+    @prefab(frozen=True)
+    class Child(Base):
+        y: int
+
+    assert Child(1, 2) is Child(1, 2)
+    assert Base(1) is not Child(1, 2)
+    assert intern_stats(Child)["hits"] == 1
+
+
+def test_intern_funcs():
+    @prefab(frozen=True, intern=True, copy=True)
+    class Unit:
+        name: str
+        scale: float = 1.0
+
+    a = Unit("m")
+    assert from_dict(Unit, {"name": "m"}) is a
+    assert from_rows(Unit, [("m", 1.0)])[0] is a
+    assert copy.copy(a) is a
+    assert copy.deepcopy(a) is a
+    assert a.__replace__() is a
+
+
+def test_intern_errors():
+    with pytest.raises(PrefabError):
+
+        @prefab(intern=True)
+        class NotFrozen:
+            x: int
+
+    with pytest.raises(PrefabError):
+
+        @prefab(frozen=True, intern=True)
+        class UserInit:
+            x: int
+
+            def __init__(self, x):
+                self.__prefab_init__(x)
+
+    with pytest.raises(TypeError):
+        intern_stats(object)
+
+
+def test_intern_plain_subclass():
+    @prefab(frozen=True, intern=True)
+    class Base:
+        x: int
+
+    class Plain(Base):
+        pass
+
+    # No instance of Base exists so __new__ is generated for Plain first
+    inst = Plain(1)
+    assert "__new__" in Plain.__dict__
+    assert Plain(1) is inst
+
+    constructor, args = inst.__reduce__()
+    assert constructor(*args) == inst
+
+
+def test_intern_pickle():
+    unit = PickledUnit("m", scale=2.0)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(unit, protocol=protocol)) is unit
+
+    plain = PlainPickledUnit("m", scale=2.0)
+    assert plain is not unit
+    assert pickle.loads(pickle.dumps(plain)) is plain
+
+    # Without a live instance the loaded instance is added to the table
+    data = pickle.dumps(PickledUnit("km"))
+    gc.collect()
+    loaded = pickle.loads(data)
+    assert PickledUnit("km") is loaded
+
+
+def test_intern_copy():
+    @prefab(frozen=True, intern=True)
+    class Unit:
+        name: str
+
+    unit = Unit("m")
+    assert copy.copy(unit) is unit
+    assert copy.deepcopy(unit) is unit
+    assert copy.deepcopy([unit])[0] is unit
+
+
+def test_intern_key_types():
+    @prefab(frozen=True, intern=True)
+    class Value:
+        x: object
+
+    one = Value(1)
+    assert Value(1) is one
+    assert Value(1.0) is not one
+    assert type(Value(1.0).x) is float
+    assert type(Value(True).x) is bool
+
+
+def test_intern_unhashable():
+    @prefab(frozen=True, intern=True)
+    class Value:
+        x: object
+
+    with pytest.raises(
+        TypeError, match="Arguments to interned class Value must be hashable"
+    ):
+        Value([1, 2])
@@ -0,0 +1,123 @@
+import sys
+import types
+
+import pytest
+
+from prefab_classes import prefab, build_prefab, attribute
+from prefab_classes import materialize, materialize_all
+from prefab_classes._shared import INTERNAL_DICT
+
+
+def is_generated(cls, name):
+    """Check if the method has been generated or is still the generator"""
+    maker = getattr(cls, INTERNAL_DICT)["methods"][name]
+    return cls.__dict__[name] is not maker
+
+
+def test_lazy_by_default():
+    @prefab
+    class Lazy:
+        x: int
+
+    assert not is_generated(Lazy, "__init__")
+    assert not is_generated(Lazy, "__repr__")
+    assert not is_generated(Lazy, "__eq__")
+
+
+def test_eager():
+    @prefab(eager=True, frozen=True, iter=True)
+    class Eager:
+        x: int
+
+    for name in ("__init__", "__repr__", "__eq__", "__iter__", "__setattr__"):
+        assert is_generated(Eager, name)
+        assert Eager.__dict__[name].__qualname__.endswith(f"Eager.{name}")
+
+    assert Eager(1) == Eager(1)
+
+
+def test_eager_build_prefab():
+    Eager = build_prefab("Eager", [("x", attribute())], eager=True)
+
+    assert is_generated(Eager, "__init__")
+    assert Eager(1).x == 1
+
+
+def test_materialize_class():
+    @prefab
+    class Lazy:
+        x: int
+
+    assert materialize(Lazy, methods=["__init__"]) == 1
+    assert is_generated(Lazy, "__init__")
+    assert not is_generated(Lazy, "__repr__")
+
+    assert materialize(Lazy) == 2
+    assert is_generated(Lazy, "__repr__")
+    assert is_generated(Lazy, "__eq__")
+
+    # Nothing left to generate
+    assert materialize(Lazy) == 0
+
+
+def test_materialize_module():
+    module = types.ModuleType("materialize_example")
+    sys.modules[module.__name__] = module
+    try:
+        exec(
+            "from prefab_classes import prefab\n"
+            "@prefab\n"
+            "class A:\n"
+            "    x: int\n"
+            "@prefab\n"
+            "class B(A):\n"
+            "    y: int\n",
+            module.__dict__,
+        )
+        assert materialize(module) == 6
+        assert is_generated(module.A, "__init__")
+        assert is_generated(module.B, "__eq__")
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_materialize_invalid():
+    with pytest.raises(TypeError):
+        materialize(object)
+
+    with pytest.raises(TypeError):
+        materialize(42)
+
+
+def test_materialize_all(monkeypatch):
+    import gc
+
+    frozen = []
+    monkeypatch.setattr(gc, "freeze", lambda: frozen.append(True))
+
+    @prefab
+    class Lazy:
+        x: int
+
+    Dynamic = build_prefab("Dynamic", [("x", attribute())])
+
+    assert materialize_all() >= 6
+    assert frozen == [True]
+
+    assert is_generated(Lazy, "__init__")
+    assert is_generated(Dynamic, "__repr__")
+
+    materialize_all(freeze=False)
+    assert frozen == [True]
+
+
+def test_eager_prefab_init():
+    @prefab(init=False, eager=True)
+    class NoInit:
+        x: int = 1
+
+    assert is_generated(NoInit, "__prefab_init__")
+
+    inst = NoInit.__new__(NoInit)
+    inst.__prefab_init__(2)
+    assert inst.x == 2
@@ -0,0 +1,266 @@
+import copy
+import pickle
+
+import pytest
+
+from prefab_classes import prefab, attribute, PrefabError
+from prefab_classes.funcs import pool_stats, clear_pool, from_rows
+
+
+def test_pool():
+    @prefab(pool=2)
+    class Event:
+        id: int
+        tags: list = attribute(default_factory=list)
+
+    a = Event(1, ["a"])
+    b = Event(2)
+    assert pool_stats(Event)["misses"] == 2
+
+    Event.__prefab_release__(a)
+    Event.__prefab_release__(b)
+    assert not hasattr(a, "id")
+    assert pool_stats(Event)["available"] == 2
+
+    c = Event(3)
+    assert c is b
+    assert (c.id, c.tags) == (3, [])
+    assert Event(4) is a
+
+    assert pool_stats(Event) == {
+        "size": 2,
+        "available": 0,
+        "hits": 2,
+        "misses": 2,
+        "dropped": 0,
+        "hit_rate": 0.5,
+    }
+
+
+def test_pool_full():
+    @prefab(pool=1)
+    class Event:
+        id: int
+
+    a, b = Event(1), Event(2)
+    Event.__prefab_release__(a)
+    Event.__prefab_release__(b)
+    assert pool_stats(Event)["available"] == 1
+    assert pool_stats(Event)["dropped"] == 1
+
+    clear_pool(Event)
+    assert pool_stats(Event)["available"] == 0
+    assert pool_stats(Event)["dropped"] == 0
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_pool_frozen(slots):
+    @prefab(pool=4, frozen=True, slots=slots, cache_hash=True)
+    class Point:
+        x: int
+        y: int = 0
+
+    a = Point(1, 2)
+    hash(a)
+    Point.__prefab_release__(a)
+    assert not hasattr(a, "x")
+
+    b = Point(3)
+    assert b is a
+    assert (b.x, b.y) == (3, 0)
+    assert hash(b) == hash(Point(3))
+
+    with pytest.raises(TypeError):
+        b.x = 4
+
+
+def test_pool_signature():
+    @prefab(pool=2)
+    class Event:
+        id: int
+        name: str = attribute(default="", kw_only=True)
+
+    assert Event(1, name="a") == Event(id=1, name="a")
+    with pytest.raises(TypeError):
+        Event()
+    with pytest.raises(TypeError):
+        Event(1, "a")
+
+
+def test_pool_post_init():
+    @prefab(pool=2)
+    class Scaled:
+        value: int
+        scale: int = 2
+
+        def __prefab_post_init__(self, value, scale):
+            self.value = value * scale
+
+    first = Scaled(1)
+    Scaled.__prefab_release__(first)
+    assert Scaled(2).value == 4
+
+
+def test_pool_user_init():
+    @prefab(pool=2)
+    class UserInit:
+        x: int
+        y: int = 0
+
+        def __init__(self, value):
+            self.__prefab_init__(value, value)
+
+    inst = UserInit(1)
+    UserInit.__prefab_release__(inst)
+    assert UserInit(2) is inst
+    assert (inst.x, inst.y) == (2, 2)
+
+
+def test_pool_subclass():
+    @prefab(pool=2)
+    class Base:
+        x: int
+
+    @prefab
+    class Child(Base):
+        y: int
+
+    child = Child(1, 2)
+    assert (child.x, child.y) == (1, 2)
+
+    with pytest.raises(TypeError):
+        Base.__prefab_release__(child)
+
+    # Child has no pool of its own
+    Child.__prefab_release__(child)
+    assert child.y == 2
+    with pytest.raises(TypeError):
+        pool_stats(Child)
+
+
+def test_pool_funcs():
+    @prefab(pool=4)
+    class Row:
+        a: int
+        b: str = "b"
+
+    inst = Row(1)
+    Row.__prefab_release__(inst)
+
+    rows = from_rows(Row, [(2, "x"), (3, "y")])
+    assert rows[0] is inst
+    assert rows == [Row(2, "x"), Row(3, "y")]
+
+    assert copy.copy(rows[1]) == rows[1]
+    # The default pickle support would call __new__ without arguments
+    assert "__reduce__" in Row.__dict__
+
+
+def test_pool_errors():
+    with pytest.raises(PrefabError):
+
+        @prefab(pool=2, frozen=True, intern=True)
+        class Both:
+            x: int
+
+    with pytest.raises(PrefabError):
+
+        @prefab(pool=-1)
+        class Negative:
+            x: int
+
+    with pytest.raises(PrefabError):
+
+        @prefab(pool=2)
+        class UserNew:
+            x: int
+
+            def __new__(cls, x):
+                return object.__new__(cls)
+
+    with pytest.raises(TypeError):
+        pool_stats(object)
+
+
+def test_pool_plain_subclass():
+    @prefab(pool=2)
+    class Base:
+        x: int
+
+    class Plain(Base):
+        pass
+
+    # The generated __new__ is stored on the subclass when first used
+    inst = Plain(1)
+    assert "__new__" in Plain.__dict__
+
+    new = copy.copy(inst)
+    assert type(new) is Plain and new == inst and new is not inst
+
+    # Only Base keeps a pool so releasing a subclass instance does nothing
+    Plain.__prefab_release__(inst)
+    assert inst.x == 1
+    assert pool_stats(Base)["available"] == 0
+
+    # Pickle support creates instances without the pooling __new__
+    constructor, args, state = inst.__reduce__()
+    new = constructor(*args)
+    new.__dict__.update(state)
+    assert new == inst
+
+
+
+@prefab(pool=2)
+class PickledEvent:
+    id: int
+
+
+@prefab(pool=2, frozen=True, cache_hash=True)
+class FrozenEvent:
+    id: int
+
+
+@prefab(pool=2, slots=True)
+class SlottedEvent:
+    id: int
+
+
+@prefab(pool=2, frozen=True, slots=True)
+class FrozenSlottedEvent:
+    id: int
+
+
+@prefab(pool=2, compact_pickle=True)
+class CompactEvent:
+    id: int
+
+
+@pytest.mark.parametrize(
+    "cls", [PickledEvent, FrozenEvent, SlottedEvent, FrozenSlottedEvent]
+)
+def test_pool_pickle_state(cls):
+    # Pooling does not change the state kept by pickle and copy
+    inst = cls(1)
+    if cls.__hash__ is not None:
+        hash(inst)
+    has_dict = hasattr(inst, "__dict__")
+    if has_dict:
+        object.__setattr__(inst, "note", "keep")
+
+    copies = [copy.copy(inst), copy.deepcopy(inst)]
+    copies.extend(
+        pickle.loads(pickle.dumps(inst, protocol))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1)
+    )
+    for new in copies:
+        assert type(new) is cls
+        assert new == inst and new is not inst
+        if has_dict:
+            assert new.note == "keep"
+            assert "__prefab_hash__" not in new.__dict__
+
+
+def test_pool_compact_pickle():
+    inst = CompactEvent(1)
+    assert inst.__reduce__() == (CompactEvent.__prefab_from_values__, (1,))
+    assert pickle.loads(pickle.dumps(inst)) == inst
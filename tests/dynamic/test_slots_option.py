@@ -0,0 +1,144 @@
+import weakref
+
+import pytest
+
+from prefab_classes import prefab, attribute, build_prefab, PrefabError
+from prefab_classes._shared import HASH_CACHE_ATTRIBUTE
+
+
+def test_slots_from_annotations():
+    @prefab(slots=True)
+    class Slotted:
+        x: int
+        y: str = attribute(default="test", doc="y value")
+        z: list = attribute(default_factory=list)
+
+    assert Slotted.__slots__ == {"x": None, "y": "y value", "z": None}
+
+    inst = Slotted(1)
+    assert not hasattr(inst, "__dict__")
+    assert (inst.x, inst.y, inst.z) == (1, "test", [])
+    assert repr(inst).endswith("Slotted(x=1, y='test', z=[])")
+    assert inst == Slotted(1)
+
+    # Defaults are not left in the class namespace
+    assert isinstance(Slotted.__dict__["y"], type(Slotted.x))
+
+    with pytest.raises(AttributeError):
+        inst.w = 2
+
+
+def test_slots_plain_attributes():
+    @prefab(slots=True)
+    class Slotted:
+        x = attribute()
+        y = attribute(default=2)
+
+    inst = Slotted(1)
+    assert not hasattr(inst, "__dict__")
+    assert (inst.x, inst.y) == (1, 2)
+
+
+def test_build_prefab_slots():
+    Slotted = build_prefab(
+        "Slotted",
+        [("x", attribute()), ("y", attribute(default=2))],
+        slots=True,
+    )
+    inst = Slotted(1)
+    assert not hasattr(inst, "__dict__")
+    assert inst.y == 2
+
+
+def test_slots_inheritance():
+    @prefab(slots=True)
+    class Base:
+        x: int
+
+    @prefab(slots=True)
+    class Child(Base):
+        y: int
+
+    assert Child.__slots__ == {"y": None}
+
+    inst = Child(1, 2)
+    assert not hasattr(inst, "__dict__")
+    assert (inst.x, inst.y) == (1, 2)
+
+
+def test_slots_weakref():
+    @prefab(slots=True)
+    class NoWeakref:
+        x: int
+
+    @prefab(slots=True, weakref=True)
+    class Weakref:
+        x: int
+
+    with pytest.raises(TypeError):
+        weakref.ref(NoWeakref(1))
+
+    inst = Weakref(1)
+    assert weakref.ref(inst)() is inst
+
+
+def test_slots_frozen_cached_hash():
+    @prefab(slots=True, frozen=True, cache_hash=True)
+    class Frozen:
+        x: int
+        y: tuple = ()
+
+    inst = Frozen(1)
+    assert hash(inst) == hash((1, ()))
+    assert getattr(inst, HASH_CACHE_ATTRIBUTE) == hash((1, ()))
+
+    with pytest.raises(TypeError):
+        inst.x = 2
+
+
+def test_slots_super():
+    @prefab(slots=True)
+    class Base:
+        x: int
+
+        def describe(self):
+            return "base"
+
+    @prefab(slots=True)
+    class Child(Base):
+        y: int
+
+        def describe(self):
+            return f"child of {super().describe()}"
+
+        @property
+        def cls_name(self):
+            return __class__.__name__
+
+    inst = Child(1, 2)
+    assert inst.describe() == "child of base"
+    assert inst.cls_name == "Child"
+
+
+def test_slots_errors():
+    with pytest.raises(PrefabError):
+
+        @prefab(weakref=True)
+        class NoSlots:
+            x: int
+
+    with pytest.raises(PrefabError):
+
+        @prefab(slots=True)
+        class HasSlots:
+            __slots__ = ("x",)
+            x: int
+
+
+def test_slots_eager():
+    @prefab(slots=True, eager=True)
+    class Slotted:
+        x: int
+
+    assert "AutoGen" not in type(Slotted.__dict__["__init__"]).__name__
+    assert Slotted(1).x == 1
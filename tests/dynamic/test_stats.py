@@ -0,0 +1,107 @@
+import pytest
+
+import prefab_classes
+from prefab_classes import prefab, materialize
+
+
+@pytest.fixture
+def recorder():
+    recorder = prefab_classes.enable_stats()
+    try:
+        yield recorder
+    finally:
+        prefab_classes.disable_stats()
+
+
+def test_stats_disabled():
+    @prefab
+    class NotRecorded:
+        x: int
+
+    NotRecorded(1)
+    assert prefab_classes.stats() == {}
+
+
+def test_stats_phases(recorder):
+    @prefab(slots=True)
+    class Recorded:
+        x: int
+        y: int = 0
+
+    key = f"{__name__}.{Recorded.__qualname__}"
+    entry = prefab_classes.stats()[key]
+
+    assert list(entry["phases"]) == [
+        "checks",
+        "annotations",
+        "inheritance",
+        "validation",
+        "methods",
+        "slots",
+    ]
+    assert entry["decorate_time"] == pytest.approx(sum(entry["phases"].values()))
+    assert entry["exec_count"] == 0
+    assert entry["first_materialized"] is None
+
+    Recorded(1)
+    entry = prefab_classes.stats()[key]
+    assert entry["exec_count"] == 1
+    assert entry["methods"] == ["__init__"]
+    assert entry["source_size"] > 0
+    assert entry["exec_time"] > 0
+    assert entry["first_materialized"] >= 0
+
+    materialize(Recorded)
+    entry = prefab_classes.stats()[key]
+    assert entry["methods"] == ["__init__", "__repr__", "__eq__"]
+    assert entry["exec_count"] == 3
+
+
+def test_stats_hook(recorder):
+    events = []
+    prefab_classes.enable_stats(
+        hook=lambda event, cls, data: events.append((event, cls.__name__, data))
+    )
+
+    @prefab(eager=True)
+    class Eager:
+        x: int
+
+    assert [(event, name) for event, name, _ in events] == [
+        ("class", "Eager"),
+        ("exec", "Eager"),
+        ("exec", "Eager"),
+        ("exec", "Eager"),
+    ]
+    assert [data["method"] for _, _, data in events[1:]] == [
+        "__init__",
+        "__repr__",
+        "__eq__",
+    ]
+    assert "phases" in events[0][2]
+
+
+def test_stats_hook_uses_class(recorder):
+    import threading
+
+    reprs = []
+
+    def hook(event, cls, data):
+        # Generates __repr__ while handling the exec event for __init__
+        if event == "exec" and data["method"] == "__init__":
+            reprs.append(repr(cls.__repr__))
+
+    prefab_classes.enable_stats(hook=hook)
+
+    @prefab
+    class Hooked:
+        x: int
+
+    # Run in a thread so a deadlock fails the test instead of hanging it
+    thread = threading.Thread(target=Hooked, args=(1,), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert len(reprs) == 1
+    methods = prefab_classes.stats()[f"{__name__}.{Hooked.__qualname__}"]["methods"]
+    assert sorted(methods) == ["__init__", "__repr__"]
@@ -0,0 +1,64 @@
+import sys
+import threading
+from collections import Counter
+
+from prefab_classes import build_prefab, attribute
+from prefab_classes import _method_generators
+
+
+def test_exec_once_per_method(monkeypatch):
+    class_count = 2000
+    thread_count = 8
+
+    classes = [
+        build_prefab(
+            f"Threaded{i}",
+            [("x", attribute()), ("y", attribute(default=i))],
+            frozen=True,
+        )
+        for i in range(class_count)
+    ]
+
+    exec_counts = Counter()
+    count_lock = threading.Lock()
+
+    def counting_exec(code, globs, local_vars):
+        exec(code, globs, local_vars)
+        with count_lock:
+            exec_counts.update(local_vars.keys())
+
+    monkeypatch.setattr(_method_generators, "exec", counting_exec, raising=False)
+    # Switch threads as often as possible to make any race likely
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    barrier = threading.Barrier(thread_count)
+    errors = []
+
+    def worker():
+        try:
+            barrier.wait(timeout=10)
+            for cls in classes:
+                inst = cls(1)
+                assert inst == cls(1)
+                assert repr(inst).startswith(cls.__name__)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    # __init__, __repr__ and __eq__ are used for every class
+    # The frozen __init__ stores values without using __setattr__
+    for name in ("__init__", "__repr__", "__eq__"):
+        assert exec_counts[name] == class_count
+
+    for cls in classes:
+        assert cls.__dict__["__init__"].__qualname__ == f"{cls.__name__}.__init__"
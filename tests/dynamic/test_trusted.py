@@ -0,0 +1,83 @@
+import pytest
+
+from prefab_classes import prefab, attribute
+from prefab_classes.funcs import make_trusted
+
+
+def test_from_values():
+    @prefab(trusted=True)
+    class Trusted:
+        x: int
+        y: list = attribute(default_factory=list)
+        z: str = attribute(default="z", init=False)
+
+        def __prefab_post_init__(self):
+            raise AssertionError("post init should not be called")
+
+    inst = Trusted.__prefab_from_values__(1, None, "a")
+    assert (inst.x, inst.y, inst.z) == (1, None, "a")
+    assert type(inst) is Trusted
+
+    func = Trusted.__dict__["__prefab_from_values__"].__func__
+    assert func.__qualname__.endswith("Trusted.__prefab_from_values__")
+
+    assert make_trusted(Trusted) == Trusted.__prefab_from_values__
+
+
+def test_from_values_frozen():
+    @prefab(frozen=True, trusted=True)
+    class Frozen:
+        x: int
+        y: int = 2
+
+    inst = Frozen.__prefab_from_values__(1, 3)
+    assert inst == Frozen(1, 3)
+
+    with pytest.raises(TypeError):
+        inst.x = 2
+
+
+def test_from_values_slots():
+    @prefab(frozen=True, slots=True, trusted=True)
+    class Slotted:
+        x: int
+        y: int = 2
+
+    inst = Slotted.__prefab_from_values__(1, 3)
+    assert inst == Slotted(1, 3)
+    assert not hasattr(inst, "__dict__")
+
+    with pytest.raises(TypeError):
+        inst.x = 2
+
+
+def test_from_values_custom_setattr():
+    @prefab(trusted=True)
+    class Custom:
+        x: int
+
+        def __setattr__(self, name, value):
+            raise AttributeError("Not allowed")
+
+    assert Custom.__prefab_from_values__(1).x == 1
+
+
+def test_make_trusted():
+    @prefab
+    class Base:
+        x: int
+
+    @prefab(frozen=True)
+    class Child(Base):
+        y: int = attribute(default=0, init=False)
+
+    assert "__prefab_from_values__" not in Child.__dict__
+
+    make_child = make_trusted(Child)
+    inst = make_child(1, 2)
+    assert (inst.x, inst.y) == (1, 2)
+    assert type(inst) is Child
+    assert make_trusted(Child) is make_child
+
+    with pytest.raises(TypeError):
+        make_trusted(object)
@@ -64,3 +64,20 @@ class DundersExist:
 
     def __iter__(self):
         yield self.x
+
+
+@prefab(order=True)
+class OrderedCoordinate:
+    x: float
+    y: float
+    label: str = attribute(default="", compare=False)
+
+
+@prefab(order=True)
+class OrderedEmpty:
+    pass
+
+
+@prefab(order=True)
+class OrderedNoCompare:
+    label: str = attribute(default="", compare=False)
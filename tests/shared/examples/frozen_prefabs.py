@@ -6,3 +6,24 @@ class FrozenExample:
     x: int
     y: str = "Example Data"
     z: list = attribute(default_factory=list)
+
+
+@prefab(frozen=True, slots=True)
+class FrozenSlotted:
+    x: int
+    y: str = "Example Data"
+
+
+@prefab
+class FrozenChild(FrozenExample):
+    w: float = 1.0
+
+
+@prefab(frozen=True)
+class FrozenPostInit:
+    x: int
+    doubled: int = attribute(init=False)
+
+    def __prefab_post_init__(self, x):
+        self.x = x
+        self.doubled = x * 2
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from prefab_classes import prefab, attribute
+
+
+@prefab
+class Point:
+    x: int
+    y: int
+
+
+@prefab
+class Shape:
+    origin: Point
+    vertices: list[Point] = attribute(default_factory=list)
+    labels: dict[str, Point] = attribute(default_factory=dict)
+    centre: Point | None = None
+
+
+@prefab
+class Unresolved:
+    value: UndefinedType  # noqa: F821
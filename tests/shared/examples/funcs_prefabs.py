@@ -33,3 +33,52 @@ class Onion:
 class PicklePrefab:
     x = attribute(default=800)
     y = attribute(default=Path("Settings.json"))
+
+
+@prefab
+class Record:
+    id: int
+    name: str
+    notes: str = attribute(default="", compare=False)
+
+
+@prefab
+class Group:
+    name: str
+    members: list[Coordinate] = attribute(default_factory=list)
+    lookup: dict = attribute(default_factory=dict)
+    pair: tuple = ()
+
+
+@prefab
+class Registry:
+    default_group: Group
+    groups: list[Group] = attribute(default_factory=list)
+    by_name: dict[str, Coordinate] = attribute(default_factory=dict)
+    spare: Coordinate | None = None
+    version: int = attribute(default=1, kw_only=True)
+
+
+@prefab(frozen=True)
+class Measurement:
+    sensor: str
+    value: float
+    tags: list = attribute(default_factory=list)
+    unit: str = attribute(default="m", kw_only=True)
+    count: int = attribute(default=0, init=False)
+
+
+@prefab
+class Normalised:
+    name: str
+
+    def __prefab_post_init__(self, name):
+        self.name = name.lower()
+
+
+@prefab
+class Offset:
+    x: int
+
+    def __init__(self, x):
+        self.__prefab_init__(x + 100)
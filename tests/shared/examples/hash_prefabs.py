@@ -0,0 +1,35 @@
+from prefab_classes import prefab, attribute
+
+
+@prefab(hash=True)
+class HashCoordinate:
+    x: float
+    y: float
+
+
+@prefab(frozen=True, hash=True)
+class FrozenHash:
+    x: int
+    y: int = attribute(default=0, compare=False)
+
+
+@prefab(frozen=True, cache_hash=True)
+class CachedHash:
+    x: int
+    y: tuple = ()
+
+
+@prefab(hash=True)
+class ExplicitHash:
+    x: int
+
+    def __hash__(self):
+        return 42
+
+
+@prefab(hash=True)
+class EqDefinedHash:
+    x: int
+
+    def __eq__(self, other):
+        return True
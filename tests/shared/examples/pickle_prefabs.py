@@ -0,0 +1,59 @@
+from prefab_classes import prefab, attribute
+
+
+@prefab(compact_pickle=True)
+class CompactPoint:
+    x: int
+    y: int
+    tags: list = attribute(default_factory=list)
+
+
+@prefab
+class PlainPoint:
+    x: int
+    y: int
+    tags: list = attribute(default_factory=list)
+
+
+@prefab
+class CompactPoint3D(CompactPoint):
+    z: int = 0
+
+
+@prefab(compact_pickle=True, frozen=True, slots=True, cache_hash=True)
+class CompactFrozen:
+    name: str
+    value: float = 0.0
+
+    def __prefab_post_init__(self, name):
+        if not name:
+            raise ValueError("name must not be empty")
+        object.__setattr__(self, "name", name)
+
+
+@prefab(compact_pickle=True)
+class CustomReduce:
+    x: int
+
+    def __reduce__(self):
+        return CustomReduce, (-self.x,)
+
+
+@prefab(frozen=True, intern=True)
+class InternedUnit:
+    name: str
+    scale: float = 1.0
+
+
+@prefab(pool=2)
+class PooledPoint:
+    x: int
+    y: int = 0
+
+
+class PlainPooledPoint(PooledPoint):
+    pass
+
+
+class PlainInternedUnit(InternedUnit):
+    pass
@@ -43,3 +43,26 @@ class RegularReprOneArg:
 @prefab
 class RecursiveObject:
     x: "RecursiveObject | None" = None
+
+
+@prefab(repr="fast")
+class FastRepr:
+    x: str = "Hello"
+    y: str = "World"
+
+
+@prefab(repr="fast")
+class FastReprNoInit:
+    x: str = "Hello"
+    y: str = attribute(default="World", init=False)
+
+
+@prefab(repr="bounded")
+class BoundedRepr:
+    name: str = "Hello"
+    values: list = attribute(default_factory=list)
+
+
+@prefab(repr="bounded")
+class BoundedRecursive:
+    x: "BoundedRecursive | None" = None
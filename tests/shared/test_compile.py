@@ -0,0 +1,158 @@
+"""Tests for ahead of time compilation of prefab modules"""
+
+import ast
+import inspect
+import sys
+import types
+
+import pytest
+
+from prefab_classes import is_prefab
+from prefab_classes.compile import compile_module, main, _ClassCompiler
+
+
+example_modules = [
+    "creation",
+    "creation_empty",
+    "dunders",
+    "frozen_prefabs",
+    "funcs_prefabs",
+    "hash_prefabs",
+    "hint_syntax",
+    "inheritance",
+    "init_ex",
+    "kw_only",
+    "repr_func",
+]
+
+
+def load_compiled(module_name):
+    source = compile_module(module_name)
+    module = types.ModuleType(f"compiled_{module_name}")
+    exec(compile(source, module.__name__, "exec"), module.__dict__)
+    return source, module
+
+
+@pytest.mark.parametrize("module_name", example_modules)
+def test_compiled_matches_prefab(module_name):
+    import importlib
+
+    original = importlib.import_module(module_name)
+    source, compiled = load_compiled(module_name)
+
+    assert "@prefab" not in source
+    assert "attribute(" not in source
+
+    for name, cls in vars(original).items():
+        if not (isinstance(cls, type) and is_prefab(cls)):
+            continue
+        if cls.__module__ != module_name:
+            continue
+
+        compiled_cls = getattr(compiled, name)
+        assert is_prefab(compiled_cls)
+        assert "__prefab_internals__" not in compiled_cls.__dict__
+        assert compiled_cls.PREFAB_FIELDS == cls.PREFAB_FIELDS
+        assert getattr(compiled_cls, "__match_args__", None) == getattr(
+            cls, "__match_args__", None
+        )
+
+        original_sig = inspect.signature(cls.__init__)
+        compiled_sig = inspect.signature(compiled_cls.__init__)
+        assert [(p.name, p.kind) for p in original_sig.parameters.values()] == [
+            (p.name, p.kind) for p in compiled_sig.parameters.values()
+        ]
+
+
+def test_compiled_behaviour():
+    _, init_ex = load_compiled("init_ex")
+
+    x = init_ex.PrePostInitArguments(1, 2)
+    assert (x.x, x.y) == (2, 6)
+    assert repr(x) == "PrePostInitArguments(x=2, y=6)"
+    assert x == init_ex.PrePostInitArguments(1, 2)
+
+    with pytest.raises(ValueError):
+        init_ex.PrePostInitArguments(2, 1)
+
+    # Factories are called for each instance
+    a, b = init_ex.FactoryDefault(), init_ex.FactoryDefault()
+    assert a.x == [] and a.x is not b.x
+
+    # Defaults are evaluated once, as with the prefab
+    a, b = init_ex.MutableDefault(), init_ex.MutableDefault()
+    assert a.x is b.x
+
+    assert repr(init_ex.CoordinateFixedY(1)) == "<prefab CoordinateFixedY; x=1, y=2>"
+
+
+def test_compiled_inheritance():
+    _, inheritance = load_compiled("inheritance")
+
+    x = inheritance.Coordinate4D(1, 2, 3, 4)
+    assert (x.x, x.y, x.z, x.t) == (1, 2, 3, 4)
+    assert inheritance.GrandChild().field == 50
+
+
+def test_compiled_frozen():
+    _, frozen_prefabs = load_compiled("frozen_prefabs")
+
+    x = frozen_prefabs.FrozenExample(x=0)
+    assert x.z == []
+
+    with pytest.raises(TypeError):
+        x.x = 2
+
+    with pytest.raises(TypeError):
+        del x.y
+
+    x = frozen_prefabs.FrozenSlotted(1)
+    assert not hasattr(x, "__dict__")
+    assert x.y == "Example Data"
+
+    with pytest.raises(TypeError):
+        x.x = 2
+
+
+def test_compiled_slots():
+    source = inspect.cleandoc(
+        """
+        from prefab_classes import prefab, attribute, SlotAttributes
+
+
+        @prefab
+        class Slotted:
+            __slots__ = SlotAttributes(
+                x=attribute(type=int, doc="x value"),
+                y=attribute(default_factory=list),
+            )
+        """
+    )
+    module = types.ModuleType("slotted_compile_example")
+    sys.modules[module.__name__] = module
+    try:
+        exec(source, module.__dict__)
+        output = _ClassCompiler(module, ast.parse(source)).compile(
+            source.splitlines(keepends=True)
+        )
+    finally:
+        del sys.modules[module.__name__]
+
+    assert "from prefab_classes" not in output
+
+    compiled = {}
+    exec(output, compiled)
+    slotted = compiled["Slotted"]
+    assert slotted.__slots__ == {"x": "x value", "y": None}
+    assert slotted.__annotations__ == {"x": int}
+
+    inst = slotted(1)
+    assert inst.y == []
+    assert not hasattr(inst, "__dict__")
+
+
+def test_main_output_dir(tmp_path):
+    main(["--output-dir", str(tmp_path), "init_ex"])
+
+    output = tmp_path / "init_ex.py"
+    assert output.read_text() == compile_module("init_ex")
@@ -92,3 +92,46 @@ def test_dunders_not_overwritten():
     # __iter__
     for item in y:
         assert item is y.x
+
+
+def test_order():
+    from dunders import OrderedCoordinate
+
+    a = OrderedCoordinate(1, 2, label="z")
+    b = OrderedCoordinate(1, 3, label="a")
+
+    assert a < b
+    assert a <= b
+    assert b > a
+    assert b >= a
+    assert not a > b
+
+    # label is not used for comparison
+    assert a <= OrderedCoordinate(1, 2, label="a")
+    assert a >= OrderedCoordinate(1, 2, label="a")
+
+    assert sorted([b, a]) == [a, b]
+
+
+def test_order_no_compare_fields():
+    from dunders import OrderedEmpty, OrderedNoCompare
+
+    # With no fields to compare all instances are equal
+    assert not OrderedEmpty() < OrderedEmpty()
+    assert OrderedEmpty() <= OrderedEmpty()
+    assert not OrderedEmpty() > OrderedEmpty()
+    assert OrderedEmpty() >= OrderedEmpty()
+
+    assert not OrderedNoCompare("a") < OrderedNoCompare("b")
+    assert OrderedNoCompare("a") <= OrderedNoCompare("b")
+    assert not OrderedNoCompare("b") > OrderedNoCompare("a")
+    assert OrderedNoCompare("b") >= OrderedNoCompare("a")
+
+
+def test_order_other_class():
+    from dunders import OrderedCoordinate, Coordinate
+
+    with pytest.raises(TypeError):
+        OrderedCoordinate(1, 2) < Coordinate(1, 2)
+
+    assert OrderedCoordinate(1, 2).__lt__(Coordinate(1, 2)) is NotImplemented
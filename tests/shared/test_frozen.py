@@ -58,3 +58,33 @@ def test_delete_blocked():
     )
 
     assert x.x == 0
+
+
+def test_frozen_init_skips_setattr():
+    from frozen_prefabs import FrozenExample, FrozenSlotted, FrozenChild
+
+    for cls, kwargs in [
+        (FrozenExample, {"x": 1}),
+        (FrozenSlotted, {"x": 1}),
+        (FrozenChild, {"x": 1, "w": 2.0}),
+    ]:
+        setattr_method = cls.__dict__.get("__setattr__")
+        inst = cls(**kwargs)
+        assert inst.x == 1
+        # __setattr__ is not needed to construct the instance
+        assert cls.__dict__.get("__setattr__") is setattr_method
+
+        with pytest.raises(TypeError):
+            inst.x = 2
+
+    assert FrozenChild(x=1, w=2.0).w == 2.0
+
+
+def test_frozen_post_init():
+    from frozen_prefabs import FrozenPostInit
+
+    x = FrozenPostInit(2)
+    assert (x.x, x.doubled) == (2, 4)
+
+    with pytest.raises(TypeError):
+        x.doubled = 5
@@ -38,6 +38,161 @@ def test_as_dict():
     assert as_dict(x) == expected_dict
 
 
+def test_as_dicts():
+    from prefab_classes.funcs import as_dicts
+    from funcs_prefabs import Coordinate, Record  # noqa
+
+    items = [Coordinate(1, 2), Coordinate(3, 4), Record(1, "a"), Coordinate(5, 6)]
+    expected = [as_dict(item) for item in items]
+
+    assert as_dicts(items) == expected
+    assert as_dicts(iter(items)) == expected
+
+    lazy_result = as_dicts(items, lazy=True)
+    assert not isinstance(lazy_result, list)
+    assert list(lazy_result) == expected
+
+    assert as_dicts(items[:2], excludes=("y",)) == [{"x": 1}, {"x": 3}]
+
+    with raises(TypeError):
+        as_dicts([Coordinate(1, 2), object()])
+
+
+def test_as_tuples():
+    from prefab_classes.funcs import as_tuples
+    from funcs_prefabs import Coordinate, Record  # noqa
+
+    items = [Coordinate(1, 2), Record(1, "a", notes="n")]
+
+    assert as_tuples(items) == [(1, 2), (1, "a", "n")]
+    assert list(as_tuples(items, lazy=True)) == [(1, 2), (1, "a", "n")]
+
+    with raises(TypeError):
+        as_tuples([object()])
+
+
+def test_as_dicts_bounded():
+    from prefab_classes import prefab
+    from prefab_classes.funcs import as_dicts
+    from prefab_classes.funcs._cache_funcs import (
+        CONVERTER_CACHE_SIZE,
+        as_dict_dispatch,
+    )
+
+    def make_class():
+        @prefab
+        class Dynamic:
+            x: int
+
+        return Dynamic
+
+    items = [make_class()(i) for i in range(CONVERTER_CACHE_SIZE + 10)]
+    assert as_dicts(items) == [{"x": i} for i in range(len(items))]
+    assert len(as_dict_dispatch()) <= CONVERTER_CACHE_SIZE
+
+
+def test_as_dict_recurse_bounded():
+    from prefab_classes import prefab
+    from prefab_classes.funcs._cache_funcs import (
+        CONVERTER_CACHE_SIZE,
+        builtins_converter,
+    )
+
+    def make_class():
+        @prefab
+        class Dynamic:
+            x: int
+
+        return Dynamic
+
+    items = [make_class()(i) for i in range(CONVERTER_CACHE_SIZE + 10)]
+    convert = builtins_converter()
+    assert convert(items) == [{"x": i} for i in range(len(items))]
+
+    converters = convert.__closure__[
+        convert.__code__.co_freevars.index("converters")
+    ].cell_contents
+    assert len(converters) <= CONVERTER_CACHE_SIZE
+
+
+def test_from_rows():
+    from prefab_classes.funcs import from_rows
+    from funcs_prefabs import Coordinate, Measurement  # noqa
+
+    assert from_rows(Coordinate, [(1, 2), [3, 4]]) == [Coordinate(1, 2), Coordinate(3, 4)]
+
+    rows = [("a", 1.0, None, "cm"), ("b", 2.0, ["x"], "m")]
+    result = from_rows(Measurement, iter(rows))
+    assert result == [
+        Measurement("a", 1.0, unit="cm"),
+        Measurement("b", 2.0, ["x"]),
+    ]
+    assert result[0].count == 0
+
+    # Factories are called for each instance
+    assert result[0].tags is not from_rows(Measurement, rows)[0].tags
+
+    # Frozen instances are still frozen
+    with raises(TypeError):
+        result[0].value = 3.0
+
+    with raises(TypeError):
+        from_rows(object, [])
+
+
+def test_from_rows_post_init():
+    from prefab_classes.funcs import from_rows
+    from funcs_prefabs import Normalised  # noqa
+
+    assert from_rows(Normalised, [("ABC",)]) == [Normalised("abc")]
+
+
+def test_from_rows_user_init():
+    from prefab_classes.funcs import from_rows, from_columns
+    from funcs_prefabs import Offset  # noqa
+
+    # A user defined __init__ is called for each row
+    assert [o.x for o in from_rows(Offset, [(1,), (2,)])] == [101, 102]
+    assert [o.x for o in from_columns(Offset, {"x": [1, 2]})] == [101, 102]
+
+
+def test_from_rows_slots():
+    from prefab_classes import prefab, attribute
+    from prefab_classes.funcs import from_rows
+
+    @prefab(slots=True, frozen=True)
+    class Slotted:
+        x: int
+        y: list = attribute(default_factory=list)
+
+    result = from_rows(Slotted, [(1, None), (2, [2])])
+    assert result == [Slotted(1), Slotted(2, [2])]
+    assert not hasattr(result[0], "__dict__")
+
+
+def test_from_columns():
+    from prefab_classes.funcs import from_columns, to_columns
+    from funcs_prefabs import Coordinate, Measurement, Normalised  # noqa
+
+    coords = [Coordinate(1, 2), Coordinate(3, 4)]
+    assert from_columns(Coordinate, to_columns(coords)) == coords
+
+    result = from_columns(Measurement, {"sensor": ["a", "b"], "value": (1.0, 2.0)})
+    assert result == [Measurement("a", 1.0), Measurement("b", 2.0)]
+    assert result[0].tags is not result[1].tags
+
+    assert from_columns(Normalised, {"name": ["ABC"]}) == [Normalised("abc")]
+
+    with raises(TypeError):
+        from_columns(Measurement, {"sensor": ["a"]})
+
+    with raises(ValueError):
+        from_columns(Coordinate, {"x": [1, 2], "y": [1]})
+
+    with raises(ValueError):
+        from_columns(Coordinate, {})
+
+
 def test_to_json():
     import json
 
@@ -118,3 +273,301 @@ def test_picklable():
     pick_restore = pickle.loads(pick_dump)
 
     assert pick_restore == picktest
+
+
+def test_to_columns():
+    from array import array
+    from prefab_classes.funcs import to_columns
+    from funcs_prefabs import Circle, Coordinate, Record  # noqa
+
+    records = [Record(1, "a"), Record(2, "b", notes="n")]
+
+    columns = to_columns(records)
+    assert columns == {"id": array("q", [1, 2]), "name": ["a", "b"], "notes": ["", "n"]}
+    assert to_columns(iter(records), ("name",)) == {"name": ["a", "b"]}
+
+    # Values that don't fit the annotation give lists
+    huge = [Record(2**70, "a")]
+    assert to_columns(huge)["id"] == [2**70]
+
+    assert to_columns([Coordinate(1, 2)]) == {
+        "x": array("d", [1.0]),
+        "y": array("d", [2.0]),
+    }
+
+    # Unannotated fields give lists
+    assert to_columns([Circle()], ("radius",)) == {"radius": [1]}
+
+    assert to_columns([], ("id",), cls=Record) == {"id": array("q")}
+
+    with raises(ValueError):
+        to_columns([])
+
+    with raises(ValueError):
+        to_columns(records, ("missing",))
+
+    with raises(TypeError):
+        to_columns([object()])
+
+
+def test_to_columns_numpy():
+    import pytest
+
+    np = pytest.importorskip("numpy")
+
+    from prefab_classes.funcs import to_columns
+    from funcs_prefabs import Record  # noqa
+
+    result = to_columns([Record(1, "a"), Record(2, "b")], numpy=True)
+    assert result.dtype["id"] == np.dtype("i8")
+    assert result["id"].tolist() == [1, 2]
+    assert result["name"].tolist() == ["a", "b"]
+
+
+def test_sort_key():
+    from prefab_classes.funcs import sort_key
+    from funcs_prefabs import Record  # noqa
+
+    records = [Record(2, "b"), Record(1, "c"), Record(1, "a", notes="n")]
+
+    # Default key uses the compare fields
+    key = sort_key(Record)
+    assert key(records[2]) == (1, "a")
+    assert sorted(records, key=key) == [records[2], records[1], records[0]]
+
+    assert sort_key(Record, "name")(records[0]) == "b"
+    assert sort_key(Record, "notes", "id")(records[2]) == ("n", 1)
+
+    # Key functions are cached
+    assert sort_key(Record, "name") is sort_key(Record, "name")
+
+
+def test_sort_key_errors():
+    from prefab_classes.funcs import sort_key
+    from funcs_prefabs import Record  # noqa
+
+    with raises(TypeError):
+        sort_key(object)
+
+    with raises(ValueError):
+        sort_key(Record, "missing")
+
+
+def test_as_dict_recurse():
+    from funcs_prefabs import Circle, Coordinate, Group  # noqa
+
+    circ = Circle()
+    assert as_dict(circ) == {"radius": 1, "origin": Coordinate(0, 0)}
+    assert as_dict(circ, recurse=True) == {"radius": 1, "origin": {"x": 0, "y": 0}}
+
+    group = Group(
+        "group",
+        members=[Coordinate(1, 2), Coordinate(3, 4)],
+        lookup={"circle": circ, "values": [1, 2]},
+        pair=(Coordinate(5, 6), None),
+    )
+
+    assert as_dict(group, recurse=True) == {
+        "name": "group",
+        "members": [{"x": 1, "y": 2}, {"x": 3, "y": 4}],
+        "lookup": {
+            "circle": {"radius": 1, "origin": {"x": 0, "y": 0}},
+            "values": [1, 2],
+        },
+        "pair": ({"x": 5, "y": 6}, None),
+    }
+
+    # Excludes apply to all prefabs
+    assert as_dict(group, excludes=("y", "lookup"), recurse=True) == {
+        "name": "group",
+        "members": [{"x": 1}, {"x": 3}],
+        "pair": ({"x": 5}, None),
+    }
+
+
+def test_as_dict_recurse_other_objects():
+    from funcs_prefabs import SystemPath  # noqa
+
+    pth = SystemPath("testfile", "path/to/test")
+
+    # Non-prefab objects are not converted
+    assert as_dict(pth, recurse=True) == {
+        "filename": "testfile",
+        "path": PurePosixPath("path/to/test"),
+    }
+
+    with raises(TypeError):
+        as_dict(PurePosixPath("path"), recurse=True)
+
+
+def test_from_dict():
+    from prefab_classes.funcs import from_dict
+    from funcs_prefabs import Coordinate, Group, SystemPath  # noqa
+
+    assert from_dict(Coordinate, {"x": 1, "y": 2}) == Coordinate(1, 2)
+
+    # Defaults, factories and post_init are applied
+    assert from_dict(Group, {"name": "g"}) == Group("g")
+    assert from_dict(Group, {"name": "g"}).members is not Group("g").members
+    pth = from_dict(SystemPath, {"filename": "f", "path": "a/b", "extra": 1})
+    assert pth.path == PurePosixPath("a/b")
+
+    with raises(TypeError, match="missing required field 'y'"):
+        from_dict(Coordinate, {"x": 1})
+
+
+def test_from_dict_nested():
+    from prefab_classes.funcs import from_dict
+    from funcs_prefabs import Coordinate, Group, Registry  # noqa
+
+    registry = Registry(
+        Group("default", members=[Coordinate(0, 0)]),
+        groups=[Group("a"), Group("b", members=[Coordinate(1, 2)])],
+        by_name={"origin": Coordinate(0, 0)},
+        spare=Coordinate(3, 4),
+        version=2,
+    )
+    data = as_dict(registry, recurse=True)
+
+    assert from_dict(Registry, data) == registry
+
+    # Existing instances and None are left alone
+    data["spare"] = None
+    data["default_group"] = registry.default_group
+    result = from_dict(Registry, data)
+    assert result.spare is None
+    assert result.default_group is registry.default_group
+
+
+def test_from_dict_postponed_annotations():
+    from prefab_classes.funcs import from_dict
+    from funcs_postponed import Point, Shape, Unresolved  # noqa
+
+    shape = Shape(
+        Point(0, 0),
+        vertices=[Point(1, 2), Point(3, 4)],
+        labels={"top": Point(5, 6)},
+        centre=Point(7, 8),
+    )
+    assert from_dict(Shape, as_dict(shape, recurse=True)) == shape
+
+    with raises(TypeError, match="Could not resolve the type hints of Unresolved"):
+        from_dict(Unresolved, {"value": 1})
+
+
+def test_from_dict_init():
+    from prefab_classes.funcs import from_dict, from_rows
+    from dunders import DundersExist  # noqa
+    from funcs_prefabs import Offset  # noqa
+
+    with raises(TypeError):
+        from_dict(PurePosixPath, {})
+
+    # A user defined __init__ is called as with from_rows
+    x = from_dict(DundersExist, {"x": 1, "y": 2})
+    assert (x.x, x.y) == (2, 6)
+
+    assert from_dict(Offset, {"x": 1}) == Offset(1) == from_rows(Offset, [(1,)])[0]
+    assert Offset(1).x == 101
+
+
+def test_to_json_stream():
+    import io
+
+    from prefab_classes.funcs import to_json_stream
+    from funcs_prefabs import Circle, Coordinate  # noqa
+
+    data = [Circle(radius=i, origin=Coordinate(i, -i)) for i in range(100)]
+    expected = to_json(data)
+
+    out = io.StringIO()
+    to_json_stream(data, out)
+    assert out.getvalue() == expected
+
+    # Small chunks give the same result with more writes
+    writes = []
+
+    class Writer:
+        def write(self, chunk):
+            writes.append(chunk)
+
+    to_json_stream(data, Writer(), chunk_size=100)
+    assert "".join(writes) == expected
+    assert len(writes) > 1
+    assert all(len(w) < 200 for w in writes)
+
+    out = io.BytesIO()
+    to_json_stream(data, out, excludes=("y",), encoding="utf-8")
+    assert out.getvalue() == to_json(data, excludes=("y",)).encode("utf-8")
+
+
+def test_lazy_repr():
+    from prefab_classes.funcs import lazy_repr
+    from funcs_prefabs import Coordinate  # noqa
+
+    calls = []
+
+    class Tracked:
+        def __repr__(self):
+            calls.append(self)
+            return "Tracked()"
+
+    wrapped = lazy_repr(Tracked())
+    assert calls == []
+    assert str(wrapped) == repr(wrapped) == "Tracked()"
+    assert len(calls) == 2
+
+    assert f"{lazy_repr(Coordinate(1, 2))}" == "Coordinate(x=1, y=2)"
+
+
+def test_as_log_fields():
+    from prefab_classes.funcs import as_log_fields, lazy_repr
+    from funcs_prefabs import Coordinate, Group  # noqa
+
+    assert as_log_fields(Coordinate(1, 2)) == {"x": 1, "y": 2}
+    assert as_log_fields(lazy_repr(Coordinate(1, 2))) == {"x": 1, "y": 2}
+
+    # Not recursive
+    group = Group("g", [Coordinate(1, 2)])
+    assert as_log_fields(group)["members"] == [Coordinate(1, 2)]
+
+    with raises(TypeError):
+        as_log_fields(object())
+
+
+def test_log_filter():
+    import logging
+    from prefab_classes.funcs import make_log_filter, lazy_repr
+    from funcs_prefabs import Coordinate  # noqa
+
+    records = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    handler = ListHandler()
+    handler.addFilter(make_log_filter())
+    log_filter = make_log_filter(attribute="fields")
+
+    logger = logging.getLogger("prefab_classes.test_log_filter")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    try:
+        logger.debug("Skipped %s", lazy_repr(Coordinate(0, 0)))
+        logger.info("Moved %s to %s", Coordinate(1, 2), lazy_repr(Coordinate(3, 4)))
+        logger.info("Point %(point)s of %(count)d", {"point": Coordinate(5, 6), "count": 1})
+        logger.info("No arguments")
+    finally:
+        logger.removeHandler(handler)
+
+    assert len(records) == 3
+    moved, point, plain = records
+    assert moved.getMessage() == "Moved Coordinate(x=1, y=2) to Coordinate(x=3, y=4)"
+    assert moved.prefab_fields == [{"x": 1, "y": 2}, {"x": 3, "y": 4}]
+    assert point.prefab_fields == {"point": {"x": 5, "y": 6}}
+    assert plain.prefab_fields == []
+
+    assert log_filter.filter(moved)
+    assert moved.fields == moved.prefab_fields
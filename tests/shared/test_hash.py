@@ -0,0 +1,74 @@
+"""Tests for generated __hash__ methods"""
+import pickle
+
+import pytest
+
+from prefab_classes import prefab, attribute, SlotAttributes, PrefabError
+from prefab_classes._shared import HASH_CACHE_ATTRIBUTE
+
+
+def test_hash():
+    from hash_prefabs import HashCoordinate  # noqa
+
+    assert hash(HashCoordinate(1, 2)) == hash((1, 2))
+    assert len({HashCoordinate(1, 2), HashCoordinate(1, 2)}) == 1
+
+
+def test_hash_uses_compare_fields():
+    from hash_prefabs import FrozenHash  # noqa
+
+    assert hash(FrozenHash(1, 2)) == hash(FrozenHash(1, 3)) == hash((1,))
+    assert {FrozenHash(1, 2): "a"}[FrozenHash(1, 3)] == "a"
+
+
+def test_cached_hash():
+    from hash_prefabs import CachedHash  # noqa
+
+    x = CachedHash(1, (2, 3))
+    assert HASH_CACHE_ATTRIBUTE not in x.__dict__
+
+    assert hash(x) == hash((1, (2, 3)))
+    assert x.__dict__[HASH_CACHE_ATTRIBUTE] == hash((1, (2, 3)))
+
+    # The cached value is the one that is used
+    x.__dict__[HASH_CACHE_ATTRIBUTE] = 42
+    assert hash(x) == 42
+
+    # The cache does not affect equality, repr or the fields
+    assert x == CachedHash(1, (2, 3))
+    assert repr(x) == "CachedHash(x=1, y=(2, 3))"
+
+
+def test_cached_hash_not_pickled():
+    from hash_prefabs import CachedHash  # noqa
+
+    x = CachedHash(1)
+    x.__dict__[HASH_CACHE_ATTRIBUTE] = 42
+
+    y = pickle.loads(pickle.dumps(x))
+    assert y == x
+    assert HASH_CACHE_ATTRIBUTE not in y.__dict__
+    assert hash(y) == hash((1, ()))
+
+
+def test_explicit_hash_kept():
+    from hash_prefabs import ExplicitHash, EqDefinedHash  # noqa
+
+    assert hash(ExplicitHash(1)) == 42
+
+    # __hash__ = None set by python due to __eq__ is replaced
+    assert hash(EqDefinedHash(1)) == hash((1,))
+
+
+def test_cache_hash_errors():
+    with pytest.raises(PrefabError):
+
+        @prefab(cache_hash=True)
+        class NotFrozen:
+            x: int
+
+    with pytest.raises(PrefabError):
+
+        @prefab(frozen=True, cache_hash=True)
+        class Slotted:
+            __slots__ = SlotAttributes(x=attribute())
@@ -0,0 +1,93 @@
+"""Tests for compact pickling with a generated __reduce__"""
+import pickle
+
+import pytest
+
+from prefab_classes._shared import HASH_CACHE_ATTRIBUTE
+
+
+def test_compact_pickle():
+    from pickle_prefabs import CompactPoint  # noqa
+
+    point = CompactPoint(1, 2, ["a"])
+    assert point.__reduce__() == (CompactPoint.__prefab_from_values__, (1, 2, ["a"]))
+
+    restored = pickle.loads(pickle.dumps(point))
+    assert restored == point
+    assert type(restored) is CompactPoint
+
+
+def test_compact_pickle_smaller():
+    from pickle_prefabs import CompactPoint, PlainPoint  # noqa
+
+    compact = [CompactPoint(i, i) for i in range(100)]
+    plain = [PlainPoint(i, i) for i in range(100)]
+
+    assert pickle.loads(pickle.dumps(compact)) == compact
+    assert len(pickle.dumps(compact)) < len(pickle.dumps(plain))
+
+
+def test_compact_pickle_subclass():
+    from pickle_prefabs import CompactPoint3D  # noqa
+
+    point = CompactPoint3D(1, 2, z=3)
+    restored = pickle.loads(pickle.dumps(point))
+    assert type(restored) is CompactPoint3D
+    assert restored == point
+    assert restored.z == 3
+
+
+def test_compact_pickle_frozen_slots():
+    from pickle_prefabs import CompactFrozen  # noqa
+
+    item = CompactFrozen("a", 1.0)
+    hash(item)
+    assert hasattr(item, HASH_CACHE_ATTRIBUTE)
+
+    # post init is not run and the hash cache is not included
+    restored = pickle.loads(pickle.dumps(item))
+    assert restored == item
+    assert not hasattr(restored, HASH_CACHE_ATTRIBUTE)
+    assert hash(restored) == hash(item)
+
+    with pytest.raises(TypeError):
+        restored.value = 2.0
+
+
+def test_compact_pickle_custom_reduce():
+    from pickle_prefabs import CustomReduce  # noqa
+
+    assert pickle.loads(pickle.dumps(CustomReduce(1))) == CustomReduce(-1)
+
+
+def test_interned_pickle():
+    from pickle_prefabs import InternedUnit  # noqa
+
+    unit = InternedUnit("m")
+    restored = pickle.loads(pickle.dumps(unit))
+    assert restored == unit
+    assert type(restored) is InternedUnit
+
+
+def test_pooled_pickle():
+    from pickle_prefabs import PooledPoint  # noqa
+
+    point = PooledPoint(1, 2)
+    restored = pickle.loads(pickle.dumps(point))
+    assert restored == point
+    assert restored is not point
+
+
+def test_plain_subclass_pickle():
+    from pickle_prefabs import PlainPooledPoint, PlainInternedUnit  # noqa
+
+    point = PlainPooledPoint(1, 2)
+    restored = pickle.loads(pickle.dumps(point))
+    assert restored == point
+    assert type(restored) is PlainPooledPoint
+
+    # Pickled before any instance of the interned base class is created
+    unit = PlainInternedUnit("km", 1000.0)
+    restored = pickle.loads(pickle.dumps(unit))
+    assert restored == unit
+    assert type(restored) is PlainInternedUnit
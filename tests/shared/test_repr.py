@@ -47,3 +47,34 @@ def test_recursive():
     ex.x = ex
 
     assert repr(ex) == "RecursiveObject(x=...)"
+
+
+def test_fast_repr():
+    from repr_func import FastRepr, FastReprNoInit
+
+    assert repr(FastRepr()) == "FastRepr(x='Hello', y='World')"
+    assert repr(FastReprNoInit()) == "<prefab FastReprNoInit; x='Hello', y='World'>"
+    # No recursion guard is applied
+    assert not hasattr(FastRepr.__repr__, "__wrapped__")
+
+
+def test_bounded_repr():
+    from repr_func import BoundedRepr
+
+    assert repr(BoundedRepr()) == "BoundedRepr(name='Hello', values=[])"
+    assert repr(BoundedRepr("a", [1, 2])) == "BoundedRepr(name='a', values=[1, 2])"
+
+    ex = BoundedRepr("x" * 1000, list(range(1000)))
+    assert repr(ex) == (
+        f"BoundedRepr(name='{'x' * 37}...{'x' * 38}', "
+        f"values=[0, 1, 2, 3, 4, 5, ...])"
+    )
+
+
+def test_bounded_recursive():
+    from repr_func import BoundedRecursive
+
+    ex = BoundedRecursive()
+    ex.x = ex
+
+    assert repr(ex) == "BoundedRecursive(x=...)"